@@ -0,0 +1,53 @@
+"""
+Compare the JSON decoder backends on realistic response payloads.
+
+    python -m benchmarks.bench_decode
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import timeit
+
+from requests import Response
+
+from benchmarks import payloads
+from denvr import decoder
+
+
+def response(content: bytes) -> Response:
+    resp = Response()
+    resp._content = content
+    resp.encoding = "utf-8"
+    return resp
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int = 100):
+    cases = {
+        "get_servers (500 vms)": payloads.encoded(payloads.get_servers()),
+        "get_configurations (50)": payloads.encoded(payloads.get_configurations()),
+    }
+    backends = [b for b in decoder.BACKENDS if b == "json" or importlib.util.find_spec(b)]
+
+    for case, content in cases.items():
+        print(f"{case}: {len(content) / 1024:.0f} KiB")
+
+        # The previous path, `resp.json()` on a fresh response
+        baseline = measure(lambda content=content: response(content).json(), number)
+        print(f"  {'resp.json()':<12} {baseline * 1e3:8.3f} ms")
+
+        for name in backends:
+            decoder.use(name)
+            elapsed = measure(lambda content=content: decoder.decode(response(content)), number)
+            print(f"  {name:<12} {elapsed * 1e3:8.3f} ms  ({baseline / elapsed:.1f}x)")
+
+    decoder.use()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Measure the per-call cost of `Session.request` replaying a `get_servers` response from a
+`Cassette`, i.e., the SDK's own overhead without the network.
+
+    python -m benchmarks.bench_replay
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import payloads
+from denvr.cassette import Cassette, Player, lognormal
+from denvr.config import Config
+from denvr.session import Session
+
+PATH = "/api/v1/servers/virtual/GetServers"
+
+
+def cassette(count: int) -> Cassette:
+    result = Cassette()
+    key = f"GET {PATH}?Cluster=Hou1"
+    result.interactions[key] = [
+        {
+            "key": key,
+            "status": 200,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps(payloads.get_servers(count)),
+            "elapsed": 0.05,
+        }
+    ]
+    return result
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int = 200):
+    config = Config(defaults={"server": "http://denvr.invalid"}, auth=None)
+    for count in (1, 500):
+        session = Session(config, transport=Player(cassette(count)))
+        elapsed = measure(
+            lambda session=session: session.request("get", PATH, params={"Cluster": "Hou1"}),
+            number,
+        )
+        print(
+            f"get_servers ({count} vms)  {elapsed * 1e6:9.1f} us/call  ({1 / elapsed:8.0f} calls/s)"
+        )
+
+    # Production-shaped latency, to compare the throughput of concurrent callers
+    session = Session(config, transport=Player(cassette(1), latency=lognormal(0.01, seed=1)))
+    for threads in (1, 8):
+        with ThreadPoolExecutor(threads) as executor:
+            elapsed = measure(
+                lambda executor=executor: list(
+                    executor.map(
+                        lambda _: session.request("get", PATH, params={"Cluster": "Hou1"}),
+                        range(40),
+                    )
+                ),
+                1,
+            )
+        print(f"{threads} threads, ~10 ms latency  {40 / elapsed:8.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Compare the per-call overhead of building request arguments with the generated `RequestSpec`s
+against the previous `config.getkwarg` + `validate_kwargs` code, without any HTTP.
+
+    python -m benchmarks.bench_request_build
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from denvr.api.v1.servers import virtual
+from denvr.config import Config
+from denvr.validate import validate_kwargs
+
+
+class Stub:
+    # Stands in for `Session`, returning the request kwargs rather than sending them
+    def __init__(self, config):
+        self.config = config
+
+    def request(self, method, path, **kwargs):
+        return kwargs
+
+
+def get_server(session, id=None, namespace=None, cluster=None):
+    # The generated `Client.get_server` before `RequestSpec`
+    config = session.config
+    parameters: dict[str, dict] = {
+        "params": {
+            "Id": config.getkwarg("id", id),
+            "Namespace": config.getkwarg("namespace", namespace),
+            "Cluster": config.getkwarg("cluster", cluster),
+        }
+    }
+    kwargs = validate_kwargs(
+        "get", "/api/v1/servers/virtual/GetServer", parameters, {"Id", "Namespace", "Cluster"}
+    )
+    return session.request("get", "/api/v1/servers/virtual/GetServer", **kwargs)
+
+
+def create_server(
+    session,
+    name=None,
+    rpool=None,
+    vpc=None,
+    configuration=None,
+    cluster=None,
+    ssh_keys=None,
+    snapshot_name=None,
+    operating_system_image=None,
+    personal_storage_mount_path=None,
+    tenant_shared_additional_storage=None,
+    persist_storage=None,
+    direct_storage_mount_path=None,
+    root_disk_size=None,
+    selected_node=None,
+):
+    # The generated `Client.create_server` before `RequestSpec`
+    config = session.config
+    parameters: dict[str, dict] = {
+        "json": {
+            "name": config.getkwarg("name", name),
+            "rpool": config.getkwarg("rpool", rpool),
+            "vpc": config.getkwarg("vpc", vpc),
+            "configuration": config.getkwarg("configuration", configuration),
+            "cluster": config.getkwarg("cluster", cluster),
+            "ssh_keys": config.getkwarg("ssh_keys", ssh_keys),
+            "snapshotName": config.getkwarg("snapshot_name", snapshot_name),
+            "operatingSystemImage": config.getkwarg(
+                "operating_system_image", operating_system_image
+            ),
+            "personalStorageMountPath": config.getkwarg(
+                "personal_storage_mount_path", personal_storage_mount_path
+            ),
+            "tenantSharedAdditionalStorage": config.getkwarg(
+                "tenant_shared_additional_storage", tenant_shared_additional_storage
+            ),
+            "persistStorage": config.getkwarg("persist_storage", persist_storage),
+            "directStorageMountPath": config.getkwarg(
+                "direct_storage_mount_path", direct_storage_mount_path
+            ),
+            "rootDiskSize": config.getkwarg("root_disk_size", root_disk_size),
+            "selectedNode": config.getkwarg("selected_node", selected_node),
+        }
+    }
+    kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/virtual/CreateServer",
+        parameters,
+        {"cluster", "configuration", "ssh_keys", "vpc"},
+    )
+    return session.request("post", "/api/v1/servers/virtual/CreateServer", **kwargs)
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int = 100000):
+    session = Stub(Config(defaults={"cluster": "Hou1"}, auth=None))
+    client = virtual.Client(session)  # type: ignore[arg-type]
+    create = {
+        "name": "my-vm",
+        "rpool": "on-demand",
+        "vpc": "denvr",
+        "configuration": "A100_40GB_PCIe_1x",
+        "ssh_keys": ["ssh-ed25519 AAAA"],
+        "persist_storage": False,
+    }
+    cases = {
+        "get_server": (
+            lambda: get_server(session, id="vm-1", namespace="denvr"),
+            lambda: client.get_server(id="vm-1", namespace="denvr"),
+        ),
+        "create_server": (
+            lambda: create_server(session, **create),
+            lambda: client.create_server(**create),
+        ),
+    }
+
+    for name, (before, after) in cases.items():
+        assert before() == after()
+        baseline = measure(before, number)
+        elapsed = measure(after, number)
+        print(
+            f"{name:<14} validate_kwargs {baseline * 1e6:6.2f} us"
+            f"  RequestSpec {elapsed * 1e6:6.2f} us  ({baseline / elapsed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
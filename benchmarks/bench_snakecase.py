@@ -0,0 +1,53 @@
+"""
+Compare memoized snakecase key conversion and nested normalization with the previous,
+per-character implementation.
+
+    python -m benchmarks.bench_snakecase
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmarks import payloads
+from denvr.utils import normalize, snakecase
+
+# The uncached conversion, as it was before memoization
+uncached = snakecase.__wrapped__
+
+
+def recursive(content, convert=uncached):
+    # A naive recursive normalization using the uncached conversion
+    if isinstance(content, dict):
+        return {convert(k): recursive(v, convert) for k, v in content.items()}
+    if isinstance(content, list):
+        return [recursive(v, convert) for v in content]
+    return content
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int = 200):
+    server = payloads.server(0)
+    keys = list(server)
+    print(f"snakecase ({len(keys)} keys of a server)")
+    baseline = measure(lambda: [uncached(k) for k in keys], number * 10)
+    cached = measure(lambda: [snakecase(k) for k in keys], number * 10)
+    print(f"  {'uncached':<22} {baseline * 1e6:8.2f} us")
+    print(f"  {'memoized':<22} {cached * 1e6:8.2f} us  ({baseline / cached:.1f}x)")
+
+    content = payloads.get_servers()["result"]
+    print("normalize get_servers (500 vms)")
+    top = measure(lambda: {uncached(k): v for k, v in content.items()}, number)
+    print(f"  {'top level (previous)':<22} {top * 1e6:8.2f} us")
+    baseline = measure(lambda: recursive(content), number // 10)
+    nested = measure(lambda: normalize(content, nested=True), number // 10)
+    print(f"  {'nested, recursive':<22} {baseline * 1e3:8.3f} ms")
+    print(f"  {'nested, normalize':<22} {nested * 1e3:8.3f} ms  ({baseline / nested:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare decoding a whole `get_servers` response with streaming its items through `ItemParser`,
+feeding the body in the same chunks `Session.iter_items` reads.
+
+    python -m benchmarks.bench_stream
+"""
+
+from __future__ import annotations
+
+import time
+import timeit
+import tracemalloc
+
+from benchmarks import payloads
+from denvr.decoder import loads
+from denvr.session import STREAM_CHUNK_SIZE
+from denvr.stream import ItemParser
+from denvr.utils import normalize
+
+
+def chunks(content: bytes) -> list[bytes]:
+    return [
+        content[i : i + STREAM_CHUNK_SIZE] for i in range(0, len(content), STREAM_CHUNK_SIZE)
+    ]
+
+
+def full(body: list[bytes]):
+    # `Session.request`: buffer the body, decode it, then hand back every item
+    items = normalize(loads(b"".join(body))["result"])["items"]
+    yield from (normalize(item) for item in items)
+
+
+def streamed(body: list[bytes]):
+    parser = ItemParser()
+    for chunk in body:
+        yield from (normalize(item) for item in parser.feed(chunk))
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def first(func, number: int) -> float:
+    # Best time until the first item is available, in seconds
+    best = float("inf")
+    for _ in range(number):
+        start = time.perf_counter()
+        next(func())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def allocated(func) -> int:
+    # Peak bytes allocated while consuming one item at a time
+    tracemalloc.start()
+    for _ in func():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(number: int = 10):
+    for count in (500, 5000):
+        body = chunks(payloads.encoded(payloads.get_servers(count)))
+        cases = {
+            "full response": lambda body=body: full(body),
+            "iter_items": lambda body=body: streamed(body),
+        }
+
+        print(f"get_servers ({count} vms, {len(body)} chunks)")
+        for name, func in cases.items():
+            total = measure(lambda func=func: sum(1 for _ in func()), number)
+            print(
+                f"  {name:<14} first {first(func, number) * 1e3:7.3f} ms"
+                f"  all {total * 1e3:8.3f} ms  peak {allocated(func) / 1024:8.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare eager key normalization with lazy `ResponseView`s for a poller reading a couple of
+fields out of every VM record.
+
+    python -m benchmarks.bench_views
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+
+from benchmarks import payloads
+from denvr.utils import normalize
+from denvr.views import view
+
+
+def poll(result) -> list:
+    return [(vm["id"], vm["status"]) for vm in result["items"]]
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def allocated(func) -> int:
+    # Peak bytes allocated by a single call
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(number: int = 20):
+    for count in (500, 5000):
+        content = payloads.get_servers(count)["result"]
+        cases = {
+            "eager (top level)": lambda content=content: poll(normalize(content)),
+            "eager (nested)": lambda content=content: poll(normalize(content, nested=True)),
+            "lazy views": lambda content=content: poll(view(content)),
+        }
+
+        print(f"get_servers ({count} vms), reading id and status")
+        baseline = measure(cases["eager (nested)"], number)
+        for name, func in cases.items():
+            elapsed = measure(func, number)
+            print(
+                f"  {name:<18} {elapsed * 1e3:8.3f} ms  ({baseline / elapsed:.1f}x)"
+                f"  peak {allocated(func) / 1024:8.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Realistic API payloads for benchmarks, shaped like the camelCase responses Denvr's API sends.
+"""
+
+from __future__ import annotations
+
+import json
+
+
+def server(i: int) -> dict:
+    return {
+        "username": "alice@denvrdata.com",
+        "tenancyName": "denvr",
+        "rpool": "on-demand",
+        "directAttachedStoragePersisted": False,
+        "id": f"vm-2024093009357{i:03d}",
+        "namespace": "denvr",
+        "configuration": "A100_40GB_PCIe_1x",
+        "storage": 1700,
+        "gpuType": "nvidia.com/A100PCIE40GB",
+        "gpus": 1,
+        "vcpus": 14,
+        "memory": 112,
+        "ip": f"130.250.171.{i % 256}",
+        "privateIp": f"172.16.0.{i % 256}",
+        "image": "Ubuntu_22.04.4_LTS",
+        "cluster": "Hou1",
+        "nodeSelector": f"node{i % 32:02d}",
+        "status": "ONLINE",
+        "storageType": "ceph",
+        "rootDiskSize": "500 GiB",
+        "lastUpdated": "2024-09-30T09:35:76.17Z",
+    }
+
+
+def configuration(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"H100_80GB_SXM_{i}x",
+        "cluster": "Hou1",
+        "gpus": i,
+        "gpuType": "nvidia.com/H100SXM80GB",
+        "vcpus": 14 * i,
+        "memory": 112 * i,
+        "storage": 1700 * i,
+        "pricePerHour": 2.1 * i,
+        "rpool": "on-demand",
+        "directAttachedStorage": True,
+        "userFriendlyName": f"{i}x H100 SXM 80GB",
+        "type": "vm",
+    }
+
+
+def get_servers(count: int = 500) -> dict:
+    return {"result": {"items": [server(i) for i in range(count)]}}
+
+
+def get_configurations(count: int = 50) -> dict:
+    return {"result": {"items": [configuration(i) for i in range(count)]}}
+
+
+def encoded(payload: dict) -> bytes:
+    return json.dumps(payload).encode()
@@ -0,0 +1,418 @@
+"""
+Benchmark the SDK's hot paths offline against the in-process `FakeAPI` (or a cassette),
+comparing each result with a stored baseline so regressions are caught before a release.
+
+    python -m benchmarks.suite                     # Run everything and compare with the baseline
+    python -m benchmarks.suite session waiter      # Only benchmarks whose names contain these
+    python -m benchmarks.suite --save              # Record the results as the new baseline
+
+Exits non-zero when any benchmark is more than `--threshold` (default 25%) worse than its
+baseline. Baselines are machine specific, so re-record them (`--save`) on the machine
+running the comparison before relying on it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from requests import HTTPError, Request
+
+from benchmarks import payloads
+from benchmarks.bench_replay import cassette
+from benchmarks.bench_request_build import Stub
+from benchmarks.bench_request_build import get_server as get_server_kwargs
+from denvr import config as denvr_config
+from denvr.api.v1.servers import virtual
+from denvr.cassette import Player, build_response
+from denvr.client import client
+from denvr.config import Config
+from denvr.fake import FakeAPI
+from denvr.metrics import MetricsCollector
+from denvr.session import Session
+from denvr.utils import normalize, raise_for_status, snakecase
+from denvr.waiters import WaitGroup, Waiter
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+OFFLINE = {"server": "http://denvr.invalid", "retries": 0, "cluster": "Hou1"}
+
+CREATE: dict = {
+    "rpool": "on-demand",
+    "vpc": "denvr",
+    "configuration": "A100_40GB_PCIe_1x",
+    "ssh_keys": ["ssh-ed25519 AAAA"],
+}
+
+
+class Benchmark(NamedTuple):
+    name: str
+    func: Callable[[], float]
+    unit: str
+    higher: bool = False  # Whether bigger values are better (e.g., throughput)
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, unit: str = "us", higher: bool = False):
+    def decorator(func):
+        BENCHMARKS.append(Benchmark(name, func, unit, higher))
+        return func
+
+    return decorator
+
+
+def measure(func, number: int) -> float:
+    # Best of a few repeats, in seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def fake_session(count: int = 0) -> tuple[FakeAPI, Session]:
+    # A session talking to a fake API already holding `count` ONLINE servers
+    api = FakeAPI(provisioning=0)
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=api.transport())
+    for i in range(count):
+        virtual.Client(session).create_server(name=f"vm-{i}", **CREATE)
+    return api, session
+
+
+# Per-call latency
+
+
+@benchmark("session.request get_server")
+def session_request():
+    _, session = fake_session(1)
+    params = {"Id": "vm-0", "Namespace": "denvr", "Cluster": "Hou1"}
+    path = "/api/v1/servers/virtual/GetServer"
+    return measure(lambda: session.request("get", path, params=params), 2000) * 1e6
+
+
+@benchmark("session.request get_server (metrics)")
+def session_request_metrics():
+    _, session = fake_session(1)
+    session.instrument = MetricsCollector()
+    params = {"Id": "vm-0", "Namespace": "denvr", "Cluster": "Hou1"}
+    path = "/api/v1/servers/virtual/GetServer"
+    return measure(lambda: session.request("get", path, params=params), 2000) * 1e6
+
+
+@benchmark("session.request get_servers (500 vms)")
+def session_request_list():
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=Player(cassette(500)))
+    path = "/api/v1/servers/virtual/GetServers"
+    return measure(lambda: session.request("get", path, params={"Cluster": "Hou1"}), 20) * 1e6
+
+
+@benchmark("validate_kwargs get_server")
+def validate_kwargs():
+    stub = Stub(Config(defaults={"cluster": "Hou1"}, auth=None))
+    return measure(lambda: get_server_kwargs(stub, id="vm-1", namespace="denvr"), 20000) * 1e6
+
+
+@benchmark("RequestSpec.build get_server")
+def request_spec():
+    conf = Config(defaults={"cluster": "Hou1"}, auth=None)
+    build = virtual.GET_SERVER.build
+    return measure(lambda: build(conf, "vm-1", "denvr", None), 20000) * 1e6
+
+
+@benchmark("snakecase (cached)")
+def snakecase_cached():
+    keys = list(payloads.server(0))
+    return measure(lambda: [snakecase(k) for k in keys], 20000) * 1e6
+
+
+@benchmark("snakecase (uncached)")
+def snakecase_uncached():
+    keys = list(payloads.server(0))
+
+    def convert():
+        snakecase.cache_clear()
+        return [snakecase(k) for k in keys]
+
+    return measure(convert, 2000) * 1e6
+
+
+@benchmark("normalize get_servers (500 vms)")
+def normalize_list():
+    content = {"items": payloads.get_servers(500)["result"]["items"]}
+    return measure(lambda: normalize(content, nested=True), 20) * 1e6
+
+
+@benchmark("raise_for_status ok")
+def raise_for_status_ok():
+    resp = _response(200, b'{"result": {}}')
+    return measure(lambda: raise_for_status(resp), 20000) * 1e6
+
+
+@benchmark("raise_for_status error")
+def raise_for_status_error():
+    resp = _response(400, b'{"error": {"message": "Invalid cluster"}}')
+
+    def check():
+        try:
+            raise_for_status(resp)
+        except HTTPError:
+            pass
+
+    return measure(check, 2000) * 1e6
+
+
+@benchmark("Waiter poll get_server")
+def waiter_poll():
+    _, session = fake_session(1)
+    vms = virtual.Client(session)
+    resp = {"id": "vm-0", "namespace": "denvr", "cluster": "Hou1"}
+
+    def check(resp):
+        result = vms.get_server(id=resp["id"], namespace=resp["namespace"], cluster="Hou1")
+        return result["status"] == "ONLINE", result
+
+    wait = Waiter(lambda: resp, check)
+    return measure(lambda: wait.wait(resp, interval=0, timeout=1), 1000) * 1e6
+
+
+@benchmark("WaitGroup poll (100 vms)")
+def waitgroup_poll():
+    _, session = fake_session(100)
+    vms = virtual.Client(session)
+
+    def poll():
+        group = WaitGroup(vms)
+        for i in range(100):
+            group.add({"id": f"vm-{i}", "namespace": "denvr", "cluster": "Hou1"})
+        return group.poll()
+
+    return measure(poll, 50) * 1e6
+
+
+@benchmark("client() construction")
+def client_construction():
+    conf = Config(defaults=OFFLINE, auth=None)
+    return measure(lambda: client("servers/virtual", conf), 2000) * 1e6
+
+
+@benchmark("config() parsing")
+def config_parsing():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _config_file(tmp)
+        return measure(lambda: denvr_config.config(path), 2000) * 1e6
+
+
+@benchmark("config() parsing (uncached)")
+def config_parsing_uncached():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _config_file(tmp)
+
+        def parse():
+            denvr_config._parsed.clear()
+            return denvr_config.config(path)
+
+        return measure(parse, 500) * 1e6
+
+
+# Throughput and memory
+
+
+def _serve(urls):
+    # Runs in a child process, so the server doesn't compete with the callers for the GIL
+    api = FakeAPI(provisioning=0)
+    api.handle("POST", "/api/v1/servers/virtual/CreateServer", _create_body("vm-0"))
+    server = api.serve()
+    urls.put(server.url)
+    threading.Event().wait()
+
+
+def throughput(threads: int) -> float:
+    # Calls per second from `threads` callers sharing a session, over localhost HTTP
+    urls: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(urls,), daemon=True)
+    server.start()
+    try:
+        conf = Config(defaults={**OFFLINE, "server": urls.get(timeout=30)}, auth=None)
+        session = Session(conf)
+        vms = virtual.Client(session)
+        calls = 400
+
+        def run():
+            with ThreadPoolExecutor(threads) as executor:
+                list(
+                    executor.map(
+                        lambda _: vms.get_server(id="vm-0", namespace="denvr"), range(calls)
+                    )
+                )
+
+        elapsed = measure(run, 1)
+        session.close()
+    finally:
+        server.terminate()
+        server.join()
+    return calls / elapsed
+
+
+for _threads in (1, 4, 16):
+    benchmark(f"throughput {_threads} threads (localhost)", unit="calls/s", higher=True)(
+        lambda threads=_threads: throughput(threads)
+    )
+
+
+@benchmark("memory get_servers (500 vms)", unit="KiB")
+def memory_response():
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=Player(cassette(500)))
+    path = "/api/v1/servers/virtual/GetServers"
+    session.request("get", path, params={"Cluster": "Hou1"})  # Warm up caches
+
+    tracemalloc.start()
+    session.request("get", path, params={"Cluster": "Hou1"})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+# Cold start
+
+
+def _cold(code: str) -> float:
+    # Best wall time of a fresh interpreter running `code`, in seconds
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@benchmark("import denvr.client", unit="ms")
+def import_time():
+    # Less the interpreter's own startup
+    return (_cold("import denvr.client") - _cold("pass")) * 1e3
+
+
+@benchmark("first request (cold start)", unit="ms")
+def first_request():
+    code = (
+        "from benchmarks.suite import fake_session; "
+        "from denvr.api.v1.servers import virtual; "
+        "_, session = fake_session(1); "
+        "virtual.Client(session).get_server(id='vm-0', namespace='denvr')"
+    )
+    return (_cold(code) - _cold("pass")) * 1e3
+
+
+def _response(status: int, body: bytes):
+    request = Request("GET", "http://denvr.invalid/api/v1/clusters/GetAll").prepare()
+    return build_response(request, status, {"Content-Type": "application/json"}, body)
+
+
+def _create_body(name: str) -> bytes:
+    return json.dumps({"name": name, "cluster": "Hou1", **CREATE}).encode()
+
+
+def _config_file(directory: str) -> str:
+    path = os.path.join(directory, "config.toml")
+    with open(path, "w") as fobj:
+        fobj.write(
+            '[defaults]\nserver = "http://denvr.invalid"\ncluster = "Hou1"\nretries = 0\n\n'
+            '[credentials]\napikey = "benchmark"\n'
+        )
+    return path
+
+
+def run(patterns: list[str]) -> dict[str, dict]:
+    results = {}
+    for bench in BENCHMARKS:
+        if patterns and not any(p in bench.name for p in patterns):
+            continue
+        value = bench.func()
+        results[bench.name] = {
+            "value": round(value, 3),
+            "unit": bench.unit,
+            "higher": bench.higher,
+        }
+        print(f"  {bench.name:<40} {value:12.3f} {bench.unit}", file=sys.stderr)
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """
+    Print a comparison report, returning the names of benchmarks which regressed by more than
+    `threshold` (e.g., 0.25 for 25%).
+    """
+    regressions = []
+    print(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'unit':<8} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        current = result["value"]
+        if base is None or not base["value"]:
+            print(f"{name:<40} {'-':>12} {current:12.3f} {result['unit']:<8} {'new':>8}")
+            continue
+
+        change = current / base["value"] - 1
+        # Positive is worse, whichever way the benchmark is measured
+        worse = -change if result["higher"] else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSED"
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = "  improved"
+        print(
+            f"{name:<40} {base['value']:12.3f} {current:12.3f} {result['unit']:<8}"
+            f" {change:+8.0%}{flag}"
+        )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("patterns", nargs="*", help="Only run benchmarks containing these")
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline results file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown before failing"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.patterns)
+    if args.save:
+        stored = {}
+        if args.patterns and os.path.exists(args.baseline):
+            with open(args.baseline) as fobj:
+                stored = json.load(fobj)["results"]
+        meta = {"python": platform.python_version(), "machine": platform.machine()}
+        with open(args.baseline, "w") as fobj:
+            json.dump({"meta": meta, "results": {**stored, **results}}, fobj, indent=2)
+            fobj.write("\n")
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save to record one")
+        return 0
+
+    with open(args.baseline) as fobj:
+        baseline = json.load(fobj)
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
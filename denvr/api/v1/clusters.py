@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from denvr.validate import validate_kwargs
+from denvr.validate import RequestSpec
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator  # noqa: F401
 
 if TYPE_CHECKING:
-    from denvr.session import Session
+    from denvr.session import AsyncSession, Session
+
+
+def _get_all(config):
+    return {}
+
+
+GET_ALL = RequestSpec("get", "/api/v1/clusters/GetAll", _get_all)
 
 
 class Client:
@@ -20,10 +27,23 @@ class Client:
 
 
         """
-        config = self.session.config  # noqa: F841
+        kwargs = GET_ALL.build(self.session.config)
 
-        parameters: dict[str, dict] = {}
+        return self.session.request("get", "/api/v1/clusters/GetAll", **kwargs)
 
-        kwargs = validate_kwargs("get", "/api/v1/clusters/GetAll", parameters, {})
 
-        return self.session.request("get", "/api/v1/clusters/GetAll", **kwargs)
+class AsyncClient:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all(self) -> list:
+        """
+        Get a list of allocated clusters ::
+
+            await client.get_all()
+
+
+        """
+        kwargs = GET_ALL.build(self.session.config)
+
+        return await self.session.request("get", "/api/v1/clusters/GetAll", **kwargs)
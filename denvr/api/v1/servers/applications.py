@@ -1,11 +1,498 @@
 from __future__ import annotations
 
-from denvr.validate import validate_kwargs
+from denvr.validate import RequestSpec, missing
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator  # noqa: F401
 
 if TYPE_CHECKING:
-    from denvr.session import Session
+    from denvr.session import AsyncSession, Session
+
+
+def _get_applications(config):
+    return {}
+
+
+GET_APPLICATIONS = RequestSpec(
+    "get", "/api/v1/servers/applications/GetApplications", _get_applications
+)
+
+
+def _get_application_details(config, id, cluster):
+    params_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("params", "Id", "get", "/api/v1/servers/applications/GetApplicationDetails")
+    if id.__class__ is bool:
+        id = "true" if id else "false"
+    params_["Id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing(
+            "params", "Cluster", "get", "/api/v1/servers/applications/GetApplicationDetails"
+        )
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+GET_APPLICATION_DETAILS = RequestSpec(
+    "get",
+    "/api/v1/servers/applications/GetApplicationDetails",
+    _get_application_details,
+    params=(("Id", "id"), ("Cluster", "cluster")),
+    required=("Id", "Cluster"),
+)
+
+
+def _get_configurations(config):
+    return {}
+
+
+GET_CONFIGURATIONS = RequestSpec(
+    "get", "/api/v1/servers/applications/GetConfigurations", _get_configurations
+)
+
+
+def _get_availability(config, cluster, resource_pool):
+    params_: dict = {}
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("params", "cluster", "get", "/api/v1/servers/applications/GetAvailability")
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["cluster"] = cluster
+
+    if resource_pool is None:
+        resource_pool = getattr(config, "resource_pool", None)
+    if resource_pool is None:
+        missing("params", "resourcePool", "get", "/api/v1/servers/applications/GetAvailability")
+    if resource_pool.__class__ is bool:
+        resource_pool = "true" if resource_pool else "false"
+    params_["resourcePool"] = resource_pool
+
+    return {"params": params_}
+
+
+GET_AVAILABILITY = RequestSpec(
+    "get",
+    "/api/v1/servers/applications/GetAvailability",
+    _get_availability,
+    params=(("cluster", "cluster"), ("resourcePool", "resource_pool")),
+    required=("cluster", "resourcePool"),
+)
+
+
+def _get_application_catalog_items(config):
+    return {}
+
+
+GET_APPLICATION_CATALOG_ITEMS = RequestSpec(
+    "get",
+    "/api/v1/servers/applications/GetApplicationCatalogItems",
+    _get_application_catalog_items,
+)
+
+
+def _create_catalog_application(
+    config,
+    name,
+    cluster,
+    hardware_package_name,
+    application_catalog_item_name,
+    application_catalog_item_version,
+    resource_pool,
+    ssh_keys,
+    persist_direct_attached_storage,
+    personal_shared_storage,
+    tenant_shared_storage,
+    selected_node,
+    jupyter_token,
+    startup_commands,
+    environment_variables,
+    proxy_port,
+    proxy_api_keys,
+):
+    json_: dict = {}
+    if name is None:
+        name = getattr(config, "name", None)
+    if name is None:
+        missing("json", "name", "post", "/api/v1/servers/applications/CreateCatalogApplication")
+    json_["name"] = name
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing(
+            "json", "cluster", "post", "/api/v1/servers/applications/CreateCatalogApplication"
+        )
+    json_["cluster"] = cluster
+
+    if hardware_package_name is None:
+        hardware_package_name = getattr(config, "hardware_package_name", None)
+    if hardware_package_name is None:
+        missing(
+            "json",
+            "hardwarePackageName",
+            "post",
+            "/api/v1/servers/applications/CreateCatalogApplication",
+        )
+    json_["hardwarePackageName"] = hardware_package_name
+
+    if application_catalog_item_name is None:
+        application_catalog_item_name = getattr(config, "application_catalog_item_name", None)
+    if application_catalog_item_name is None:
+        missing(
+            "json",
+            "applicationCatalogItemName",
+            "post",
+            "/api/v1/servers/applications/CreateCatalogApplication",
+        )
+    json_["applicationCatalogItemName"] = application_catalog_item_name
+
+    if application_catalog_item_version is None:
+        application_catalog_item_version = getattr(
+            config, "application_catalog_item_version", None
+        )
+    if application_catalog_item_version is None:
+        missing(
+            "json",
+            "applicationCatalogItemVersion",
+            "post",
+            "/api/v1/servers/applications/CreateCatalogApplication",
+        )
+    json_["applicationCatalogItemVersion"] = application_catalog_item_version
+
+    if resource_pool is None:
+        resource_pool = getattr(config, "resource_pool", None)
+    if resource_pool is not None:
+        json_["resourcePool"] = resource_pool
+
+    if ssh_keys is None:
+        ssh_keys = getattr(config, "ssh_keys", None)
+    if ssh_keys is not None:
+        json_["sshKeys"] = ssh_keys
+
+    if persist_direct_attached_storage is None:
+        persist_direct_attached_storage = getattr(
+            config, "persist_direct_attached_storage", None
+        )
+    if persist_direct_attached_storage is not None:
+        json_["persistDirectAttachedStorage"] = persist_direct_attached_storage
+
+    if personal_shared_storage is None:
+        personal_shared_storage = getattr(config, "personal_shared_storage", None)
+    if personal_shared_storage is not None:
+        json_["personalSharedStorage"] = personal_shared_storage
+
+    if tenant_shared_storage is None:
+        tenant_shared_storage = getattr(config, "tenant_shared_storage", None)
+    if tenant_shared_storage is not None:
+        json_["tenantSharedStorage"] = tenant_shared_storage
+
+    if selected_node is None:
+        selected_node = getattr(config, "selected_node", None)
+    if selected_node is not None:
+        json_["selectedNode"] = selected_node
+
+    if jupyter_token is None:
+        jupyter_token = getattr(config, "jupyter_token", None)
+    if jupyter_token is not None:
+        json_["jupyterToken"] = jupyter_token
+
+    if startup_commands is None:
+        startup_commands = getattr(config, "startup_commands", None)
+    if startup_commands is not None:
+        json_["startupCommands"] = startup_commands
+
+    if environment_variables is None:
+        environment_variables = getattr(config, "environment_variables", None)
+    if environment_variables is not None:
+        json_["environmentVariables"] = environment_variables
+
+    if proxy_port is None:
+        proxy_port = getattr(config, "proxy_port", None)
+    if proxy_port is not None:
+        json_["proxyPort"] = proxy_port
+
+    if proxy_api_keys is None:
+        proxy_api_keys = getattr(config, "proxy_api_keys", None)
+    if proxy_api_keys is not None:
+        json_["proxyApiKeys"] = proxy_api_keys
+
+    return {"json": json_}
+
+
+CREATE_CATALOG_APPLICATION = RequestSpec(
+    "post",
+    "/api/v1/servers/applications/CreateCatalogApplication",
+    _create_catalog_application,
+    json=(
+        ("name", "name"),
+        ("cluster", "cluster"),
+        ("hardwarePackageName", "hardware_package_name"),
+        ("applicationCatalogItemName", "application_catalog_item_name"),
+        ("applicationCatalogItemVersion", "application_catalog_item_version"),
+        ("resourcePool", "resource_pool"),
+        ("sshKeys", "ssh_keys"),
+        ("persistDirectAttachedStorage", "persist_direct_attached_storage"),
+        ("personalSharedStorage", "personal_shared_storage"),
+        ("tenantSharedStorage", "tenant_shared_storage"),
+        ("selectedNode", "selected_node"),
+        ("jupyterToken", "jupyter_token"),
+        ("startupCommands", "startup_commands"),
+        ("environmentVariables", "environment_variables"),
+        ("proxyPort", "proxy_port"),
+        ("proxyApiKeys", "proxy_api_keys"),
+    ),
+    required=(
+        "applicationCatalogItemName",
+        "applicationCatalogItemVersion",
+        "cluster",
+        "hardwarePackageName",
+        "name",
+    ),
+)
+
+
+def _create_custom_application(
+    config,
+    name,
+    cluster,
+    hardware_package_name,
+    image_url,
+    image_cmd_override,
+    environment_variables,
+    image_repository,
+    resource_pool,
+    readiness_watcher_port,
+    proxy_port,
+    proxy_api_keys,
+    persist_direct_attached_storage,
+    personal_shared_storage,
+    tenant_shared_storage,
+    selected_node,
+    user_scripts,
+    security_context,
+):
+    json_: dict = {}
+    if name is None:
+        name = getattr(config, "name", None)
+    if name is None:
+        missing("json", "name", "post", "/api/v1/servers/applications/CreateCustomApplication")
+    json_["name"] = name
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing(
+            "json", "cluster", "post", "/api/v1/servers/applications/CreateCustomApplication"
+        )
+    json_["cluster"] = cluster
+
+    if hardware_package_name is None:
+        hardware_package_name = getattr(config, "hardware_package_name", None)
+    if hardware_package_name is None:
+        missing(
+            "json",
+            "hardwarePackageName",
+            "post",
+            "/api/v1/servers/applications/CreateCustomApplication",
+        )
+    json_["hardwarePackageName"] = hardware_package_name
+
+    if image_url is None:
+        image_url = getattr(config, "image_url", None)
+    if image_url is None:
+        missing(
+            "json", "imageUrl", "post", "/api/v1/servers/applications/CreateCustomApplication"
+        )
+    json_["imageUrl"] = image_url
+
+    if image_cmd_override is None:
+        image_cmd_override = getattr(config, "image_cmd_override", None)
+    if image_cmd_override is not None:
+        json_["imageCmdOverride"] = image_cmd_override
+
+    if environment_variables is None:
+        environment_variables = getattr(config, "environment_variables", None)
+    if environment_variables is not None:
+        json_["environmentVariables"] = environment_variables
+
+    if image_repository is None:
+        image_repository = getattr(config, "image_repository", None)
+    if image_repository is not None:
+        json_["imageRepository"] = image_repository
+
+    if resource_pool is None:
+        resource_pool = getattr(config, "resource_pool", None)
+    if resource_pool is not None:
+        json_["resourcePool"] = resource_pool
+
+    if readiness_watcher_port is None:
+        readiness_watcher_port = getattr(config, "readiness_watcher_port", None)
+    if readiness_watcher_port is not None:
+        json_["readinessWatcherPort"] = readiness_watcher_port
+
+    if proxy_port is None:
+        proxy_port = getattr(config, "proxy_port", None)
+    if proxy_port is not None:
+        json_["proxyPort"] = proxy_port
+
+    if proxy_api_keys is None:
+        proxy_api_keys = getattr(config, "proxy_api_keys", None)
+    if proxy_api_keys is not None:
+        json_["proxyApiKeys"] = proxy_api_keys
+
+    if persist_direct_attached_storage is None:
+        persist_direct_attached_storage = getattr(
+            config, "persist_direct_attached_storage", None
+        )
+    if persist_direct_attached_storage is not None:
+        json_["persistDirectAttachedStorage"] = persist_direct_attached_storage
+
+    if personal_shared_storage is None:
+        personal_shared_storage = getattr(config, "personal_shared_storage", None)
+    if personal_shared_storage is not None:
+        json_["personalSharedStorage"] = personal_shared_storage
+
+    if tenant_shared_storage is None:
+        tenant_shared_storage = getattr(config, "tenant_shared_storage", None)
+    if tenant_shared_storage is not None:
+        json_["tenantSharedStorage"] = tenant_shared_storage
+
+    if selected_node is None:
+        selected_node = getattr(config, "selected_node", None)
+    if selected_node is not None:
+        json_["selectedNode"] = selected_node
+
+    if user_scripts is None:
+        user_scripts = getattr(config, "user_scripts", None)
+    if user_scripts is not None:
+        json_["userScripts"] = user_scripts
+
+    if security_context is None:
+        security_context = getattr(config, "security_context", None)
+    if security_context is not None:
+        json_["securityContext"] = security_context
+
+    return {"json": json_}
+
+
+CREATE_CUSTOM_APPLICATION = RequestSpec(
+    "post",
+    "/api/v1/servers/applications/CreateCustomApplication",
+    _create_custom_application,
+    json=(
+        ("name", "name"),
+        ("cluster", "cluster"),
+        ("hardwarePackageName", "hardware_package_name"),
+        ("imageUrl", "image_url"),
+        ("imageCmdOverride", "image_cmd_override"),
+        ("environmentVariables", "environment_variables"),
+        ("imageRepository", "image_repository"),
+        ("resourcePool", "resource_pool"),
+        ("readinessWatcherPort", "readiness_watcher_port"),
+        ("proxyPort", "proxy_port"),
+        ("proxyApiKeys", "proxy_api_keys"),
+        ("persistDirectAttachedStorage", "persist_direct_attached_storage"),
+        ("personalSharedStorage", "personal_shared_storage"),
+        ("tenantSharedStorage", "tenant_shared_storage"),
+        ("selectedNode", "selected_node"),
+        ("userScripts", "user_scripts"),
+        ("securityContext", "security_context"),
+    ),
+    required=("cluster", "hardwarePackageName", "imageUrl", "name"),
+)
+
+
+def _start_application(config, id, cluster):
+    json_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/applications/StartApplication")
+    json_["id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/applications/StartApplication")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+START_APPLICATION = RequestSpec(
+    "post",
+    "/api/v1/servers/applications/StartApplication",
+    _start_application,
+    json=(("id", "id"), ("cluster", "cluster")),
+    required=("cluster", "id"),
+)
+
+
+def _stop_application(config, id, cluster):
+    json_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/applications/StopApplication")
+    json_["id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/applications/StopApplication")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+STOP_APPLICATION = RequestSpec(
+    "post",
+    "/api/v1/servers/applications/StopApplication",
+    _stop_application,
+    json=(("id", "id"), ("cluster", "cluster")),
+    required=("cluster", "id"),
+)
+
+
+def _destroy_application(config, id, cluster):
+    params_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("params", "Id", "delete", "/api/v1/servers/applications/DestroyApplication")
+    if id.__class__ is bool:
+        id = "true" if id else "false"
+    params_["Id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing(
+            "params", "Cluster", "delete", "/api/v1/servers/applications/DestroyApplication"
+        )
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+DESTROY_APPLICATION = RequestSpec(
+    "delete",
+    "/api/v1/servers/applications/DestroyApplication",
+    _destroy_application,
+    params=(("Id", "id"), ("Cluster", "cluster")),
+    required=("Id", "Cluster"),
+)
 
 
 class Client:
@@ -22,15 +509,26 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {}
+        kwargs = GET_APPLICATIONS.build(self.session.config)
 
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/applications/GetApplications", parameters, {}
+        return self.session.request(
+            "get", "/api/v1/servers/applications/GetApplications", **kwargs
         )
 
-        return self.session.request(
+    def iter_applications(self) -> Iterator[dict]:
+        """
+        Like `get_applications`, but streams the response yielding each of its `items` as they're received ::
+
+            for item in client.iter_applications():
+                ...
+
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_APPLICATIONS.build(self.session.config)
+
+        return self.session.iter_items(
             "get", "/api/v1/servers/applications/GetApplications", **kwargs
         )
 
@@ -51,21 +549,7 @@ class Client:
             application_catalog_item (dict):
             hardware_package (dict):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "params": {
-                "Id": config.getkwarg("id", id),
-                "Cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "get",
-            "/api/v1/servers/applications/GetApplicationDetails",
-            parameters,
-            {"Id", "Cluster"},
-        )
+        kwargs = GET_APPLICATION_DETAILS.build(self.session.config, id, cluster)
 
         return self.session.request(
             "get", "/api/v1/servers/applications/GetApplicationDetails", **kwargs
@@ -81,15 +565,26 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {}
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
 
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/applications/GetConfigurations", parameters, {}
+        return self.session.request(
+            "get", "/api/v1/servers/applications/GetConfigurations", **kwargs
         )
 
-        return self.session.request(
+    def iter_configurations(self) -> Iterator[dict]:
+        """
+        Like `get_configurations`, but streams the response yielding each of its `items` as they're received ::
+
+            for item in client.iter_configurations():
+                ...
+
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return self.session.iter_items(
             "get", "/api/v1/servers/applications/GetConfigurations", **kwargs
         )
 
@@ -108,21 +603,7 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "params": {
-                "cluster": config.getkwarg("cluster", cluster),
-                "resourcePool": config.getkwarg("resource_pool", resource_pool),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "get",
-            "/api/v1/servers/applications/GetAvailability",
-            parameters,
-            {"cluster", "resourcePool"},
-        )
+        kwargs = GET_AVAILABILITY.build(self.session.config, cluster, resource_pool)
 
         return self.session.request(
             "get", "/api/v1/servers/applications/GetAvailability", **kwargs
@@ -138,13 +619,7 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {}
-
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/applications/GetApplicationCatalogItems", parameters, {}
-        )
+        kwargs = GET_APPLICATION_CATALOG_ITEMS.build(self.session.config)
 
         return self.session.request(
             "get", "/api/v1/servers/applications/GetApplicationCatalogItems", **kwargs
@@ -230,54 +705,24 @@ class Client:
             personal_shared_storage (bool):
             tenant_shared_storage (bool):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "name": config.getkwarg("name", name),
-                "cluster": config.getkwarg("cluster", cluster),
-                "hardwarePackageName": config.getkwarg(
-                    "hardware_package_name", hardware_package_name
-                ),
-                "applicationCatalogItemName": config.getkwarg(
-                    "application_catalog_item_name", application_catalog_item_name
-                ),
-                "applicationCatalogItemVersion": config.getkwarg(
-                    "application_catalog_item_version", application_catalog_item_version
-                ),
-                "resourcePool": config.getkwarg("resource_pool", resource_pool),
-                "sshKeys": config.getkwarg("ssh_keys", ssh_keys),
-                "persistDirectAttachedStorage": config.getkwarg(
-                    "persist_direct_attached_storage", persist_direct_attached_storage
-                ),
-                "personalSharedStorage": config.getkwarg(
-                    "personal_shared_storage", personal_shared_storage
-                ),
-                "tenantSharedStorage": config.getkwarg(
-                    "tenant_shared_storage", tenant_shared_storage
-                ),
-                "selectedNode": config.getkwarg("selected_node", selected_node),
-                "jupyterToken": config.getkwarg("jupyter_token", jupyter_token),
-                "startupCommands": config.getkwarg("startup_commands", startup_commands),
-                "environmentVariables": config.getkwarg(
-                    "environment_variables", environment_variables
-                ),
-                "proxyPort": config.getkwarg("proxy_port", proxy_port),
-                "proxyApiKeys": config.getkwarg("proxy_api_keys", proxy_api_keys),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/applications/CreateCatalogApplication",
-            parameters,
-            {
-                "applicationCatalogItemName",
-                "applicationCatalogItemVersion",
-                "cluster",
-                "hardwarePackageName",
-                "name",
-            },
+        kwargs = CREATE_CATALOG_APPLICATION.build(
+            self.session.config,
+            name,
+            cluster,
+            hardware_package_name,
+            application_catalog_item_name,
+            application_catalog_item_version,
+            resource_pool,
+            ssh_keys,
+            persist_direct_attached_storage,
+            personal_shared_storage,
+            tenant_shared_storage,
+            selected_node,
+            jupyter_token,
+            startup_commands,
+            environment_variables,
+            proxy_port,
+            proxy_api_keys,
         )
 
         return self.session.request(
@@ -368,47 +813,25 @@ class Client:
             personal_shared_storage (bool):
             tenant_shared_storage (bool):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "name": config.getkwarg("name", name),
-                "cluster": config.getkwarg("cluster", cluster),
-                "hardwarePackageName": config.getkwarg(
-                    "hardware_package_name", hardware_package_name
-                ),
-                "imageUrl": config.getkwarg("image_url", image_url),
-                "imageCmdOverride": config.getkwarg("image_cmd_override", image_cmd_override),
-                "environmentVariables": config.getkwarg(
-                    "environment_variables", environment_variables
-                ),
-                "imageRepository": config.getkwarg("image_repository", image_repository),
-                "resourcePool": config.getkwarg("resource_pool", resource_pool),
-                "readinessWatcherPort": config.getkwarg(
-                    "readiness_watcher_port", readiness_watcher_port
-                ),
-                "proxyPort": config.getkwarg("proxy_port", proxy_port),
-                "proxyApiKeys": config.getkwarg("proxy_api_keys", proxy_api_keys),
-                "persistDirectAttachedStorage": config.getkwarg(
-                    "persist_direct_attached_storage", persist_direct_attached_storage
-                ),
-                "personalSharedStorage": config.getkwarg(
-                    "personal_shared_storage", personal_shared_storage
-                ),
-                "tenantSharedStorage": config.getkwarg(
-                    "tenant_shared_storage", tenant_shared_storage
-                ),
-                "selectedNode": config.getkwarg("selected_node", selected_node),
-                "userScripts": config.getkwarg("user_scripts", user_scripts),
-                "securityContext": config.getkwarg("security_context", security_context),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/applications/CreateCustomApplication",
-            parameters,
-            {"cluster", "hardwarePackageName", "imageUrl", "name"},
+        kwargs = CREATE_CUSTOM_APPLICATION.build(
+            self.session.config,
+            name,
+            cluster,
+            hardware_package_name,
+            image_url,
+            image_cmd_override,
+            environment_variables,
+            image_repository,
+            resource_pool,
+            readiness_watcher_port,
+            proxy_port,
+            proxy_api_keys,
+            persist_direct_attached_storage,
+            personal_shared_storage,
+            tenant_shared_storage,
+            selected_node,
+            user_scripts,
+            security_context,
         )
 
         return self.session.request(
@@ -429,21 +852,7 @@ class Client:
             id (str): The application name
             cluster (str): The cluster you're operating on
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "id": config.getkwarg("id", id),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/applications/StartApplication",
-            parameters,
-            {"cluster", "id"},
-        )
+        kwargs = START_APPLICATION.build(self.session.config, id, cluster)
 
         return self.session.request(
             "post", "/api/v1/servers/applications/StartApplication", **kwargs
@@ -463,21 +872,7 @@ class Client:
             id (str): The application name
             cluster (str): The cluster you're operating on
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "id": config.getkwarg("id", id),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/applications/StopApplication",
-            parameters,
-            {"cluster", "id"},
-        )
+        kwargs = STOP_APPLICATION.build(self.session.config, id, cluster)
 
         return self.session.request(
             "post", "/api/v1/servers/applications/StopApplication", **kwargs
@@ -497,22 +892,416 @@ class Client:
             id (str): The application name
             cluster (str): The cluster you're operating on
         """
-        config = self.session.config  # noqa: F841
+        kwargs = DESTROY_APPLICATION.build(self.session.config, id, cluster)
+
+        return self.session.request(
+            "delete", "/api/v1/servers/applications/DestroyApplication", **kwargs
+        )
+
+
+class AsyncClient:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_applications(self) -> dict:
+        """
+        Get a list of applications ::
 
-        parameters: dict[str, dict] = {
-            "params": {
-                "Id": config.getkwarg("id", id),
-                "Cluster": config.getkwarg("cluster", cluster),
-            }
-        }
+            await client.get_applications()
 
-        kwargs = validate_kwargs(
-            "delete",
-            "/api/v1/servers/applications/DestroyApplication",
-            parameters,
-            {"Id", "Cluster"},
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_APPLICATIONS.build(self.session.config)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/applications/GetApplications", **kwargs
         )
 
-        return self.session.request(
+    def iter_applications(self) -> AsyncIterator[dict]:
+        """
+        Like `get_applications`, but streams the response yielding each of its `items` as they're received ::
+
+            async for item in client.iter_applications():
+                ...
+
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_APPLICATIONS.build(self.session.config)
+
+        return self.session.iter_items(
+            "get", "/api/v1/servers/applications/GetApplications", **kwargs
+        )
+
+    async def get_application_details(
+        self, id: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Get detailed information about a specific application ::
+
+            await client.get_application_details(id="my-jupyter-application", cluster="Msc1")
+
+        Keyword Arguments:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            instance_details (dict):
+            application_catalog_item (dict):
+            hardware_package (dict):
+        """
+        kwargs = GET_APPLICATION_DETAILS.build(self.session.config, id, cluster)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/applications/GetApplicationDetails", **kwargs
+        )
+
+    async def get_configurations(self) -> dict:
+        """
+        Get a list of application configurations ::
+
+            await client.get_configurations()
+
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/applications/GetConfigurations", **kwargs
+        )
+
+    def iter_configurations(self) -> AsyncIterator[dict]:
+        """
+        Like `get_configurations`, but streams the response yielding each of its `items` as they're received ::
+
+            async for item in client.iter_configurations():
+                ...
+
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return self.session.iter_items(
+            "get", "/api/v1/servers/applications/GetConfigurations", **kwargs
+        )
+
+    async def get_availability(
+        self, cluster: str | None = None, resource_pool: str | None = None
+    ) -> dict:
+        """
+        Get detailed information on available configurations for applications ::
+
+            await client.get_availability(cluster="Msc1", resource_pool="on-demand")
+
+        Keyword Arguments:
+            cluster (str):
+            resource_pool (str):
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_AVAILABILITY.build(self.session.config, cluster, resource_pool)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/applications/GetAvailability", **kwargs
+        )
+
+    async def get_application_catalog_items(self) -> dict:
+        """
+        Get a list of application catalog items ::
+
+            await client.get_application_catalog_items()
+
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_APPLICATION_CATALOG_ITEMS.build(self.session.config)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/applications/GetApplicationCatalogItems", **kwargs
+        )
+
+    async def create_catalog_application(
+        self,
+        name: str | None = None,
+        cluster: str | None = None,
+        hardware_package_name: str | None = None,
+        application_catalog_item_name: str | None = None,
+        application_catalog_item_version: str | None = None,
+        resource_pool: str | None = None,
+        ssh_keys: list | None = None,
+        persist_direct_attached_storage: bool | None = None,
+        personal_shared_storage: bool | None = None,
+        tenant_shared_storage: bool | None = None,
+        selected_node: str | None = None,
+        jupyter_token: str | None = None,
+        startup_commands: list | None = None,
+        environment_variables: dict | None = None,
+        proxy_port: str | None = None,
+        proxy_api_keys: list | None = None,
+    ) -> dict:
+        """
+        Create a new application using a pre-defined configuration and application catalog item ::
+
+            await client.create_catalog_application(
+                name="my-jupyter-notebook",
+                cluster="Msc1",
+                hardware_package_name="g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+                application_catalog_item_name="jupyter-notebook",
+                application_catalog_item_version="python-3.11.9",
+                resource_pool="on-demand",
+                ssh_keys=["string"],
+                persist_direct_attached_storage=False,
+                personal_shared_storage=True,
+                tenant_shared_storage=True,
+                selected_node="yycdp-dev-k8sw03",
+                jupyter_token="abc123",
+                startup_commands=["pip install custom-package", "python setup.py"],
+                environment_variables={
+                    "HUGGING_FACE_HUB_TOKEN": "your-token-here",
+                    "CACHE_DIR": "/mnt/storage/.cache",
+                },
+                proxy_port="8000",
+                proxy_api_keys=["api-key-abc123", "api-key-def456"],
+            )
+
+        Keyword Arguments:
+            name (str): The application name
+            cluster (str): The cluster you're operating on
+            hardware_package_name (str): The name or unique identifier of the application hardware configuration to use for the application.
+            application_catalog_item_name (str): The name of the application catalog item.
+            application_catalog_item_version (str): The version name of the application catalog item.
+            resource_pool (str): The resource pool to use for the application
+            ssh_keys (list): The SSH keys for accessing the application
+            persist_direct_attached_storage (bool): Indicates whether to persist direct attached storage (if resource pool is reserved)
+            personal_shared_storage (bool): Enable personal shared storage for the application
+            tenant_shared_storage (bool): Enable tenant shared storage for the application
+            selected_node (str): Specific node name to target for application deployment. Used for non-on-demand resource pools...
+            jupyter_token (str): An authentication token for accessing Jupyter Notebook enabled applications
+            startup_commands (list): List of startup commands to be executed during container initialization. Commands are executed...
+            environment_variables (dict): Custom environment variables for the application. Key-value pairs that will be set in the...
+            proxy_port (str): The port number for the application proxy service. Required to setup the proxy Used in...
+            proxy_api_keys (list): Optional API keys for authenticating with the application proxy service. Multiple keys can be...
+
+        Returns:
+            id (str):
+            cluster (str):
+            status (str):
+            tenant (str):
+            created_by (str):
+            private_ip (str):
+            public_ip (str):
+            resource_pool (str):
+            dns (str):
+            ssh_username (str):
+            application_catalog_item_name (str):
+            application_catalog_item_version_name (str):
+            hardware_package_name (str):
+            persisted_direct_attached_storage (bool):
+            personal_shared_storage (bool):
+            tenant_shared_storage (bool):
+        """
+        kwargs = CREATE_CATALOG_APPLICATION.build(
+            self.session.config,
+            name,
+            cluster,
+            hardware_package_name,
+            application_catalog_item_name,
+            application_catalog_item_version,
+            resource_pool,
+            ssh_keys,
+            persist_direct_attached_storage,
+            personal_shared_storage,
+            tenant_shared_storage,
+            selected_node,
+            jupyter_token,
+            startup_commands,
+            environment_variables,
+            proxy_port,
+            proxy_api_keys,
+        )
+
+        return await self.session.request(
+            "post", "/api/v1/servers/applications/CreateCatalogApplication", **kwargs
+        )
+
+    async def create_custom_application(
+        self,
+        name: str | None = None,
+        cluster: str | None = None,
+        hardware_package_name: str | None = None,
+        image_url: str | None = None,
+        image_cmd_override: list | None = None,
+        environment_variables: dict | None = None,
+        image_repository: dict | None = None,
+        resource_pool: str | None = None,
+        readiness_watcher_port: int | None = None,
+        proxy_port: int | None = None,
+        proxy_api_keys: list | None = None,
+        persist_direct_attached_storage: bool | None = None,
+        personal_shared_storage: bool | None = None,
+        tenant_shared_storage: bool | None = None,
+        selected_node: str | None = None,
+        user_scripts: dict | None = None,
+        security_context: dict | None = None,
+    ) -> dict:
+        """
+        Create a new custom application using a pre-defined configuration and user-defined container image. ::
+
+            await client.create_custom_application(
+                name="my-custom-application",
+                cluster="Msc1",
+                hardware_package_name="g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+                image_url="docker.io/{namespace}/{repository}:{tag}",
+                image_cmd_override=["python", "train.py"],
+                environment_variables={},
+                image_repository={
+                    "hostname": "https://index.docker.io/v1/",
+                    "username": "your-docker-username",
+                    "password": "dckr_pat__xxx1234567890abcdef",
+                },
+                resource_pool="on-demand",
+                readiness_watcher_port=443,
+                proxy_port=8888,
+                proxy_api_keys=["key_user1", "key_user2"],
+                persist_direct_attached_storage=False,
+                personal_shared_storage=True,
+                tenant_shared_storage=True,
+                selected_node="yycdp-dev-k8sw03",
+                user_scripts={},
+                security_context={"runAsRoot": False},
+            )
+
+        Keyword Arguments:
+            name (str): The application name
+            cluster (str): The cluster you're operating on
+            hardware_package_name (str): The name or unique identifier of the application hardware configuration to use for the application.
+            image_url (str): Image URL for the custom application.
+            image_cmd_override (list): Optional Image CMD override allows users to specify a custom command to run in the container....
+            environment_variables (dict): Environment variables for the application. Names must start with a letter or underscore and...
+            image_repository (dict):
+            resource_pool (str): The resource pool to use for the application
+            readiness_watcher_port (int): The port used for monitoring application readiness and status. Common examples:  - 443...
+            proxy_port (int): The port your application uses to receive HTTPS traffic. When set, a reverse proxy will be...
+            proxy_api_keys (list): API keys for authenticating with the reverse proxy service. Optional, but requires proxyPort to...
+            persist_direct_attached_storage (bool): Indicates whether to persist direct attached storage (if resource pool is reserved)
+            personal_shared_storage (bool): Enable personal shared storage for the application
+            tenant_shared_storage (bool): Enable tenant shared storage for the application
+            selected_node (str): Specific node name to target for application deployment. Used for non-on-demand resource pools...
+            user_scripts (dict): Dictionary of script filenames to script content. Each scripts to be mounted at...
+            security_context (dict):
+
+        Returns:
+            id (str):
+            cluster (str):
+            status (str):
+            tenant (str):
+            created_by (str):
+            private_ip (str):
+            public_ip (str):
+            resource_pool (str):
+            dns (str):
+            ssh_username (str):
+            application_catalog_item_name (str):
+            application_catalog_item_version_name (str):
+            hardware_package_name (str):
+            persisted_direct_attached_storage (bool):
+            personal_shared_storage (bool):
+            tenant_shared_storage (bool):
+        """
+        kwargs = CREATE_CUSTOM_APPLICATION.build(
+            self.session.config,
+            name,
+            cluster,
+            hardware_package_name,
+            image_url,
+            image_cmd_override,
+            environment_variables,
+            image_repository,
+            resource_pool,
+            readiness_watcher_port,
+            proxy_port,
+            proxy_api_keys,
+            persist_direct_attached_storage,
+            personal_shared_storage,
+            tenant_shared_storage,
+            selected_node,
+            user_scripts,
+            security_context,
+        )
+
+        return await self.session.request(
+            "post", "/api/v1/servers/applications/CreateCustomApplication", **kwargs
+        )
+
+    async def start_application(
+        self, id: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Start an application that has been previously set up and provisioned, but is currently OFFLINE ::
+
+            await client.start_application(id="my-jupyter-application", cluster="Msc1")
+
+        Keyword Arguments:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+        """
+        kwargs = START_APPLICATION.build(self.session.config, id, cluster)
+
+        return await self.session.request(
+            "post", "/api/v1/servers/applications/StartApplication", **kwargs
+        )
+
+    async def stop_application(self, id: str | None = None, cluster: str | None = None) -> dict:
+        """
+        Stop an application that has been previously set up and provisioned, but is currently ONLINE ::
+
+            await client.stop_application(id="my-jupyter-application", cluster="Msc1")
+
+        Keyword Arguments:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+        """
+        kwargs = STOP_APPLICATION.build(self.session.config, id, cluster)
+
+        return await self.session.request(
+            "post", "/api/v1/servers/applications/StopApplication", **kwargs
+        )
+
+    async def destroy_application(
+        self, id: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Permanently delete a specified application, effectively wiping all its data and freeing up resources for other uses ::
+
+            await client.destroy_application(id="my-jupyter-application", cluster="Msc1")
+
+        Keyword Arguments:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The application name
+            cluster (str): The cluster you're operating on
+        """
+        kwargs = DESTROY_APPLICATION.build(self.session.config, id, cluster)
+
+        return await self.session.request(
             "delete", "/api/v1/servers/applications/DestroyApplication", **kwargs
         )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from denvr.validate import validate_kwargs
+from denvr.validate import RequestSpec
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator  # noqa: F401
 
 if TYPE_CHECKING:
-    from denvr.session import Session
+    from denvr.session import AsyncSession, Session
+
+
+def _get_operating_system_images(config):
+    return {}
+
+
+GET_OPERATING_SYSTEM_IMAGES = RequestSpec(
+    "get", "/api/v1/servers/images/GetOperatingSystemImages", _get_operating_system_images
+)
 
 
 class Client:
@@ -22,14 +31,29 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {}
+        kwargs = GET_OPERATING_SYSTEM_IMAGES.build(self.session.config)
 
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/images/GetOperatingSystemImages", parameters, {}
+        return self.session.request(
+            "get", "/api/v1/servers/images/GetOperatingSystemImages", **kwargs
         )
 
-        return self.session.request(
+
+class AsyncClient:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_operating_system_images(self) -> dict:
+        """
+        Get a list of operating sytem images available for the tenant ::
+
+            await client.get_operating_system_images()
+
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_OPERATING_SYSTEM_IMAGES.build(self.session.config)
+
+        return await self.session.request(
             "get", "/api/v1/servers/images/GetOperatingSystemImages", **kwargs
         )
@@ -1,11 +1,131 @@
 from __future__ import annotations
 
-from denvr.validate import validate_kwargs
+from denvr.validate import RequestSpec, missing
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator  # noqa: F401
 
 if TYPE_CHECKING:
-    from denvr.session import Session
+    from denvr.session import AsyncSession, Session
+
+
+def _get_host(config, id, cluster):
+    params_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("params", "Id", "get", "/api/v1/servers/metal/GetHost")
+    if id.__class__ is bool:
+        id = "true" if id else "false"
+    params_["Id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("params", "Cluster", "get", "/api/v1/servers/metal/GetHost")
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+GET_HOST = RequestSpec(
+    "get",
+    "/api/v1/servers/metal/GetHost",
+    _get_host,
+    params=(("Id", "id"), ("Cluster", "cluster")),
+    required=("Id", "Cluster"),
+)
+
+
+def _get_hosts(config, cluster):
+    params_: dict = {}
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is not None:
+        if cluster.__class__ is bool:
+            cluster = "true" if cluster else "false"
+        params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+GET_HOSTS = RequestSpec(
+    "get", "/api/v1/servers/metal/GetHosts", _get_hosts, params=(("Cluster", "cluster"),)
+)
+
+
+def _reboot_host(config, id, cluster):
+    json_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/metal/RebootHost")
+    json_["id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/metal/RebootHost")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+REBOOT_HOST = RequestSpec(
+    "post",
+    "/api/v1/servers/metal/RebootHost",
+    _reboot_host,
+    json=(("id", "id"), ("cluster", "cluster")),
+    required=("cluster", "id"),
+)
+
+
+def _reprovision_host(config, image_url, image_checksum, cloud_init_base64, id, cluster):
+    json_: dict = {}
+    if image_url is None:
+        image_url = getattr(config, "image_url", None)
+    if image_url is not None:
+        json_["imageUrl"] = image_url
+
+    if image_checksum is None:
+        image_checksum = getattr(config, "image_checksum", None)
+    if image_checksum is not None:
+        json_["imageChecksum"] = image_checksum
+
+    if cloud_init_base64 is None:
+        cloud_init_base64 = getattr(config, "cloud_init_base64", None)
+    if cloud_init_base64 is not None:
+        json_["cloudInitBase64"] = cloud_init_base64
+
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/metal/ReprovisionHost")
+    json_["id"] = id
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/metal/ReprovisionHost")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+REPROVISION_HOST = RequestSpec(
+    "post",
+    "/api/v1/servers/metal/ReprovisionHost",
+    _reprovision_host,
+    json=(
+        ("imageUrl", "image_url"),
+        ("imageChecksum", "image_checksum"),
+        ("cloudInitBase64", "cloud_init_base64"),
+        ("id", "id"),
+        ("cluster", "cluster"),
+    ),
+    required=("cluster", "id"),
+)
 
 
 class Client:
@@ -35,18 +155,7 @@ class Client:
             powered_on (bool): true if the host is powered on
             provisioning_state (str): provisioning status of the host
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "params": {
-                "Id": config.getkwarg("id", id),
-                "Cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/metal/GetHost", parameters, {"Id", "Cluster"}
-        )
+        kwargs = GET_HOST.build(self.session.config, id, cluster)
 
         return self.session.request("get", "/api/v1/servers/metal/GetHost", **kwargs)
 
@@ -62,15 +171,26 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
+        kwargs = GET_HOSTS.build(self.session.config, cluster)
+
+        return self.session.request("get", "/api/v1/servers/metal/GetHosts", **kwargs)
 
-        parameters: dict[str, dict] = {
-            "params": {"Cluster": config.getkwarg("cluster", cluster)}
-        }
+    def iter_hosts(self, cluster: str | None = None) -> Iterator[dict]:
+        """
+        Like `get_hosts`, but streams the response yielding each of its `items` as they're received ::
 
-        kwargs = validate_kwargs("get", "/api/v1/servers/metal/GetHosts", parameters, {})
+            for item in client.iter_hosts(cluster="Hou1"):
+                ...
 
-        return self.session.request("get", "/api/v1/servers/metal/GetHosts", **kwargs)
+        Keyword Arguments:
+            cluster (str):
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_HOSTS.build(self.session.config, cluster)
+
+        return self.session.iter_items("get", "/api/v1/servers/metal/GetHosts", **kwargs)
 
     def reboot_host(self, id: str | None = None, cluster: str | None = None) -> dict:
         """
@@ -95,18 +215,7 @@ class Client:
             powered_on (bool): true if the host is powered on
             provisioning_state (str): provisioning status of the host
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "id": config.getkwarg("id", id),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post", "/api/v1/servers/metal/RebootHost", parameters, {"cluster", "id"}
-        )
+        kwargs = REBOOT_HOST.build(self.session.config, id, cluster)
 
         return self.session.request("post", "/api/v1/servers/metal/RebootHost", **kwargs)
 
@@ -149,20 +258,147 @@ class Client:
             powered_on (bool): true if the host is powered on
             provisioning_state (str): provisioning status of the host
         """
-        config = self.session.config  # noqa: F841
+        kwargs = REPROVISION_HOST.build(
+            self.session.config, image_url, image_checksum, cloud_init_base64, id, cluster
+        )
+
+        return self.session.request("post", "/api/v1/servers/metal/ReprovisionHost", **kwargs)
+
+
+class AsyncClient:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_host(self, id: str | None = None, cluster: str | None = None) -> dict:
+        """
+        Get detailed information about a specific metal host ::
+
+            await client.get_host(id="Id", cluster="Hou1")
+
+        Keyword Arguments:
+            id (str): Unique identifier for a resource within the cluster
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The bare metal id, unique identifier
+            cluster (str): The cluster where the bare metal host is allocated
+            tenancy_name (str): Name of the tenant where the node has been allocated
+            node_type (str): The specific host node type
+            image (str): The image used to provision the host
+            private_ip (str): private IP address of the host
+            public_ip (str): public IP address of the host
+            provisioned_hostname (str): host name provisioned by the system
+            operational_status (str): operational status of the host
+            powered_on (bool): true if the host is powered on
+            provisioning_state (str): provisioning status of the host
+        """
+        kwargs = GET_HOST.build(self.session.config, id, cluster)
+
+        return await self.session.request("get", "/api/v1/servers/metal/GetHost", **kwargs)
+
+    async def get_hosts(self, cluster: str | None = None) -> dict:
+        """
+        Get a list of bare metal hosts in a cluster ::
+
+            await client.get_hosts(cluster="Hou1")
+
+        Keyword Arguments:
+            cluster (str):
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_HOSTS.build(self.session.config, cluster)
+
+        return await self.session.request("get", "/api/v1/servers/metal/GetHosts", **kwargs)
+
+    def iter_hosts(self, cluster: str | None = None) -> AsyncIterator[dict]:
+        """
+        Like `get_hosts`, but streams the response yielding each of its `items` as they're received ::
+
+            async for item in client.iter_hosts(cluster="Hou1"):
+                ...
+
+        Keyword Arguments:
+            cluster (str):
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_HOSTS.build(self.session.config, cluster)
+
+        return self.session.iter_items("get", "/api/v1/servers/metal/GetHosts", **kwargs)
+
+    async def reboot_host(self, id: str | None = None, cluster: str | None = None) -> dict:
+        """
+        Reboot the bare metal host ::
+
+            await client.reboot_host(id="string", cluster="Hou1")
+
+        Keyword Arguments:
+            id (str): Unique identifier for a resource within the cluster
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The bare metal id, unique identifier
+            cluster (str): The cluster where the bare metal host is allocated
+            tenancy_name (str): Name of the tenant where the node has been allocated
+            node_type (str): The specific host node type
+            image (str): The image used to provision the host
+            private_ip (str): private IP address of the host
+            public_ip (str): public IP address of the host
+            provisioned_hostname (str): host name provisioned by the system
+            operational_status (str): operational status of the host
+            powered_on (bool): true if the host is powered on
+            provisioning_state (str): provisioning status of the host
+        """
+        kwargs = REBOOT_HOST.build(self.session.config, id, cluster)
 
-        parameters: dict[str, dict] = {
-            "json": {
-                "imageUrl": config.getkwarg("image_url", image_url),
-                "imageChecksum": config.getkwarg("image_checksum", image_checksum),
-                "cloudInitBase64": config.getkwarg("cloud_init_base64", cloud_init_base64),
-                "id": config.getkwarg("id", id),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
+        return await self.session.request("post", "/api/v1/servers/metal/RebootHost", **kwargs)
 
-        kwargs = validate_kwargs(
-            "post", "/api/v1/servers/metal/ReprovisionHost", parameters, {"cluster", "id"}
+    async def reprovision_host(
+        self,
+        image_url: str | None = None,
+        image_checksum: str | None = None,
+        cloud_init_base64: str | None = None,
+        id: str | None = None,
+        cluster: str | None = None,
+    ) -> dict:
+        """
+        Reprovision the bare metal host ::
+
+            await client.reprovision_host(
+                image_url="https://cloud-images.ubuntu.com/jammy/current/jammy-server-cloudimg-amd64.img",
+                image_checksum="https://cloud-images.ubuntu.com/jammy/current/MD5SUMS",
+                cloud_init_base64="SGVsbG8sIFdvcmxkIQ==",
+                id="string",
+                cluster="Hou1",
+            )
+
+        Keyword Arguments:
+            image_url (str): The URL to the image to use for the host
+            image_checksum (str): The checksum url of the image to use for the host
+            cloud_init_base64 (str): Base64 encoded cloud-init data yaml file to use for the host
+            id (str): Unique identifier for a resource within the cluster
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str): The bare metal id, unique identifier
+            cluster (str): The cluster where the bare metal host is allocated
+            tenancy_name (str): Name of the tenant where the node has been allocated
+            node_type (str): The specific host node type
+            image (str): The image used to provision the host
+            private_ip (str): private IP address of the host
+            public_ip (str): public IP address of the host
+            provisioned_hostname (str): host name provisioned by the system
+            operational_status (str): operational status of the host
+            powered_on (bool): true if the host is powered on
+            provisioning_state (str): provisioning status of the host
+        """
+        kwargs = REPROVISION_HOST.build(
+            self.session.config, image_url, image_checksum, cloud_init_base64, id, cluster
         )
 
-        return self.session.request("post", "/api/v1/servers/metal/ReprovisionHost", **kwargs)
+        return await self.session.request(
+            "post", "/api/v1/servers/metal/ReprovisionHost", **kwargs
+        )
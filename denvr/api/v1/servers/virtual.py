@@ -1,11 +1,350 @@
 from __future__ import annotations
 
-from denvr.validate import validate_kwargs
+from denvr.validate import RequestSpec, missing
 
-from typing import TYPE_CHECKING, Any  # noqa: F401
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator  # noqa: F401
 
 if TYPE_CHECKING:
-    from denvr.session import Session
+    from denvr.session import AsyncSession, Session
+
+
+def _get_servers(config, cluster):
+    params_: dict = {}
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is not None:
+        if cluster.__class__ is bool:
+            cluster = "true" if cluster else "false"
+        params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+GET_SERVERS = RequestSpec(
+    "get", "/api/v1/servers/virtual/GetServers", _get_servers, params=(("Cluster", "cluster"),)
+)
+
+
+def _get_server(config, id, namespace, cluster):
+    params_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("params", "Id", "get", "/api/v1/servers/virtual/GetServer")
+    if id.__class__ is bool:
+        id = "true" if id else "false"
+    params_["Id"] = id
+
+    if namespace is None:
+        namespace = getattr(config, "namespace", None)
+    if namespace is None:
+        missing("params", "Namespace", "get", "/api/v1/servers/virtual/GetServer")
+    if namespace.__class__ is bool:
+        namespace = "true" if namespace else "false"
+    params_["Namespace"] = namespace
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("params", "Cluster", "get", "/api/v1/servers/virtual/GetServer")
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+GET_SERVER = RequestSpec(
+    "get",
+    "/api/v1/servers/virtual/GetServer",
+    _get_server,
+    params=(("Id", "id"), ("Namespace", "namespace"), ("Cluster", "cluster")),
+    required=("Id", "Namespace", "Cluster"),
+)
+
+
+def _create_server(
+    config,
+    name,
+    rpool,
+    vpc,
+    configuration,
+    cluster,
+    ssh_keys,
+    snapshot_name,
+    operating_system_image,
+    personal_storage_mount_path,
+    tenant_shared_additional_storage,
+    persist_storage,
+    direct_storage_mount_path,
+    root_disk_size,
+    selected_node,
+):
+    json_: dict = {}
+    if name is None:
+        name = getattr(config, "name", None)
+    if name is not None:
+        json_["name"] = name
+
+    if rpool is None:
+        rpool = getattr(config, "rpool", None)
+    if rpool is not None:
+        json_["rpool"] = rpool
+
+    if vpc is None:
+        vpc = getattr(config, "vpc", None)
+    if vpc is None:
+        missing("json", "vpc", "post", "/api/v1/servers/virtual/CreateServer")
+    json_["vpc"] = vpc
+
+    if configuration is None:
+        configuration = getattr(config, "configuration", None)
+    if configuration is None:
+        missing("json", "configuration", "post", "/api/v1/servers/virtual/CreateServer")
+    json_["configuration"] = configuration
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/virtual/CreateServer")
+    json_["cluster"] = cluster
+
+    if ssh_keys is None:
+        ssh_keys = getattr(config, "ssh_keys", None)
+    if ssh_keys is None:
+        missing("json", "ssh_keys", "post", "/api/v1/servers/virtual/CreateServer")
+    json_["ssh_keys"] = ssh_keys
+
+    if snapshot_name is None:
+        snapshot_name = getattr(config, "snapshot_name", None)
+    if snapshot_name is not None:
+        json_["snapshotName"] = snapshot_name
+
+    if operating_system_image is None:
+        operating_system_image = getattr(config, "operating_system_image", None)
+    if operating_system_image is not None:
+        json_["operatingSystemImage"] = operating_system_image
+
+    if personal_storage_mount_path is None:
+        personal_storage_mount_path = getattr(config, "personal_storage_mount_path", None)
+    if personal_storage_mount_path is not None:
+        json_["personalStorageMountPath"] = personal_storage_mount_path
+
+    if tenant_shared_additional_storage is None:
+        tenant_shared_additional_storage = getattr(
+            config, "tenant_shared_additional_storage", None
+        )
+    if tenant_shared_additional_storage is not None:
+        json_["tenantSharedAdditionalStorage"] = tenant_shared_additional_storage
+
+    if persist_storage is None:
+        persist_storage = getattr(config, "persist_storage", None)
+    if persist_storage is not None:
+        json_["persistStorage"] = persist_storage
+
+    if direct_storage_mount_path is None:
+        direct_storage_mount_path = getattr(config, "direct_storage_mount_path", None)
+    if direct_storage_mount_path is not None:
+        json_["directStorageMountPath"] = direct_storage_mount_path
+
+    if root_disk_size is None:
+        root_disk_size = getattr(config, "root_disk_size", None)
+    if root_disk_size is not None:
+        json_["rootDiskSize"] = root_disk_size
+
+    if selected_node is None:
+        selected_node = getattr(config, "selected_node", None)
+    if selected_node is not None:
+        json_["selectedNode"] = selected_node
+
+    return {"json": json_}
+
+
+CREATE_SERVER = RequestSpec(
+    "post",
+    "/api/v1/servers/virtual/CreateServer",
+    _create_server,
+    json=(
+        ("name", "name"),
+        ("rpool", "rpool"),
+        ("vpc", "vpc"),
+        ("configuration", "configuration"),
+        ("cluster", "cluster"),
+        ("ssh_keys", "ssh_keys"),
+        ("snapshotName", "snapshot_name"),
+        ("operatingSystemImage", "operating_system_image"),
+        ("personalStorageMountPath", "personal_storage_mount_path"),
+        ("tenantSharedAdditionalStorage", "tenant_shared_additional_storage"),
+        ("persistStorage", "persist_storage"),
+        ("directStorageMountPath", "direct_storage_mount_path"),
+        ("rootDiskSize", "root_disk_size"),
+        ("selectedNode", "selected_node"),
+    ),
+    required=("cluster", "configuration", "ssh_keys", "vpc"),
+)
+
+
+def _start_server(config, id, namespace, cluster):
+    json_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/virtual/StartServer")
+    json_["id"] = id
+
+    if namespace is None:
+        namespace = getattr(config, "namespace", None)
+    if namespace is None:
+        missing("json", "namespace", "post", "/api/v1/servers/virtual/StartServer")
+    json_["namespace"] = namespace
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/virtual/StartServer")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+START_SERVER = RequestSpec(
+    "post",
+    "/api/v1/servers/virtual/StartServer",
+    _start_server,
+    json=(("id", "id"), ("namespace", "namespace"), ("cluster", "cluster")),
+    required=("cluster", "id", "namespace"),
+)
+
+
+def _stop_server(config, id, namespace, cluster):
+    json_: dict = {}
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("json", "id", "post", "/api/v1/servers/virtual/StopServer")
+    json_["id"] = id
+
+    if namespace is None:
+        namespace = getattr(config, "namespace", None)
+    if namespace is None:
+        missing("json", "namespace", "post", "/api/v1/servers/virtual/StopServer")
+    json_["namespace"] = namespace
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("json", "cluster", "post", "/api/v1/servers/virtual/StopServer")
+    json_["cluster"] = cluster
+
+    return {"json": json_}
+
+
+STOP_SERVER = RequestSpec(
+    "post",
+    "/api/v1/servers/virtual/StopServer",
+    _stop_server,
+    json=(("id", "id"), ("namespace", "namespace"), ("cluster", "cluster")),
+    required=("cluster", "id", "namespace"),
+)
+
+
+def _destroy_server(config, delete_snapshots, id, namespace, cluster):
+    params_: dict = {}
+    if delete_snapshots is None:
+        delete_snapshots = getattr(config, "delete_snapshots", None)
+    if delete_snapshots is not None:
+        if delete_snapshots.__class__ is bool:
+            delete_snapshots = "true" if delete_snapshots else "false"
+        params_["DeleteSnapshots"] = delete_snapshots
+
+    if id is None:
+        id = getattr(config, "id", None)
+    if id is None:
+        missing("params", "Id", "delete", "/api/v1/servers/virtual/DestroyServer")
+    if id.__class__ is bool:
+        id = "true" if id else "false"
+    params_["Id"] = id
+
+    if namespace is None:
+        namespace = getattr(config, "namespace", None)
+    if namespace is None:
+        missing("params", "Namespace", "delete", "/api/v1/servers/virtual/DestroyServer")
+    if namespace.__class__ is bool:
+        namespace = "true" if namespace else "false"
+    params_["Namespace"] = namespace
+
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("params", "Cluster", "delete", "/api/v1/servers/virtual/DestroyServer")
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["Cluster"] = cluster
+
+    return {"params": params_}
+
+
+DESTROY_SERVER = RequestSpec(
+    "delete",
+    "/api/v1/servers/virtual/DestroyServer",
+    _destroy_server,
+    params=(
+        ("DeleteSnapshots", "delete_snapshots"),
+        ("Id", "id"),
+        ("Namespace", "namespace"),
+        ("Cluster", "cluster"),
+    ),
+    required=("Id", "Namespace", "Cluster"),
+)
+
+
+def _get_configurations(config):
+    return {}
+
+
+GET_CONFIGURATIONS = RequestSpec(
+    "get", "/api/v1/servers/virtual/GetConfigurations", _get_configurations
+)
+
+
+def _get_availability(config, cluster, resource_pool, report_nodes):
+    params_: dict = {}
+    if cluster is None:
+        cluster = getattr(config, "cluster", None)
+    if cluster is None:
+        missing("params", "cluster", "get", "/api/v1/servers/virtual/GetAvailability")
+    if cluster.__class__ is bool:
+        cluster = "true" if cluster else "false"
+    params_["cluster"] = cluster
+
+    if resource_pool is None:
+        resource_pool = getattr(config, "resource_pool", None)
+    if resource_pool is not None:
+        if resource_pool.__class__ is bool:
+            resource_pool = "true" if resource_pool else "false"
+        params_["resourcePool"] = resource_pool
+
+    if report_nodes is None:
+        report_nodes = getattr(config, "report_nodes", None)
+    if report_nodes is not None:
+        if report_nodes.__class__ is bool:
+            report_nodes = "true" if report_nodes else "false"
+        params_["reportNodes"] = report_nodes
+
+    return {"params": params_}
+
+
+GET_AVAILABILITY = RequestSpec(
+    "get",
+    "/api/v1/servers/virtual/GetAvailability",
+    _get_availability,
+    params=(
+        ("cluster", "cluster"),
+        ("resourcePool", "resource_pool"),
+        ("reportNodes", "report_nodes"),
+    ),
+    required=("cluster",),
+)
 
 
 class Client:
@@ -24,15 +363,26 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
+        kwargs = GET_SERVERS.build(self.session.config, cluster)
 
-        parameters: dict[str, dict] = {
-            "params": {"Cluster": config.getkwarg("cluster", cluster)}
-        }
+        return self.session.request("get", "/api/v1/servers/virtual/GetServers", **kwargs)
 
-        kwargs = validate_kwargs("get", "/api/v1/servers/virtual/GetServers", parameters, {})
+    def iter_servers(self, cluster: str | None = None) -> Iterator[dict]:
+        """
+        Like `get_servers`, but streams the response yielding each of its `items` as they're received ::
 
-        return self.session.request("get", "/api/v1/servers/virtual/GetServers", **kwargs)
+            for item in client.iter_servers(cluster="Cluster"):
+                ...
+
+        Keyword Arguments:
+            cluster (str):
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_SERVERS.build(self.session.config, cluster)
+
+        return self.session.iter_items("get", "/api/v1/servers/virtual/GetServers", **kwargs)
 
     def get_server(
         self, id: str | None = None, namespace: str | None = None, cluster: str | None = None
@@ -70,22 +420,7 @@ class Client:
             root_disk_size (str):
             last_updated (str):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "params": {
-                "Id": config.getkwarg("id", id),
-                "Namespace": config.getkwarg("namespace", namespace),
-                "Cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "get",
-            "/api/v1/servers/virtual/GetServer",
-            parameters,
-            {"Id", "Namespace", "Cluster"},
-        )
+        kwargs = GET_SERVER.build(self.session.config, id, namespace, cluster)
 
         return self.session.request("get", "/api/v1/servers/virtual/GetServer", **kwargs)
 
@@ -165,40 +500,22 @@ class Client:
             root_disk_size (str):
             last_updated (str):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "name": config.getkwarg("name", name),
-                "rpool": config.getkwarg("rpool", rpool),
-                "vpc": config.getkwarg("vpc", vpc),
-                "configuration": config.getkwarg("configuration", configuration),
-                "cluster": config.getkwarg("cluster", cluster),
-                "ssh_keys": config.getkwarg("ssh_keys", ssh_keys),
-                "snapshotName": config.getkwarg("snapshot_name", snapshot_name),
-                "operatingSystemImage": config.getkwarg(
-                    "operating_system_image", operating_system_image
-                ),
-                "personalStorageMountPath": config.getkwarg(
-                    "personal_storage_mount_path", personal_storage_mount_path
-                ),
-                "tenantSharedAdditionalStorage": config.getkwarg(
-                    "tenant_shared_additional_storage", tenant_shared_additional_storage
-                ),
-                "persistStorage": config.getkwarg("persist_storage", persist_storage),
-                "directStorageMountPath": config.getkwarg(
-                    "direct_storage_mount_path", direct_storage_mount_path
-                ),
-                "rootDiskSize": config.getkwarg("root_disk_size", root_disk_size),
-                "selectedNode": config.getkwarg("selected_node", selected_node),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/virtual/CreateServer",
-            parameters,
-            {"cluster", "configuration", "ssh_keys", "vpc"},
+        kwargs = CREATE_SERVER.build(
+            self.session.config,
+            name,
+            rpool,
+            vpc,
+            configuration,
+            cluster,
+            ssh_keys,
+            snapshot_name,
+            operating_system_image,
+            personal_storage_mount_path,
+            tenant_shared_additional_storage,
+            persist_storage,
+            direct_storage_mount_path,
+            root_disk_size,
+            selected_node,
         )
 
         return self.session.request("post", "/api/v1/servers/virtual/CreateServer", **kwargs)
@@ -221,22 +538,7 @@ class Client:
             cluster (str):
             status (str):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "id": config.getkwarg("id", id),
-                "namespace": config.getkwarg("namespace", namespace),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/virtual/StartServer",
-            parameters,
-            {"cluster", "id", "namespace"},
-        )
+        kwargs = START_SERVER.build(self.session.config, id, namespace, cluster)
 
         return self.session.request("post", "/api/v1/servers/virtual/StartServer", **kwargs)
 
@@ -258,22 +560,7 @@ class Client:
             cluster (str):
             status (str):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "json": {
-                "id": config.getkwarg("id", id),
-                "namespace": config.getkwarg("namespace", namespace),
-                "cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "post",
-            "/api/v1/servers/virtual/StopServer",
-            parameters,
-            {"cluster", "id", "namespace"},
-        )
+        kwargs = STOP_SERVER.build(self.session.config, id, namespace, cluster)
 
         return self.session.request("post", "/api/v1/servers/virtual/StopServer", **kwargs)
 
@@ -302,22 +589,8 @@ class Client:
             cluster (str):
             status (str):
         """
-        config = self.session.config  # noqa: F841
-
-        parameters: dict[str, dict] = {
-            "params": {
-                "DeleteSnapshots": config.getkwarg("delete_snapshots", delete_snapshots),
-                "Id": config.getkwarg("id", id),
-                "Namespace": config.getkwarg("namespace", namespace),
-                "Cluster": config.getkwarg("cluster", cluster),
-            }
-        }
-
-        kwargs = validate_kwargs(
-            "delete",
-            "/api/v1/servers/virtual/DestroyServer",
-            parameters,
-            {"Id", "Namespace", "Cluster"},
+        kwargs = DESTROY_SERVER.build(
+            self.session.config, delete_snapshots, id, namespace, cluster
         )
 
         return self.session.request("delete", "/api/v1/servers/virtual/DestroyServer", **kwargs)
@@ -332,15 +605,26 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
 
-        parameters: dict[str, dict] = {}
-
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/virtual/GetConfigurations", parameters, {}
+        return self.session.request(
+            "get", "/api/v1/servers/virtual/GetConfigurations", **kwargs
         )
 
-        return self.session.request(
+    def iter_configurations(self) -> Iterator[dict]:
+        """
+        Like `get_configurations`, but streams the response yielding each of its `items` as they're received ::
+
+            for item in client.iter_configurations():
+                ...
+
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return self.session.iter_items(
             "get", "/api/v1/servers/virtual/GetConfigurations", **kwargs
         )
 
@@ -363,18 +647,325 @@ class Client:
         Returns:
             items (list):
         """
-        config = self.session.config  # noqa: F841
+        kwargs = GET_AVAILABILITY.build(
+            self.session.config, cluster, resource_pool, report_nodes
+        )
+
+        return self.session.request("get", "/api/v1/servers/virtual/GetAvailability", **kwargs)
+
+
+class AsyncClient:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_servers(self, cluster: str | None = None) -> dict:
+        """
+        Get a list of virtual machines ::
+
+            await client.get_servers(cluster="Cluster")
+
+        Keyword Arguments:
+            cluster (str):
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_SERVERS.build(self.session.config, cluster)
+
+        return await self.session.request("get", "/api/v1/servers/virtual/GetServers", **kwargs)
+
+    def iter_servers(self, cluster: str | None = None) -> AsyncIterator[dict]:
+        """
+        Like `get_servers`, but streams the response yielding each of its `items` as they're received ::
+
+            async for item in client.iter_servers(cluster="Cluster"):
+                ...
+
+        Keyword Arguments:
+            cluster (str):
+
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_SERVERS.build(self.session.config, cluster)
+
+        return self.session.iter_items("get", "/api/v1/servers/virtual/GetServers", **kwargs)
+
+    async def get_server(
+        self, id: str | None = None, namespace: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Get detailed information about a specific virtual machine ::
+
+            await client.get_server(id="vm-2024093009357617", namespace="denvr", cluster="Hou1")
+
+        Keyword Arguments:
+            id (str): The virtual machine id
+            namespace (str): The namespace/vpc where the virtual machine lives. Default one is same as tenant name.
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            username (str): The user that creatd the vm
+            tenancy_name (str): Name of the tenant where the VM has been created
+            rpool (str): Resource pool where the VM has been created
+            direct_attached_storage_persisted (bool):
+            id (str): The name of the virtual machine
+            namespace (str):
+            configuration (str): A VM configuration ID
+            storage (int): The amount of storage attached to the VM in GB
+            gpu_type (str): The specific host GPU type
+            gpus (int): Number of GPUs attached to the VM
+            vcpus (int): Number of vCPUs available to the VM
+            memory (int): Amount of system memory available in GB
+            ip (str): The public IP address of the VM
+            private_ip (str): The private IP address of the VM
+            image (str): Name of the VM image used
+            cluster (str): The cluster where the VM is allocated
+            node_selector (str): The specific node where the VM is scheduled
+            status (str): The status of the VM (e.g. 'PLANNED', 'PENDING' 'PENDING_RESOURCES', 'PENDING_READINESS',...
+            storage_type (str):
+            root_disk_size (str):
+            last_updated (str):
+        """
+        kwargs = GET_SERVER.build(self.session.config, id, namespace, cluster)
+
+        return await self.session.request("get", "/api/v1/servers/virtual/GetServer", **kwargs)
+
+    async def create_server(
+        self,
+        name: str | None = None,
+        rpool: str | None = None,
+        vpc: str | None = None,
+        configuration: str | None = None,
+        cluster: str | None = None,
+        ssh_keys: list | None = None,
+        snapshot_name: str | None = None,
+        operating_system_image: str | None = None,
+        personal_storage_mount_path: str | None = None,
+        tenant_shared_additional_storage: str | None = None,
+        persist_storage: bool | None = None,
+        direct_storage_mount_path: str | None = None,
+        root_disk_size: int | None = None,
+        selected_node: str | None = None,
+    ) -> dict:
+        """
+        Create a new virtual machine using a pre-defined configuration ::
+
+            await client.create_server(
+                name="my-denvr-vm",
+                rpool="reserved-denvr",
+                vpc="denvr",
+                configuration="A100_40GB_PCIe_1x",
+                cluster="Hou1",
+                ssh_keys=["string"],
+                snapshot_name="string",
+                operating_system_image="Ubuntu 22.04.4 LTS",
+                personal_storage_mount_path="/home/ubuntu/personal",
+                tenant_shared_additional_storage="/home/ubuntu/tenant-shared",
+                persist_storage=False,
+                direct_storage_mount_path="/home/ubuntu/direct-attached",
+                root_disk_size=500,
+                selected_node="yycdp-dev-k8sw03",
+            )
+
+        Keyword Arguments:
+            name (str): Name of virtual server to be created. If not provided, name will be auto-generated.
+            rpool (str): Name of the pool to be used. If not provided, first pool assigned to a tenant will be used. In...
+            vpc (str): Name of the VPC to be used. Usually this will match the tenant name.
+            configuration (str): Name of the configuration to be used. For possible values, refer to the otput of...
+            cluster (str): Cluster to be used. For possible values, refer to the otput of api/v1/clusters/GetAll"/>
+            ssh_keys (list):
+            snapshot_name (str): Snapshot name.
+            operating_system_image (str): Name of the Operating System image to be used.
+            personal_storage_mount_path (str): Personal storage file system mount path.
+            tenant_shared_additional_storage (str): Tenant shared storage file system mount path.
+            persist_storage (bool): Whether direct attached storage should be persistant or ephemeral.
+            direct_storage_mount_path (str): Direct attached storage mount path.
+            root_disk_size (int): Size of root disk to be created (Gi).
+            selected_node (str): Specific node name to target for VM deployment.  Used for non-on-demand resource pools to allow...
+
+        Returns:
+            username (str): The user that creatd the vm
+            tenancy_name (str): Name of the tenant where the VM has been created
+            rpool (str): Resource pool where the VM has been created
+            direct_attached_storage_persisted (bool):
+            id (str): The name of the virtual machine
+            namespace (str):
+            configuration (str): A VM configuration ID
+            storage (int): The amount of storage attached to the VM in GB
+            gpu_type (str): The specific host GPU type
+            gpus (int): Number of GPUs attached to the VM
+            vcpus (int): Number of vCPUs available to the VM
+            memory (int): Amount of system memory available in GB
+            ip (str): The public IP address of the VM
+            private_ip (str): The private IP address of the VM
+            image (str): Name of the VM image used
+            cluster (str): The cluster where the VM is allocated
+            node_selector (str): The specific node where the VM is scheduled
+            status (str): The status of the VM (e.g. 'PLANNED', 'PENDING' 'PENDING_RESOURCES', 'PENDING_READINESS',...
+            storage_type (str):
+            root_disk_size (str):
+            last_updated (str):
+        """
+        kwargs = CREATE_SERVER.build(
+            self.session.config,
+            name,
+            rpool,
+            vpc,
+            configuration,
+            cluster,
+            ssh_keys,
+            snapshot_name,
+            operating_system_image,
+            personal_storage_mount_path,
+            tenant_shared_additional_storage,
+            persist_storage,
+            direct_storage_mount_path,
+            root_disk_size,
+            selected_node,
+        )
+
+        return await self.session.request(
+            "post", "/api/v1/servers/virtual/CreateServer", **kwargs
+        )
+
+    async def start_server(
+        self, id: str | None = None, namespace: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Start a virtual machine that has been previously set up and provisioned, but is currently OFFLINE ::
+
+            await client.start_server(id="vm-2024093009357617", namespace="denvr", cluster="Hou1")
+
+        Keyword Arguments:
+            id (str): The virtual machine id
+            namespace (str): The namespace/vpc where the virtual machine lives. Default one is same as tenant name.
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str):
+            cluster (str):
+            status (str):
+        """
+        kwargs = START_SERVER.build(self.session.config, id, namespace, cluster)
+
+        return await self.session.request(
+            "post", "/api/v1/servers/virtual/StartServer", **kwargs
+        )
+
+    async def stop_server(
+        self, id: str | None = None, namespace: str | None = None, cluster: str | None = None
+    ) -> dict:
+        """
+        Stop a virtual machine, ensuring a secure and orderly shutdown of its operations within the cloud environment ::
+
+            await client.stop_server(id="vm-2024093009357617", namespace="denvr", cluster="Hou1")
+
+        Keyword Arguments:
+            id (str): The virtual machine id
+            namespace (str): The namespace/vpc where the virtual machine lives. Default one is same as tenant name.
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str):
+            cluster (str):
+            status (str):
+        """
+        kwargs = STOP_SERVER.build(self.session.config, id, namespace, cluster)
+
+        return await self.session.request(
+            "post", "/api/v1/servers/virtual/StopServer", **kwargs
+        )
+
+    async def destroy_server(
+        self,
+        delete_snapshots: bool | None = None,
+        id: str | None = None,
+        namespace: str | None = None,
+        cluster: str | None = None,
+    ) -> dict:
+        """
+        Permanently delete a specified virtual machine, effectively wiping all its data and freeing up resources for other uses ::
+
+            await client.destroy_server(
+                delete_snapshots=True, id="vm-2024093009357617", namespace="denvr", cluster="Hou1"
+            )
+
+        Keyword Arguments:
+            delete_snapshots (bool): Should also delete snapshots with virtual machine.
+            id (str): The virtual machine id
+            namespace (str): The namespace/vpc where the virtual machine lives. Default one is same as tenant name.
+            cluster (str): The cluster you're operating on
+
+        Returns:
+            id (str):
+            cluster (str):
+            status (str):
+        """
+        kwargs = DESTROY_SERVER.build(
+            self.session.config, delete_snapshots, id, namespace, cluster
+        )
+
+        return await self.session.request(
+            "delete", "/api/v1/servers/virtual/DestroyServer", **kwargs
+        )
+
+    async def get_configurations(self) -> dict:
+        """
+        Get detailed information on available configurations for virtual machines ::
+
+            await client.get_configurations()
+
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return await self.session.request(
+            "get", "/api/v1/servers/virtual/GetConfigurations", **kwargs
+        )
+
+    def iter_configurations(self) -> AsyncIterator[dict]:
+        """
+        Like `get_configurations`, but streams the response yielding each of its `items` as they're received ::
+
+            async for item in client.iter_configurations():
+                ...
 
-        parameters: dict[str, dict] = {
-            "params": {
-                "cluster": config.getkwarg("cluster", cluster),
-                "resourcePool": config.getkwarg("resource_pool", resource_pool),
-                "reportNodes": config.getkwarg("report_nodes", report_nodes),
-            }
-        }
 
-        kwargs = validate_kwargs(
-            "get", "/api/v1/servers/virtual/GetAvailability", parameters, {"cluster"}
+        Yields:
+            item (dict): Each entry of `items`
+        """
+        kwargs = GET_CONFIGURATIONS.build(self.session.config)
+
+        return self.session.iter_items(
+            "get", "/api/v1/servers/virtual/GetConfigurations", **kwargs
         )
 
-        return self.session.request("get", "/api/v1/servers/virtual/GetAvailability", **kwargs)
+    async def get_availability(
+        self,
+        cluster: str | None = None,
+        resource_pool: str | None = None,
+        report_nodes: bool | None = None,
+    ) -> dict:
+        """
+        Get information about the current availability of different virtual machine configurations ::
+
+            await client.get_availability(cluster="Hou1", resource_pool="reserved-denvr", report_nodes=True)
+
+        Keyword Arguments:
+            cluster (str):
+            resource_pool (str):
+            report_nodes (bool): controls if Count and MaxCount is calculated and returned in the response. If they are not...
+
+        Returns:
+            items (list):
+        """
+        kwargs = GET_AVAILABILITY.build(
+            self.session.config, cluster, resource_pool, report_nodes
+        )
+
+        return await self.session.request(
+            "get", "/api/v1/servers/virtual/GetAvailability", **kwargs
+        )
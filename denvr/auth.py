@@ -1,16 +1,42 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
 import os
+import sys
+import tempfile
+import threading
 import time
+import weakref
 import requests
 
+from contextlib import contextmanager
+
 from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 
 from denvr.utils import retry
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "denvr", "tokens.json"
+)
 
-def auth(src: str, credentials: dict, server: str, retries: int) -> AuthBase:
+
+def auth(
+    src: str,
+    credentials: dict,
+    server: str,
+    retries: int,
+    refresh_skew: float = 30,
+    refresh_background: bool = False,
+    token_cache: bool | str = False,
+    timeout: tuple | None = None,
+) -> AuthBase:
     """
-    auth(src, credentials, server, retries)
+    auth(src, credentials, server, retries, refresh_skew=30, refresh_background=False, token_cache=False, timeout=None)
 
     A simply auth factory function which determines the correct Auth type to use.
 
@@ -19,6 +45,11 @@ def auth(src: str, credentials: dict, server: str, retries: int) -> AuthBase:
         credentials: Lookup dict for apikey, username and/or password
         server: Server to authenticate against for bearer auth
         retries: Retry attempts for requests using bearer auth
+        refresh_skew: Seconds before expiry to refresh bearer access tokens
+        refresh_background: Whether to refresh bearer access tokens from a background thread
+        token_cache: Whether to share bearer tokens across processes via a `TokenCache`,
+            or the path of the cache file to use
+        timeout: The (connect, read) timeouts for bearer token requests
 
     Priority:
     - Environment variables take precedence over configuration files.
@@ -26,21 +57,55 @@ def auth(src: str, credentials: dict, server: str, retries: int) -> AuthBase:
 
     NOTE:
         We're intentionally letting the loaded username/password go out of scope for security reasons.
-        The auth object should be able to handle everything from here onward.
+        The auth object should be able to handle everything from here onward, and only holds the
+        password until its first (lazy) login.
     """
-    apikey = os.getenv("DENVR_APIKEY", credentials.get("apikey", ""))
+    apikey, username, password = _credentials(credentials)
     if apikey:
         return ApiKey(apikey)
 
-    username = os.getenv("DENVR_USERNAME", credentials.get("username", ""))
     if not username:
         raise Exception(f"Could not find username in 'DENVR_USERNAME' or {src}")
 
-    password = os.getenv("DENVR_PASSWORD", credentials.get("password", ""))
     if not password:
         raise Exception(f"Could not find password in 'DENVR_PASSWORD' or {src}")
 
-    return Bearer(server, username, password)
+    return Bearer(
+        server,
+        username,
+        password,
+        retries=retries,
+        skew=refresh_skew,
+        background=refresh_background,
+        cache=TokenCache(token_cache if isinstance(token_cache, str) else None)
+        if token_cache
+        else None,
+        timeout=timeout,
+    )
+
+
+def identity(credentials: dict) -> str:
+    """
+    identity(credentials)
+
+    Returns an opaque digest identifying the credentials `auth` would use.
+    Useful for keying shared sessions without holding onto the raw secrets.
+
+    Args:
+        credentials: Lookup dict for apikey, username and/or password
+    """
+    apikey, username, password = _credentials(credentials)
+    secret = f"apikey:{apikey}" if apikey else f"user:{username}:{password}"
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def _credentials(credentials: dict):
+    # Environment variables take precedence over the config file values
+    return (
+        os.getenv("DENVR_APIKEY", credentials.get("apikey", "")),
+        os.getenv("DENVR_USERNAME", credentials.get("username", "")),
+        os.getenv("DENVR_PASSWORD", credentials.get("password", "")),
+    )
 
 
 class ApiKey(AuthBase):
@@ -48,10 +113,12 @@ class ApiKey(AuthBase):
     ApiKey(key)
 
     Simply wraps the provied key and injects the header into requests.
+    The `identity` attribute is an opaque digest of the key (e.g., for scoping cached responses).
     """
 
     def __init__(self, key):
         self._key = key
+        self.identity = hashlib.sha256(f"apikey:{key}".encode()).hexdigest()
 
     def __call__(self, request):
         request.headers["Authorization"] = f"ApiKey {self._key}"
@@ -60,14 +127,55 @@ class ApiKey(AuthBase):
 
 class Bearer(AuthBase):
     """
-    Bearer(server, username, password)
+    Bearer(server, username, password, retries=3, skew=30, background=False, cache=None, timeout=None)
 
     Handles authorization, renewal and logouts given a
     username and password.
+
+    Access tokens are refreshed `skew` seconds before they expire (capped at half the token
+    lifetime), so requests don't stall on an expired token. With `background=True` a daemon
+    thread performs that refresh instead, while requests keep using the current token, so request
+    threads only block on renewal if the token actually expires first (e.g., the refresh failed).
+
+    Authentication is lazy, happening on the first request rather than on construction.
+    The password is only held until that initial login.
+
+    Passing a `TokenCache` as `cache` shares tokens across processes, so new processes reuse a
+    valid token (or just refresh it) rather than logging in again.
+
+    An optional (connect, read) `timeout` bounds the login and refresh requests.
+
+    NOTE: Token renewal is guarded by a lock, so threads (or coroutines dispatched via `AsyncSession`)
+    sharing one `Bearer` only trigger a single refresh.
+    The `refresh_count`, `refresh_time` (total seconds) and `refresh_latency` (last refresh seconds)
+    attributes are available for monitoring, and each token fetch is reported to the
+    `metrics.Instrument`s in `instruments` (added by the `Session`s using this auth until they're
+    closed).
     """
 
-    def __init__(self, server, username, password, retries=3):
+    def __init__(
+        self,
+        server,
+        username,
+        password,
+        retries=3,
+        skew=30,
+        background=False,
+        cache=None,
+        timeout=None,
+    ):
         self._server = server
+        self._timeout = timeout
+        self._skew = skew
+        self._cache = cache
+        self._cache_key = _cache_key(server, username)
+        # An opaque digest of the account (not the password), e.g., for scoping cached responses
+        self.identity = self._cache_key
+        self._lock = threading.Lock()
+        self.refresh_count = 0
+        self.refresh_time = 0.0
+        self.refresh_latency = 0.0
+        self.instruments: list = []
         self._session = requests.Session()
         self._session.headers.update({"Content-type": "application/json"})
         if retries:
@@ -76,35 +184,139 @@ class Bearer(AuthBase):
                 HTTPAdapter(max_retries=retry(retries=retries, idempotent_only=False)),
             )
 
+        # Authentication is deferred until the first request, so constructing a Bearer
+        # (and any Config, Session or Client using it) doesn't touch the network.
+        self._credentials: tuple[str, str] | None = (username, password)
+        self._access_token = None
+        self._refresh_token = None
+        self._access_expires = 0.0
+        self._refresh_expires = 0.0
+        self._refresh_at = 0.0
+        self._background = background
+        self._stop = threading.Event()
+
+    @property
+    def token(self):
+        if self._credentials is not None:
+            with self._lock:
+                # Only the first thread through should log in
+                if self._credentials is not None:
+                    self._login(*self._credentials)
+
+        if time.time() > self._refresh_expires:
+            raise Exception("Auth refresh token has expired. Unable to refresh access token.")
+
+        # A background refresher renews tokens ahead of time, so requests only renew them
+        # (blocking on the refresh) once they've actually expired
+        due = self._access_expires if self._background else self._refresh_at
+        if time.time() > due:
+            self._renew()
+
+        return self._access_token
+
+    def _renew(self):
+        # Refreshes the access token, unless another thread refreshed it while we waited on the lock
+        with self._lock:
+            if time.time() <= self._refresh_at:
+                return
+
+            if self._cache:
+                # Likewise for other processes sharing the token cache
+                with self._cache.lock():
+                    if not self._load() or time.time() > self._refresh_at:
+                        self._refresh()
+                        self._store()
+            else:
+                self._refresh()
+
+    def _login(self, username, password):
+        if self._cache:
+            # Hold the cache lock while authenticating, so concurrent processes reuse one login
+            with self._cache.lock():
+                if not self._load():
+                    self._authenticate(username, password)
+                    self._store()
+        else:
+            self._authenticate(username, password)
+
+        # We no longer need the password once we have a refresh token
+        self._credentials = None
+        if self._background:
+            threading.Thread(
+                target=_refresher, args=(weakref.ref(self), self._stop), daemon=True
+            ).start()
+
+    def _authenticate(self, username, password):
         # Requests an initial authorization token
-        # storing the username, password, token / refresh tokens and when they expire
+        # storing the token / refresh tokens and when they expire
+        start = time.monotonic()
         resp = self._session.post(
             f"{self._server}/api/TokenAuth/Authenticate",
             json={"userNameOrEmailAddress": username, "password": password},
+            timeout=self._timeout,
         )
         resp.raise_for_status()
         content = resp.json()["result"]
         self._access_token = content["accessToken"]
         self._refresh_token = content["refreshToken"]
-        self._access_expires = time.time() + content["expireInSeconds"]
+        self._set_access_expires(content["expireInSeconds"])
         self._refresh_expires = time.time() + content["refreshTokenExpireInSeconds"]
+        self._report("authenticate", time.monotonic() - start)
 
-    @property
-    def token(self):
-        if time.time() > self._refresh_expires:
-            raise Exception("Auth refresh token has expired. Unable to refresh access token.")
+    def _refresh(self):
+        start = time.monotonic()
+        resp = self._session.get(
+            f"{self._server}/api/TokenAuth/RefreshToken",
+            params={"refreshToken": self._refresh_token},
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        content = resp.json()["result"]
+        self._access_token = content["accessToken"]
+        self._set_access_expires(content["expireInSeconds"])
+        self.refresh_latency = time.monotonic() - start
+        self.refresh_time += self.refresh_latency
+        self.refresh_count += 1
+        self._report("refresh", self.refresh_latency)
 
-        if time.time() > self._access_expires:
-            resp = self._session.get(
-                f"{self._server}/api/TokenAuth/RefreshToken",
-                params={"refreshToken": self._refresh_token},
-            )
-            resp.raise_for_status()
-            content = resp.json()["result"]
-            self._access_token = content["accessToken"]
-            self._access_expires = time.time() + content["expireInSeconds"]
+    def _report(self, kind: str, elapsed: float):
+        # Each Session adds its instrument (and removes it on close), so one shared by several
+        # Sessions appears more than once but should only be told once
+        for instrument in {id(i): i for i in list(self.instruments)}.values():
+            instrument.token(kind, elapsed)
 
-        return self._access_token
+    def _load(self) -> bool:
+        # Adopt the cached tokens if the refresh token is still usable
+        entry = self._cache.load(self._cache_key)
+        if not entry or time.time() > entry["refresh_expires"]:
+            return False
+
+        self._access_token = entry["access_token"]
+        self._refresh_token = entry["refresh_token"]
+        self._set_access_expires(entry["access_expires"] - time.time())
+        self._refresh_expires = entry["refresh_expires"]
+        return True
+
+    def _store(self):
+        self._cache.store(
+            self._cache_key,
+            {
+                "access_token": self._access_token,
+                "refresh_token": self._refresh_token,
+                "access_expires": self._access_expires,
+                "refresh_expires": self._refresh_expires,
+            },
+        )
+
+    def _set_access_expires(self, expires_in):
+        self._access_expires = time.time() + expires_in
+        self._refresh_at = self._access_expires - min(self._skew, max(0, expires_in / 2))
+
+    def close(self):
+        """
+        Stop the background refresher thread, if any.
+        """
+        self._stop.set()
 
     def __call__(self, request):
         request.headers["Authorization"] = f"Bearer {self.token}"
@@ -112,4 +324,112 @@ class Bearer(AuthBase):
 
     def __del__(self):
         # TODO: Add a logout request on auth object deletion
-        pass
+        stop = getattr(self, "_stop", None)
+        if stop is not None:
+            stop.set()
+
+
+class TokenCache:
+    """
+    TokenCache(path=DEFAULT_TOKEN_CACHE_PATH)
+
+    An on-disk cache of bearer tokens shared across processes.
+    The file is only readable by the current user (0600), written atomically and guarded
+    by a lock file, so concurrent processes don't corrupt it or log in redundantly.
+    Entries are keyed by a digest of the server and username.
+    """
+
+    def __init__(self, path=None):
+        self.path = path if path else DEFAULT_TOKEN_CACHE_PATH
+
+    @contextmanager
+    def lock(self):
+        """
+        Exclusively lock the cache across processes.
+        """
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        with open(f"{self.path}.lock", "a+") as fobj:
+            if sys.platform == "win32":
+                import msvcrt
+
+                fobj.seek(0)
+                msvcrt.locking(fobj.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    fobj.seek(0)
+                    msvcrt.locking(fobj.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(fobj, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fobj, fcntl.LOCK_UN)
+
+    def load(self, key: str) -> dict | None:
+        """
+        Returns the cached entry for `key` or `None`.
+        """
+        try:
+            with open(self.path) as fobj:
+                return json.load(fobj).get(key)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: dict):
+        """
+        Store `entry` under `key`, replacing the cache file atomically.
+        Expected to be called while holding the `lock`.
+        """
+        try:
+            with open(self.path) as fobj:
+                entries = json.load(fobj)
+        except (OSError, ValueError):
+            entries = {}
+
+        # Drop any entries whose refresh tokens have already expired
+        now = time.time()
+        entries = {k: v for k, v in entries.items() if v.get("refresh_expires", 0) > now}
+        entries[key] = entry
+
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".tokens-")
+        try:
+            os.chmod(tmp, 0o600)
+            with os.fdopen(fd, "w") as fobj:
+                json.dump(entries, fobj)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
+def _cache_key(server, username):
+    return hashlib.sha256(f"{server}:{username}".encode()).hexdigest()
+
+
+def _refresher(ref, stop):
+    # Refreshes the token ahead of time, only holding a weak reference so the Bearer can be collected
+    while True:
+        bearer = ref()
+        if bearer is None or time.time() > bearer._refresh_expires:
+            return
+
+        delay = bearer._refresh_at - time.time()
+        del bearer
+        if stop.wait(max(delay, 0)):
+            return
+
+        bearer = ref()
+        if bearer is None:
+            return
+
+        try:
+            bearer._renew()
+        except Exception:
+            logger.exception("Background token refresh failed")
+            if stop.wait(1):
+                return
+        finally:
+            del bearer
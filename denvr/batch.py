@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import itertools
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+
+class Result(NamedTuple):
+    """
+    The outcome of a single call in a batch.
+
+    Args:
+        kwargs (dict): The keyword arguments the operation was called with.
+        value: The operation's response, or `None` if it failed.
+        error (BaseException): The exception raised by the operation, or `None` if it succeeded.
+    """
+
+    kwargs: dict
+    value: Any = None
+    error: BaseException | None = None
+
+
+def many(
+    operation: Callable,
+    items: Iterable[dict],
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[Result]:
+    """
+    Call `operation(**kwargs)` for each kwargs dict in `items` over a bounded thread pool,
+    yielding a `Result` for each call as it completes. Errors are reported per item rather
+    than aborting the batch. Calls go through the client's `Session`, so they share its
+    connection pool and retry policy.
+
+    Example:
+
+        for r in many(virtual.get_server, [{"id": "vm-1", "namespace": "denvr", "cluster": "Hou1"}]):
+            print(r.value["status"] if r.error is None else r.error)
+
+    Args:
+        operation: The client method to call.
+        items: An iterable of keyword argument dicts. Consumed lazily.
+        max_workers: Maximum number of concurrent calls. Defaults to the client session's
+            `pool_maxsize`, so workers don't contend for or churn connections.
+        timeout: Maximum seconds to wait on an individual call before yielding a `TimeoutError`
+            result for it. The underlying request is abandoned rather than interrupted.
+            Calls still queued for a worker are timed from when they were submitted.
+
+    Returns:
+        A generator of `Result` tuples in completion order.
+    """
+    if max_workers is None:
+        max_workers = _pool_maxsize(operation)
+
+    iterator = iter(items)
+    started: dict[int, float] = {}
+    pending: dict[Future, tuple[int, dict, float]] = {}
+
+    def call(index, kwargs):
+        started[index] = time.monotonic()
+        return operation(**kwargs)
+
+    def submit(index, kwargs):
+        pending[executor.submit(call, index, kwargs)] = (index, kwargs, time.monotonic())
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="denvr")
+    try:
+        counter = itertools.count()
+        for index, kwargs in zip(counter, itertools.islice(iterator, max_workers)):
+            submit(index, kwargs)
+
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=_next_timeout(pending, started, timeout),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                index, kwargs, _ = pending.pop(future)
+                started.pop(index, None)
+                error = future.exception()
+                yield Result(kwargs, None, error) if error else Result(kwargs, future.result())
+
+            # Abandon any calls which have exceeded their timeout. Calls queued behind abandoned
+            # ones (still holding their workers) are timed from submission, so can't wait forever.
+            if timeout is not None:
+                now = time.monotonic()
+                for future, (index, kwargs, submitted) in list(pending.items()):
+                    if index in started:
+                        if now - started[index] <= timeout:
+                            continue
+                        error = TimeoutError(f"Call timed out after {timeout} seconds")
+                    elif now - submitted <= timeout or not future.cancel():
+                        # Not expired, or it started just now
+                        continue
+                    else:
+                        error = TimeoutError(f"Call didn't start within {timeout} seconds")
+
+                    del pending[future]
+                    started.pop(index, None)
+                    yield Result(kwargs, None, error)
+
+            # Top up the pending calls for each one that finished
+            for index, kwargs in zip(
+                counter, itertools.islice(iterator, max_workers - len(pending))
+            ):
+                submit(index, kwargs)
+    finally:
+        # Don't start any queued calls if the consumer stops iterating early
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def get_server_many(client, items: Iterable[dict | str], **kwargs) -> Iterator[Result]:
+    """
+    Fetch many virtual machines with `client.get_server`.
+    See `many` for the supported keyword arguments.
+
+    Args:
+        client: A `servers/virtual` Client.
+        items: Dicts of `id`, `namespace` and `cluster`, or just ids in the `vpcid` (or `tenant`)
+            config default's namespace and the default cluster.
+    """
+    namespace = client.session.config.vpcid
+    return many(
+        client.get_server,
+        (
+            {"id": item, "namespace": namespace} if isinstance(item, str) else item
+            for item in items
+        ),
+        **kwargs,
+    )
+
+
+def get_host_many(client, items: Iterable[dict | str], **kwargs) -> Iterator[Result]:
+    """
+    Fetch many bare metal hosts with `client.get_host`.
+    See `many` for the supported keyword arguments.
+
+    Args:
+        client: A `servers/metal` Client.
+        items: Dicts of `id` and `cluster`, or just ids in the default cluster.
+    """
+    return many(
+        client.get_host,
+        ({"id": item} if isinstance(item, str) else item for item in items),
+        **kwargs,
+    )
+
+
+def _pool_maxsize(operation: Callable) -> int:
+    # The connection pool size of the session behind a client method, if it has one
+    session = getattr(getattr(operation, "__self__", None), "session", None)
+    config = getattr(session, "config", None)
+    return getattr(config, "pool_maxsize", DEFAULT_POOLSIZE)
+
+
+def _next_timeout(pending, started, timeout):
+    # How long we can block before the oldest call would exceed its timeout, counting calls
+    # which haven't started yet from when they were submitted
+    if timeout is None:
+        return None
+
+    starts = [started.get(index, submitted) for index, _, submitted in pending.values()]
+    return max(0, min(starts) + timeout - time.monotonic())
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from collections import deque
+
+from requests.exceptions import RequestException
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(RequestException):
+    """
+    Raised instead of sending a request while the circuit for its endpoint and cluster is open.
+
+    Args:
+        key (tuple): The (path, cluster) of the open circuit.
+        retry_in (float): Seconds until the circuit allows probe requests again.
+    """
+
+    def __init__(self, key: tuple, retry_in: float):
+        super().__init__(
+            f"Circuit open for {key[0]} ({key[1]}), retry in {retry_in:.1f} seconds"
+        )
+        self.key = key
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    CircuitBreaker(failure_rate=0.5, min_requests=10, window=20, cooldown=30, probes=1)
+
+    An opt-in circuit breaker for use with `Session(config, breaker=...)`, tracking requests per
+    endpoint path and cluster.
+
+    A circuit opens once at least `min_requests` of its last `window` requests have completed and
+    `failure_rate` of them failed (5xx responses, connection errors or timeouts). While open,
+    requests fail fast with a `CircuitOpenError` rather than piling up retries against a degraded
+    backend. After `cooldown` seconds the circuit half-opens, letting up to `probes` requests
+    through; a successful probe closes it again while a failed one re-opens it.
+
+    Args:
+        failure_rate (float): Fraction of failed requests which opens the circuit.
+        min_requests (int): Requests needed in the window before the circuit can open.
+        window (int): Number of recent requests considered per circuit.
+        cooldown (float): Seconds to fail fast before probing the endpoint again.
+        probes (int): Concurrent probe requests allowed while half-open.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: int = 20,
+        cooldown: float = 30,
+        probes: int = 1,
+    ):
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.cooldown = cooldown
+        self.probes = probes
+        self._circuits: dict[tuple, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def key(self, path: str, kwargs: dict) -> tuple:
+        """
+        The (path, cluster) circuit key for a request, taking the cluster from its
+        query parameters or JSON body.
+        """
+        for source in (kwargs.get("params"), kwargs.get("json")):
+            if isinstance(source, dict):
+                cluster = source.get("Cluster", source.get("cluster"))
+                if cluster is not None:
+                    return (path, cluster)
+
+        return (path, None)
+
+    def state(self, key: tuple) -> str:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CLOSED
+
+    def before(self, key: tuple):
+        """
+        Admit a request for `key` or raise a `CircuitOpenError` if its circuit is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                if now < circuit.opened_at + self.cooldown:
+                    raise CircuitOpenError(key, circuit.opened_at + self.cooldown - now)
+
+                logger.info("Circuit half-open for %s (%s)", *key)
+                circuit.state = HALF_OPEN
+                circuit.probing = 0
+
+            if circuit.probing >= self.probes:
+                raise CircuitOpenError(key, 0.0)
+
+            circuit.probing += 1
+
+    def record(self, key: tuple, success: bool):
+        """
+        Record the outcome of a request admitted by `before`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit(self.window)
+
+            if circuit.state == HALF_OPEN:
+                circuit.probing = max(0, circuit.probing - 1)
+                if success:
+                    logger.info("Circuit closed for %s (%s)", *key)
+                    circuit.reset()
+                else:
+                    self._open(key, circuit)
+                return
+
+            circuit.outcomes.append(success)
+            failures = circuit.outcomes.count(False)
+            if (
+                circuit.state == CLOSED
+                and len(circuit.outcomes) >= self.min_requests
+                and failures >= self.failure_rate * len(circuit.outcomes)
+            ):
+                self._open(key, circuit)
+
+    def _open(self, key, circuit):
+        logger.warning("Circuit open for %s (%s)", *key)
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+
+
+class _Circuit:
+    # The state and recent outcomes for one (path, cluster)
+    def __init__(self, window: int):
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = 0
+
+    def reset(self):
+        self.outcomes.clear()
+        self.state = CLOSED
+        self.probing = 0
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Endpoints returning near-static data which are safe to cache by default
+CATALOG_PATHS = frozenset(
+    [
+        "/api/v1/clusters/GetAll",
+        "/api/v1/servers/applications/GetApplicationCatalogItems",
+        "/api/v1/servers/applications/GetConfigurations",
+        "/api/v1/servers/images/GetOperatingSystemImages",
+        "/api/v1/servers/virtual/GetConfigurations",
+    ]
+)
+
+
+class Entry(NamedTuple):
+    """
+    A cached response body along with its validators.
+
+    Args:
+        content: The decoded JSON response body.
+        etag (str): The `ETag` response header, if any.
+        last_modified (str): The `Last-Modified` response header, if any.
+        expires (float): Epoch time after which an entry without validators is stale.
+    """
+
+    content: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    expires: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        # Entries with validators are always revalidated with a conditional GET
+        return not (self.etag or self.last_modified) and time.time() < self.expires
+
+    def headers(self) -> dict:
+        """
+        The conditional request headers for revalidating this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    ResponseCache(maxsize=128, ttl=300, paths=CATALOG_PATHS, path=None)
+
+    An opt-in cache of GET responses for use with `Session(config, cache=...)`.
+    Responses carrying an `ETag` or `Last-Modified` header are revalidated with `If-None-Match` /
+    `If-Modified-Since`, so unchanged payloads come back as an empty 304.
+    Responses without validators are served from the cache for `ttl` seconds.
+
+    Args:
+        maxsize (int): Maximum number of entries kept in memory (least recently used are evicted)
+            and on disk (least recently written are removed).
+        ttl (float): Seconds to serve responses without validators before requesting them again.
+            Files written longer ago than this are removed from `path`.
+        paths (set): API paths eligible for caching. Defaults to the near-static catalog endpoints.
+        path (str): Optional directory to persist entries to, so they survive across processes.
+            It's pruned whenever an entry is written.
+    """
+
+    def __init__(self, maxsize=128, ttl=300.0, paths=CATALOG_PATHS, path=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.paths = frozenset(paths)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cacheable(self, method: str, path: str) -> bool:
+        return method.lower() == "get" and path in self.paths
+
+    def get(self, key: str) -> Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read(key) if self.path else None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, content: Any, headers) -> Entry:
+        """
+        Store the decoded `content` of a response with the given `headers`.
+        """
+        entry = Entry(
+            content=content,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires=time.time() + self.ttl,
+        )
+        self._remember(key, entry)
+        if self.path:
+            self._write(key, entry)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, hit: bool, revalidated: bool = False):
+        """
+        Count the outcome of a lookup, i.e., whether the cached content was used and if that
+        took a conditional request.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if revalidated:
+                self.revalidations += 1
+
+    def _remember(self, key: str, entry: Entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _file(self, key: str) -> str:
+        assert self.path
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def _read(self, key: str) -> Entry | None:
+        try:
+            with open(self._file(key)) as fobj:
+                return Entry(**json.load(fobj))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, key: str, entry: Entry):
+        assert self.path
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".entry-")
+        try:
+            with os.fdopen(fd, "w") as fobj:
+                json.dump(entry._asdict(), fobj)
+            os.replace(tmp, self._file(key))
+        except (OSError, TypeError, ValueError):
+            logger.debug("Failed to persist cache entry for %s", key)
+            os.remove(tmp)
+        else:
+            self._prune(keep=self._file(key))
+
+    def _prune(self, keep: str):
+        # Drop files written more than `ttl` ago, then the oldest beyond `maxsize`.
+        # Other processes may be pruning the same directory, so files can vanish under us.
+        assert self.path
+        now = time.time()
+        files = []
+        for name in os.listdir(self.path):
+            file = os.path.join(self.path, name)
+            if not name.endswith(".json") or file == keep:
+                continue
+            try:
+                written = os.path.getmtime(file)
+                if now - written > self.ttl:
+                    os.remove(file)
+                else:
+                    files.append((written, file))
+            except OSError:
+                continue
+
+        files.sort()
+        for _, file in files[: max(0, len(files) + 1 - self.maxsize)]:
+            try:
+                os.remove(file)
+            except OSError:
+                continue
+
+
+def cache_key(url: str, params: dict | None, identity: str = "") -> str:
+    """
+    A stable key for a GET request's url and query parameters, scoped to the account `identity`
+    (e.g., `auth.identity`), so accounts sharing a cache `path` never see each other's responses.
+    """
+    return identity + ":" + url + "?" + json.dumps(params or {}, sort_keys=True)
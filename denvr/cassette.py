@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import math
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+
+from http.client import responses
+from typing import Callable, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping, as the rest vary between runs without affecting the SDK
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After", "Cache-Control")
+
+# Seconds, a function returning seconds, or "recorded" to replay the recorded durations
+Latency = Union[float, Callable[[], float], str, None]
+
+
+class UnmatchedRequest(RequestException):
+    """
+    Raised when replaying a request which isn't in the cassette.
+    """
+
+
+def request_key(method: str, url: str) -> str:
+    """
+    The cassette key for a request, from its method, path and sorted query parameters.
+    The scheme and host are ignored, so traffic recorded against one server replays against any.
+    """
+    parts = urlsplit(url)
+    # Servers configured with a trailing slash produce paths like `//api/v1/...`
+    path = re.sub("/+", "/", parts.path)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {path}" + (f"?{query}" if query else "")
+
+
+class Cassette:
+    """
+    Cassette(path=None)
+
+    Recorded request / response pairs, indexed by `request_key`, for replaying API traffic
+    without the network. Cassettes are stored as JSON lines, gzipped if `path` ends in `.gz`.
+    Requests recorded several times replay their responses in order, cycling back to the first.
+
+    Example:
+
+        cassette = Cassette("traffic.jsonl.gz")
+        session = Session(config, transport=Recorder(cassette))
+        ...
+        session.close()  # Saves the cassette
+
+        session = Session(config, transport=Player(cassette, latency=lognormal(0.05)))
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.interactions: dict[str, list[dict]] = {}
+        self._played: dict[str, int] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return sum(len(v) for v in self.interactions.values())
+
+    def __contains__(self, key):
+        return key in self.interactions
+
+    def record(self, request: PreparedRequest, response: Response, elapsed: float):
+        """
+        Add a response (reading its body) for `request`.
+        """
+        body = response.content or b""
+        try:
+            entry = {"body": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            entry = {"body": base64.b64encode(body).decode("ascii"), "base64": True}
+
+        entry.update(
+            {
+                "key": request_key(request.method or "GET", request.url or ""),
+                "status": response.status_code,
+                "headers": {
+                    k: response.headers[k] for k in RECORDED_HEADERS if k in response.headers
+                },
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        with self._lock:
+            self.interactions.setdefault(entry["key"], []).append(entry)
+
+    def play(self, request: PreparedRequest) -> dict:
+        """
+        The next recorded response entry for `request`.
+
+        Raises:
+            UnmatchedRequest: If the request wasn't recorded.
+        """
+        key = request_key(request.method or "GET", request.url or "")
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                raise UnmatchedRequest(f"No recorded response for {key}", request=request)
+
+            index = self._played.get(key, 0)
+            self._played[key] = index + 1
+
+        return entries[index % len(entries)]
+
+    def rewind(self):
+        """
+        Replay every request from its first recorded response again.
+        """
+        with self._lock:
+            self._played.clear()
+
+    def load(self, path: str):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as fobj:
+            for line in fobj:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.interactions.setdefault(entry["key"], []).append(entry)
+
+    def save(self, path: str | None = None):
+        """
+        Write the cassette to `path` (or the path it was loaded from), replacing any existing file.
+        """
+        path = path or self.path
+        assert path, "No path to save the cassette to"
+        with self._lock:
+            entries = [e for v in self.interactions.values() for e in v]
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".cassette-")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                fobj = gzip.GzipFile(fileobj=raw, mode="wb") if path.endswith(".gz") else raw
+                for entry in entries:
+                    fobj.write(json.dumps(entry, separators=(",", ":")).encode() + b"\n")
+                fobj.close()
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+        logger.debug("Saved %d interactions to %s", len(entries), path)
+
+
+class Recorder(BaseAdapter):
+    """
+    Recorder(cassette)
+
+    A transport for `Session(config, transport=...)` which sends requests through the session's
+    pool adapter as usual, recording each response in the `cassette`.
+    The cassette is saved when the session is closed, if it has a path.
+    """
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+        # Set by the session to its `PoolAdapter`
+        self.adapter: BaseAdapter | None = None
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        assert self.adapter is not None, "Recorder is not mounted on a Session"
+        start = time.perf_counter()
+        resp = self.adapter.send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
+        # Reading the body here still lets streamed responses iterate over it afterwards
+        self.cassette.record(request, resp, time.perf_counter() - start)
+        return resp
+
+    def close(self):
+        if self.adapter is not None:
+            self.adapter.close()
+        if self.cassette.path:
+            self.cassette.save()
+
+
+class Player(BaseAdapter):
+    """
+    Player(cassette, latency=None)
+
+    A transport for `Session(config, transport=...)` which answers requests from the `cassette`
+    in-process, without touching the network.
+
+    Args:
+        cassette (Cassette): The recorded traffic.
+        latency: Seconds to delay each response by, a function returning them (e.g., `lognormal`),
+            or "recorded" to replay the recorded durations. Defaults to no delay.
+    """
+
+    def __init__(self, cassette: Cassette, latency: Latency = None):
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def _delay(self, entry: dict) -> float:
+        if self.latency is None:
+            return 0.0
+        if self.latency == "recorded":
+            return entry["elapsed"]
+        if callable(self.latency):
+            return max(self.latency(), 0.0)
+        return float(self.latency)  # type: ignore[arg-type]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.cassette.play(request)
+        delay = self._delay(entry)
+        if delay:
+            time.sleep(delay)
+
+        body = entry["body"].encode("utf-8")
+        if entry.get("base64"):
+            body = base64.b64decode(body)
+
+        return build_response(request, entry["status"], entry["headers"], body)
+
+    def close(self):
+        pass
+
+
+def build_response(
+    request: PreparedRequest, status: int, headers: dict, body: bytes
+) -> Response:
+    """
+    A complete `Response` to `request`, as an in-process transport adapter would return.
+    """
+    resp = Response()
+    resp.status_code = status
+    resp.reason = responses.get(status, "")
+    resp.headers = CaseInsensitiveDict(headers)
+    resp.url = request.url or ""
+    resp.request = request
+    resp.encoding = "utf-8"
+    resp._content = body
+    # Lets `iter_content` replay the body for streamed requests
+    resp._content_consumed = True  # type: ignore[attr-defined]
+    return resp
+
+
+def lognormal(median: float, sigma: float = 0.5, seed: int = 0) -> Callable[[], float]:
+    """
+    A seeded latency distribution for `Player`, returning log-normally distributed seconds
+    around `median`, with the long tail typical of API response times.
+    """
+    rng = random.Random(seed)
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
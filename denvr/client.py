@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import importlib
 
-from denvr.config import Config, config
-from denvr.session import Session
+from denvr.config import Config
+from denvr.session import Session, shared_session
 
 
 def client(name: str, conf: Config | None = None):
@@ -12,12 +12,16 @@ def client(name: str, conf: Config | None = None):
 
     A shorthand for loading a specific client with a default session/config.
     Optionally, a Config object can be supplied as a keyword.
+
+    NOTE: Without a Config, clients share a process-wide Session (see `denvr.session.shared_session`),
+    so repeated calls reuse the same connection pool and auth token.
+    Use `denvr.session.invalidate` to force a fresh config load and login.
     """
-    _config = conf if conf else config()
+    session = Session(conf) if conf else shared_session()
 
     # TODO: Better vetting of `name` for cross-platform paths
     mod = importlib.import_module(
-        "denvr.api.{}.{}".format(_config.api, ".".join(name.split("/")))
+        "denvr.api.{}.{}".format(session.config.api, ".".join(name.split("/")))
     )
 
-    return mod.Client(Session(_config))
+    return mod.Client(session)
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import copy
 import os
 
 import toml
 
+from requests.adapters import DEFAULT_POOLSIZE
 from requests.auth import AuthBase
 
 from denvr.auth import auth
 
 DEFAULT_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".config", "denvr.toml")
 
+# Seconds to wait on establishing a connection and on each read from the server
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+
+# Parsed config files keyed by path, storing the (mtime, content) we last read
+_parsed: dict[str, tuple[int, dict]] = {}
+
 
 class Config:
     """
@@ -48,6 +57,104 @@ class Config:
     def retries(self):
         return self.defaults.get("retries", 3)
 
+    @property
+    def connect_timeout(self):
+        return self.defaults.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+
+    @property
+    def read_timeout(self):
+        return self.defaults.get("read_timeout", DEFAULT_READ_TIMEOUT)
+
+    @property
+    def timeouts(self):
+        return self.defaults.get("timeouts", {})
+
+    @property
+    def deadline(self):
+        return self.defaults.get("deadline", 0)
+
+    @property
+    def pool_connections(self):
+        return self.defaults.get("pool_connections", DEFAULT_POOLSIZE)
+
+    @property
+    def pool_maxsize(self):
+        return self.defaults.get("pool_maxsize", DEFAULT_POOLSIZE)
+
+    @property
+    def pool_block(self):
+        return self.defaults.get("pool_block", False)
+
+    @property
+    def keepalive(self):
+        return self.defaults.get("keepalive", 0)
+
+    @property
+    def normalize_nested(self):
+        return self.defaults.get("normalize_nested", False)
+
+    @property
+    def response_views(self):
+        return self.defaults.get("response_views", False)
+
+    @property
+    def coalesce(self):
+        return self.defaults.get("coalesce", False)
+
+    @property
+    def rate_limit(self):
+        return self.defaults.get("rate_limit", 0)
+
+    @property
+    def breaker(self):
+        return self.defaults.get("breaker", False)
+
+    @property
+    def breaker_failure_rate(self):
+        return self.defaults.get("breaker_failure_rate", 0.5)
+
+    @property
+    def breaker_cooldown(self):
+        return self.defaults.get("breaker_cooldown", 30)
+
+    @property
+    def hedge(self):
+        return self.defaults.get("hedge", False)
+
+    @property
+    def hedge_delay(self):
+        return self.defaults.get("hedge_delay", 0)
+
+    @property
+    def hedge_budget(self):
+        return self.defaults.get("hedge_budget", 0.05)
+
+    @property
+    def metrics(self):
+        return self.defaults.get("metrics", False)
+
+    @property
+    def cache_ttl(self):
+        return self.defaults.get("cache_ttl", 0)
+
+    @property
+    def cache_path(self):
+        return self.defaults.get("cache_path", None)
+
+    def timeout(self, path=None) -> tuple:
+        """
+        The (connect, read) timeouts for requests to `path`, using any per-endpoint override
+        from `timeouts` (either a read timeout or a `[connect, read]` pair).
+        """
+        timeout = self.timeouts.get(path) if path else None
+        if timeout is None:
+            return (self.connect_timeout, self.read_timeout)
+
+        if isinstance(timeout, (list, tuple)):
+            return tuple(timeout)
+
+        return (self.connect_timeout, timeout)
+
     def getkwarg(self, name, val):
         """
         Uses default value for the provided `name` if `val` is `None`.
@@ -58,18 +165,47 @@ class Config:
         return val
 
 
+def load(path=None) -> tuple[str, dict]:
+    """
+    Resolve the config file path and return it alongside the parsed toml content.
+
+    Parsed files are cached on their modification time, so repeated calls only
+    re-read the file when it changes.
+    """
+    config_path = path if path else os.getenv("DENVR_CONFIG", DEFAULT_CONFIG_PATH)
+    if not os.path.exists(config_path):
+        return config_path, {}
+
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _parsed.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, toml.load(config_path))
+        _parsed[config_path] = cached
+
+    return config_path, copy.deepcopy(cached[1])
+
+
 def config(path=None):
     """
     Construct a Config object from the provide config file path.
     """
-    config_path = path if path else os.getenv("DENVR_CONFIG", DEFAULT_CONFIG_PATH)
-    config = toml.load(config_path) if os.path.exists(config_path) else {}
+    config_path, config = load(path)
     defaults = config.get("defaults", {})
     server = defaults.get("server", "https://api.cloud.denvrdata.com")
 
     return Config(
         defaults=defaults,
         auth=auth(
-            config_path, config.get("credentials", {}), server, defaults.get("retries", 3)
+            config_path,
+            config.get("credentials", {}),
+            server,
+            defaults.get("retries", 3),
+            refresh_skew=defaults.get("refresh_skew", 30),
+            refresh_background=defaults.get("refresh_background", False),
+            token_cache=defaults.get("token_cache", False),
+            timeout=(
+                defaults.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT),
+                defaults.get("read_timeout", DEFAULT_READ_TIMEOUT),
+            ),
         ),
     )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from typing import Any, Callable
+
+from requests import JSONDecodeError, Response
+
+logger = logging.getLogger(__name__)
+
+# Response attribute holding the decoded body, so each response is only decoded once
+_ATTR = "_denvr_content"
+
+
+def _json_loads(content: bytes) -> Any:
+    # Decoding utf-8 up front is quicker than letting `json` detect the encoding
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        return json.loads(content)
+    return json.loads(text)
+
+
+def _orjson_loads() -> Callable[[bytes], Any]:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_loads() -> Callable[[bytes], Any]:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+# Available backends in order of preference
+BACKENDS: dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": lambda: _json_loads,
+}
+
+
+def use(backend: str | Callable[[bytes], Any] | None = None) -> str:
+    """
+    Select the JSON decoder used for responses. Without a `backend` the fastest installed
+    one is used (orjson, then msgspec, then the standard library `json`).
+    Install the `fast` extra (`pip install 'denvr[fast]'`) for both optional backends.
+
+    Args:
+        backend: The name of a backend in `BACKENDS` or a custom `loads(bytes)` function.
+
+    Returns:
+        The name of the selected backend.
+    """
+    global _loads, _backend
+
+    if callable(backend):
+        _loads, _backend = backend, getattr(backend, "__name__", "custom")
+        return _backend
+
+    for name in [backend] if backend else BACKENDS:
+        try:
+            _loads, _backend = BACKENDS[name](), name
+            logger.debug("Using %s to decode JSON responses", name)
+            return name
+        except ImportError:
+            if backend:
+                raise
+
+    # The standard library is always available, so we shouldn't get here
+    raise ValueError(f"Unknown JSON decoder backend {backend}")
+
+
+def backend() -> str:
+    """
+    The name of the JSON decoder in use.
+    """
+    return _backend
+
+
+def loads(content: bytes) -> Any:
+    """
+    Decode a JSON document from raw bytes with the selected backend.
+
+    Raises:
+        JSONDecodeError: If `content` isn't valid JSON, regardless of the backend.
+    """
+    try:
+        return _loads(content)
+    except ValueError as e:
+        # orjson / msgspec raise their own ValueError subclasses
+        if isinstance(e, JSONDecodeError):
+            raise
+        doc = content.decode("utf-8", errors="replace")
+        raise JSONDecodeError(str(e), doc, 0) from e
+
+
+def decode(resp: Response) -> Any:
+    """
+    Decode the JSON body of a response straight from its raw bytes.
+    The result is stored on the response, so error handling and the caller share one decode.
+    """
+    try:
+        return getattr(resp, _ATTR)
+    except AttributeError:
+        pass
+
+    content = loads(resp.content)
+    setattr(resp, _ATTR, content)
+    return content
+
+
+_loads: Callable[[bytes], Any] = _json_loads
+_backend = "json"
+use()
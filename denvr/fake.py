@@ -0,0 +1,629 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from requests.adapters import BaseAdapter
+
+from denvr.api.v1 import clusters
+from denvr.api.v1.servers import applications, images, metal, virtual
+from denvr.cassette import build_response
+from denvr.validate import RequestSpec
+
+logger = logging.getLogger(__name__)
+
+# Free slots per configuration (or application hardware package) in each cluster
+DEFAULT_CAPACITY = {
+    "Hou1": {"A100_40GB_PCIe_1x": 10000, "A100_40GB_PCIe_8x": 1000, "H100_80GB_SXM_8x": 1000},
+    "Msc1": {"A100_40GB_PCIe_1x": 10000, "H100_80GB_SXM_8x": 1000},
+}
+
+# The generated endpoints, which describe the arguments each fake handler validates
+SPECS: dict[tuple[str, str], RequestSpec] = {
+    (spec.method.upper(), spec.path): spec
+    for module in (clusters, images, virtual, metal, applications)
+    for spec in vars(module).values()
+    if isinstance(spec, RequestSpec)
+}
+
+# (status, headers, payload) returned by handlers
+Reply = Tuple[int, dict, dict]
+
+
+class FakeError(Exception):
+    """
+    An API error response, raised by handlers.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class FakeAPI:
+    """
+    FakeAPI(capacity=None, hosts=None, provisioning=5.0, stopping=2.0, latency=None, throttle=0.0, retry_after=1, seed=0, clock=time.monotonic)
+
+    A stateful, in-memory stand-in for the Denvr API for load testing orchestration code (e.g.,
+    `waiter`, `WaitGroup` and bulk operations) without the network.
+    Requests are validated against the generated `RequestSpec` for each endpoint, virtual machines
+    and applications move from PENDING to ONLINE (or STOPPING to OFFLINE) after a simulated delay,
+    and creating them consumes the capacity reported by `GetAvailability`.
+    Transitions are evaluated lazily when resources are read, so tens of thousands of resources
+    cost nothing until they're polled.
+
+    It can be used in-process with `Session(config, transport=api.transport())` or over
+    localhost HTTP with `api.serve()`.
+
+    Example:
+
+        api = FakeAPI(provisioning=0.5, throttle=0.01)
+        with api.serve() as server:
+            session = Session(Config(defaults={"server": server.url}, auth=None))
+            ...
+
+    Args:
+        capacity (dict): Slots per configuration per cluster (e.g., `{"Hou1": {"A100_40GB_PCIe_1x": 8}}`).
+        hosts (dict): Number of bare metal hosts per cluster.
+        provisioning (float): Seconds for resources to come ONLINE after being created or started,
+            and for metal hosts to finish rebooting or reprovisioning.
+        stopping (float): Seconds for resources to go OFFLINE after being stopped.
+        latency: Seconds to delay each response by, or a function returning them
+            (e.g., `cassette.lognormal`).
+        throttle (float): Fraction of requests to reject with a 429 response.
+        retry_after (int): The `Retry-After` seconds sent with throttled responses.
+        seed (int): Seed for the throttling decisions, so runs are reproducible.
+        clock (callable): Time source for transitions, in seconds.
+    """
+
+    def __init__(
+        self,
+        capacity: dict | None = None,
+        hosts: dict | None = None,
+        provisioning: float = 5.0,
+        stopping: float = 2.0,
+        latency: float | Callable[[], float] | None = None,
+        throttle: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity if capacity is not None else DEFAULT_CAPACITY
+        self.provisioning = provisioning
+        self.stopping = stopping
+        self.latency = latency
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.clock = clock
+        self.requests = 0
+        self.throttled = 0
+
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._tokens = itertools.count(1)
+        # Slots in use per (cluster, configuration), kept as resources come and go
+        self._usage: dict[tuple[str, str], int] = {}
+        # Resources by cluster then id (and namespace for virtual machines)
+        self.servers: dict[str, dict[tuple, dict]] = {}
+        self.applications: dict[str, dict[str, dict]] = {}
+        self.hosts: dict[str, dict[str, dict]] = {
+            cluster: {
+                f"{cluster.lower()}-host-{i:03d}": _host(
+                    cluster, f"{cluster.lower()}-host-{i:03d}"
+                )
+                for i in range(count)
+            }
+            for cluster, count in (hosts or {}).items()
+        }
+
+        self._routes: dict[tuple[str, str], Callable[[dict], object]] = {
+            ("GET", "/api/v1/clusters/GetAll"): self._get_clusters,
+            ("GET", "/api/v1/servers/images/GetOperatingSystemImages"): self._get_images,
+            ("GET", "/api/v1/servers/virtual/GetServers"): self._get_servers,
+            ("GET", "/api/v1/servers/virtual/GetServer"): self._get_server,
+            ("POST", "/api/v1/servers/virtual/CreateServer"): self._create_server,
+            ("POST", "/api/v1/servers/virtual/StartServer"): self._start_server,
+            ("POST", "/api/v1/servers/virtual/StopServer"): self._stop_server,
+            ("DELETE", "/api/v1/servers/virtual/DestroyServer"): self._destroy_server,
+            ("GET", "/api/v1/servers/virtual/GetConfigurations"): self._get_configurations,
+            ("GET", "/api/v1/servers/virtual/GetAvailability"): self._get_availability,
+            ("GET", "/api/v1/servers/metal/GetHosts"): self._get_hosts,
+            ("GET", "/api/v1/servers/metal/GetHost"): self._get_host,
+            ("POST", "/api/v1/servers/metal/RebootHost"): self._reboot_host,
+            ("POST", "/api/v1/servers/metal/ReprovisionHost"): self._reprovision_host,
+            ("GET", "/api/v1/servers/applications/GetApplications"): self._get_applications,
+            (
+                "GET",
+                "/api/v1/servers/applications/GetApplicationDetails",
+            ): self._get_application_details,
+            ("GET", "/api/v1/servers/applications/GetConfigurations"): self._get_configurations,
+            ("GET", "/api/v1/servers/applications/GetAvailability"): self._get_availability,
+            (
+                "GET",
+                "/api/v1/servers/applications/GetApplicationCatalogItems",
+            ): self._get_catalog_items,
+            (
+                "POST",
+                "/api/v1/servers/applications/CreateCatalogApplication",
+            ): self._create_application,
+            (
+                "POST",
+                "/api/v1/servers/applications/CreateCustomApplication",
+            ): self._create_application,
+            ("POST", "/api/v1/servers/applications/StartApplication"): self._start_application,
+            ("POST", "/api/v1/servers/applications/StopApplication"): self._stop_application,
+            (
+                "DELETE",
+                "/api/v1/servers/applications/DestroyApplication",
+            ): self._destroy_application,
+            ("POST", "/api/TokenAuth/Authenticate"): self._authenticate,
+            ("GET", "/api/TokenAuth/RefreshToken"): self._refresh_token,
+        }
+
+    def handle(self, method: str, url: str, body: bytes | None = None) -> Reply:
+        """
+        Answer a request, returning the (status, headers, payload) of the response.
+        """
+        parts = urlsplit(url)
+        path = re.sub("/+", "/", parts.path)
+        key = (method.upper(), path)
+        args = dict(parse_qsl(parts.query))
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return _error(400, "Invalid JSON body")
+        if not isinstance(payload, dict):
+            return _error(400, "JSON body must be an object")
+        args.update(payload)
+
+        with self._lock:
+            self.requests += 1
+            if self.throttle and self._rng.random() < self.throttle:
+                self.throttled += 1
+                return _error(429, "Too many requests", {"Retry-After": str(self.retry_after)})
+
+            handler = self._routes.get(key)
+            if handler is None:
+                return _error(404, f"No endpoint for {method.upper()} {path}")
+
+            try:
+                spec = SPECS.get(key)
+                if spec is not None:
+                    missing = sorted(k for k in spec.required if args.get(k) is None)
+                    if missing:
+                        raise FakeError(400, f"Missing required arguments {missing}")
+
+                return 200, {}, {"result": handler(args), "success": True}
+            except FakeError as e:
+                return _error(e.status, str(e))
+
+    def delay(self) -> float:
+        """
+        Seconds to delay the next response by.
+        """
+        if callable(self.latency):
+            return max(self.latency(), 0.0)
+        return self.latency or 0.0
+
+    def transport(self) -> FakeTransport:
+        """
+        An adapter answering requests in-process, for `Session(config, transport=...)`.
+        """
+        return FakeTransport(self)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> FakeServer:
+        """
+        Serve the API over HTTP from a background thread, on a free port by default.
+        """
+        return FakeServer(self, host, port)
+
+    # Virtual machines
+
+    def _server(self, cluster, namespace, id) -> dict:
+        try:
+            return self._advance(self.servers[cluster][(namespace, id)])
+        except KeyError:
+            raise FakeError(404, f"Server {id} not found in {cluster}/{namespace}") from None
+
+    def _get_servers(self, args):
+        clusters = [args["Cluster"]] if args.get("Cluster") else list(self.servers)
+        return {
+            "items": [
+                _public(self._advance(vm))
+                for cluster in clusters
+                for vm in self.servers.get(cluster, {}).values()
+            ]
+        }
+
+    def _get_server(self, args):
+        return _public(self._server(args["Cluster"], args["Namespace"], args["Id"]))
+
+    def _create_server(self, args):
+        cluster, configuration = args["cluster"], args["configuration"]
+        namespace = args.get("vpc") or "denvr"
+        id = args.get("name") or f"vm-{next(self._tokens):08d}"
+        if (namespace, id) in self.servers.get(cluster, {}):
+            raise FakeError(400, f"Server {id} already exists in {cluster}/{namespace}")
+
+        self._reserve(cluster, configuration)
+        vm = {
+            "username": "fake@denvrdata.com",
+            "tenancyName": namespace,
+            "rpool": args.get("rpool") or "on-demand",
+            "directAttachedStoragePersisted": bool(args.get("persistStorage")),
+            "id": id,
+            "namespace": namespace,
+            "configuration": configuration,
+            "storage": 1700,
+            "gpuType": "nvidia.com/A100PCIE40GB",
+            "gpus": _gpus(configuration),
+            "vcpus": 14,
+            "memory": 112,
+            "ip": "",
+            "privateIp": "",
+            "image": args.get("operatingSystemImage") or "Ubuntu_22.04.4_LTS",
+            "cluster": cluster,
+            "nodeSelector": args.get("selectedNode") or "",
+            "status": "PENDING",
+            "storageType": "ceph",
+            "rootDiskSize": f"{args.get('rootDiskSize') or 500} GiB",
+            "lastUpdated": _now(),
+        }
+        self._transition(vm, "ONLINE", self.provisioning)
+        self.servers.setdefault(cluster, {})[(namespace, id)] = vm
+        return _public(vm)
+
+    def _start_server(self, args):
+        vm = self._server(args["cluster"], args["namespace"], args["id"])
+        if vm["status"] in ("OFFLINE", "STOPPING"):
+            vm["status"] = "PENDING"
+            self._transition(vm, "ONLINE", self.provisioning)
+        return {k: vm[k] for k in ("id", "namespace", "cluster", "status")}
+
+    def _stop_server(self, args):
+        vm = self._server(args["cluster"], args["namespace"], args["id"])
+        if vm["status"] in ("ONLINE", "PENDING"):
+            vm["status"] = "STOPPING"
+            self._transition(vm, "OFFLINE", self.stopping)
+        return {k: vm[k] for k in ("id", "namespace", "cluster", "status")}
+
+    def _destroy_server(self, args):
+        vm = self._server(args["Cluster"], args["Namespace"], args["Id"])
+        del self.servers[vm["cluster"]][(vm["namespace"], vm["id"])]
+        self._release(vm["cluster"], vm["configuration"])
+        return {"id": vm["id"], "cluster": vm["cluster"], "status": "DELETED"}
+
+    # Capacity
+
+    def _reserve(self, cluster: str, configuration: str):
+        total = self.capacity.get(cluster, {}).get(configuration)
+        if total is None:
+            raise FakeError(400, f"Unknown configuration {configuration} in {cluster}")
+
+        used = self._usage.get((cluster, configuration), 0)
+        if used >= total:
+            raise FakeError(400, f"No capacity left for {configuration} in {cluster}")
+        self._usage[(cluster, configuration)] = used + 1
+
+    def _release(self, cluster: str, configuration: str):
+        self._usage[(cluster, configuration)] -= 1
+
+    def _get_configurations(self, args):
+        names = sorted({name for slots in self.capacity.values() for name in slots})
+        return {"items": [{"name": name, "gpus": _gpus(name)} for name in names]}
+
+    def _get_availability(self, args):
+        cluster = args["cluster"]
+        items = []
+        for configuration, total in self.capacity.get(cluster, {}).items():
+            used = self._usage.get((cluster, configuration), 0)
+            items.append(
+                {
+                    "configuration": configuration,
+                    "cluster": cluster,
+                    "resourcePool": args.get("resourcePool") or "on-demand",
+                    "available": used < total,
+                    "count": total - used,
+                    "maxCount": total,
+                }
+            )
+        return {"items": items}
+
+    # Metal hosts
+
+    def _host(self, cluster, id) -> dict:
+        try:
+            return self._advance(self.hosts[cluster][id])
+        except KeyError:
+            raise FakeError(404, f"Host {id} not found in {cluster}") from None
+
+    def _get_hosts(self, args):
+        clusters = [args["Cluster"]] if args.get("Cluster") else list(self.hosts)
+        return {
+            "items": [
+                _public(self._advance(host))
+                for cluster in clusters
+                for host in self.hosts.get(cluster, {}).values()
+            ]
+        }
+
+    def _get_host(self, args):
+        return _public(self._host(args["Cluster"], args["Id"]))
+
+    def _reboot_host(self, args):
+        host = self._host(args["cluster"], args["id"])
+        host.update(poweredOn=False, operationalStatus="Rebooting")
+        self._transition(host, "Online", self.provisioning, field="operationalStatus")
+        return _public(host)
+
+    def _reprovision_host(self, args):
+        host = self._host(args["cluster"], args["id"])
+        host.update(
+            image=args.get("imageUrl") or host["image"],
+            operationalStatus="Provisioning",
+            provisioningState="Provisioning",
+            poweredOn=False,
+        )
+        self._transition(host, "Online", self.provisioning, field="operationalStatus")
+        return _public(host)
+
+    # Applications
+
+    def _application(self, cluster, id) -> dict:
+        try:
+            return self._advance(self.applications[cluster][id])
+        except KeyError:
+            raise FakeError(404, f"Application {id} not found in {cluster}") from None
+
+    def _get_applications(self, args):
+        return {
+            "items": [
+                _public(self._advance(app))
+                for apps in self.applications.values()
+                for app in apps.values()
+            ]
+        }
+
+    def _get_application_details(self, args):
+        app = _public(self._application(args["Cluster"], args["Id"]))
+        return {
+            "instanceDetails": app,
+            "applicationCatalogItem": {
+                "name": app["applicationCatalogItemName"],
+                "versionName": app["applicationCatalogItemVersionName"],
+            },
+            "hardwarePackage": {"name": app["hardwarePackageName"]},
+        }
+
+    def _get_catalog_items(self, args):
+        return {"items": [{"name": "jupyter-notebook", "versions": [{"name": "python-3.11"}]}]}
+
+    def _create_application(self, args):
+        cluster, package = args["cluster"], args["hardwarePackageName"]
+        id = args["name"]
+        if id in self.applications.get(cluster, {}):
+            raise FakeError(400, f"Application {id} already exists in {cluster}")
+
+        self._reserve(cluster, package)
+        app = {
+            "id": id,
+            "cluster": cluster,
+            "status": "PENDING",
+            "tenant": "denvr",
+            "createdBy": "fake@denvrdata.com",
+            "privateIp": "",
+            "publicIp": "",
+            "resourcePool": args.get("resourcePool") or "on-demand",
+            "dns": f"{id}.{cluster.lower()}.fake.denvrdata.com",
+            "sshUsername": "ubuntu",
+            "applicationCatalogItemName": args.get("applicationCatalogItemName")
+            or args.get("imageUrl"),
+            "applicationCatalogItemVersionName": args.get("applicationCatalogItemVersion")
+            or "",
+            "hardwarePackageName": package,
+            "persistedDirectAttachedStorage": bool(args.get("persistDirectAttachedStorage")),
+            "personalSharedStorage": bool(args.get("personalSharedStorage")),
+            "tenantSharedStorage": bool(args.get("tenantSharedStorage")),
+        }
+        self._transition(app, "ONLINE", self.provisioning)
+        self.applications.setdefault(cluster, {})[id] = app
+        return _public(app)
+
+    def _start_application(self, args):
+        app = self._application(args["cluster"], args["id"])
+        if app["status"] in ("OFFLINE", "STOPPING"):
+            app["status"] = "PENDING"
+            self._transition(app, "ONLINE", self.provisioning)
+        return {"id": app["id"], "cluster": app["cluster"]}
+
+    def _stop_application(self, args):
+        app = self._application(args["cluster"], args["id"])
+        if app["status"] in ("ONLINE", "PENDING"):
+            app["status"] = "STOPPING"
+            self._transition(app, "OFFLINE", self.stopping)
+        return {"id": app["id"], "cluster": app["cluster"]}
+
+    def _destroy_application(self, args):
+        app = self._application(args["Cluster"], args["Id"])
+        del self.applications[app["cluster"]][app["id"]]
+        self._release(app["cluster"], app["hardwarePackageName"])
+        return {"id": app["id"], "cluster": app["cluster"]}
+
+    # Everything else
+
+    def _get_clusters(self, args):
+        return [{"name": name, "region": "fake"} for name in self.capacity]
+
+    def _get_images(self, args):
+        return {"items": [{"name": "Ubuntu_22.04.4_LTS"}, {"name": "Ubuntu_24.04_LTS"}]}
+
+    def _authenticate(self, args):
+        if not args.get("userNameOrEmailAddress") or not args.get("password"):
+            raise FakeError(401, "Invalid username or password")
+        return {
+            "accessToken": f"access-{next(self._tokens)}",
+            "refreshToken": f"refresh-{next(self._tokens)}",
+            "expireInSeconds": 3600,
+            "refreshTokenExpireInSeconds": 86400,
+        }
+
+    def _refresh_token(self, args):
+        if not args.get("refreshToken"):
+            raise FakeError(401, "Invalid refresh token")
+        return {"accessToken": f"access-{next(self._tokens)}", "expireInSeconds": 3600}
+
+    # Transitions
+
+    def _transition(self, resource: dict, status: str, after: float, field: str = "status"):
+        # Record the pending transition, applied the next time the resource is read
+        resource["_next"] = (self.clock() + after, field, status)
+
+    def _advance(self, resource: dict) -> dict:
+        pending = resource.get("_next")
+        if pending is not None and self.clock() >= pending[0]:
+            _, field, status = pending
+            resource[field] = status
+            resource["lastUpdated"] = _now()
+            del resource["_next"]
+            if field == "operationalStatus":
+                resource.update(poweredOn=True, provisioningState="Provisioned")
+            elif status == "ONLINE":
+                resource["privateIp"] = resource["privateIp"] or _ip(resource["id"])
+        return resource
+
+
+class FakeTransport(BaseAdapter):
+    """
+    FakeTransport(api)
+
+    A transport for `Session(config, transport=...)` answering requests from a `FakeAPI`
+    in-process, without touching the network.
+    """
+
+    def __init__(self, api: FakeAPI):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        delay = self.api.delay()
+        if delay:
+            time.sleep(delay)
+
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        status, headers, payload = self.api.handle(request.method, request.url, body)
+        headers = {"Content-Type": "application/json", **headers}
+        return build_response(request, status, headers, json.dumps(payload).encode())
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """
+    FakeServer(api, host="127.0.0.1", port=0)
+
+    Serves a `FakeAPI` over HTTP from a background thread until closed, with its base `url`
+    usable as the `server` config default.
+    """
+
+    def __init__(self, api: FakeAPI, host: str = "127.0.0.1", port: int = 0):
+        self.api = api
+        self.httpd = ThreadingHTTPServer((host, port), _handler(api))
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug("Serving fake Denvr API on %s", self.url)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _handler(api: FakeAPI) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately, which Nagle + delayed ACKs stall by ~40ms
+        disable_nagle_algorithm = True
+
+        def _reply(self):
+            delay = api.delay()
+            if delay:
+                time.sleep(delay)
+
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            status, headers, payload = api.handle(self.command, self.path, body)
+            content = json.dumps(payload).encode()
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return Handler
+
+
+def _error(status: int, message: str, headers: dict | None = None) -> Reply:
+    return status, headers or {}, {"error": {"message": message}, "success": False}
+
+
+def _public(resource: dict) -> dict:
+    # A copy of the resource without our bookkeeping, so callers can't mutate our state
+    return {k: v for k, v in resource.items() if not k.startswith("_")}
+
+
+def _host(cluster: str, id: str) -> dict:
+    return {
+        "id": id,
+        "cluster": cluster,
+        "tenancyName": "denvr",
+        "nodeType": "H100_80GB_SXM_8x",
+        "image": "Ubuntu_22.04.4_LTS",
+        "privateIp": _ip(id),
+        "publicIp": "",
+        "provisionedHostname": id,
+        "operationalStatus": "Online",
+        "poweredOn": True,
+        "provisioningState": "Provisioned",
+    }
+
+
+def _gpus(configuration: str) -> int:
+    match = re.search(r"_(\d+)x$", configuration)
+    return int(match.group(1)) if match else 1
+
+
+def _ip(id: str) -> str:
+    # A stable private address derived from the resource id
+    n = sum(map(ord, id)) * 2654435761 % (1 << 16)
+    return f"172.16.{n >> 8}.{n & 0xFF}"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
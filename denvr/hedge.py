@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+
+from collections import deque
+
+# Latency-critical idempotent lookups which are hedged by default
+HEDGED_PATHS = frozenset(
+    [
+        "/api/v1/servers/applications/GetApplicationDetails",
+        "/api/v1/servers/metal/GetHost",
+        "/api/v1/servers/virtual/GetServer",
+    ]
+)
+
+
+class HedgePolicy:
+    """
+    HedgePolicy(delay=None, quantile=0.95, budget=0.05, paths=HEDGED_PATHS, window=100, min_samples=20)
+
+    An opt-in policy for use with `Session(config, hedge=...)`.
+    A GET to one of `paths` which hasn't completed after `delay` seconds is sent a second time,
+    and whichever response arrives first is used while the other is discarded.
+
+    Without a fixed `delay` the `quantile` of recently observed latencies for the endpoint is used,
+    so only the slowest requests are hedged. No hedges are sent until `min_samples` latencies
+    have been observed for the endpoint.
+
+    The `requests`, `hedges` and `wins` (hedges which beat the original request) counters, along
+    with `win_rate`, are available for monitoring.
+
+    Args:
+        delay (float): Fixed seconds to wait before hedging. Defaults to the observed `quantile`.
+        quantile (float): The latency quantile to hedge after when `delay` isn't set.
+        budget (float): Maximum fraction of extra requests hedging may add (e.g., 0.05 is 5%).
+        paths (set): API paths eligible for hedging.
+        window (int): Number of recent latencies kept per endpoint.
+        min_samples (int): Latencies needed before the observed quantile is used.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        quantile: float = 0.95,
+        budget: float = 0.05,
+        paths=HEDGED_PATHS,
+        window: int = 100,
+        min_samples: int = 20,
+    ):
+        self.fixed_delay = delay
+        self.quantile = quantile
+        self.budget = budget
+        self.paths = frozenset(paths)
+        self.window = window
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def hedgeable(self, method: str, path: str) -> bool:
+        return method.lower() == "get" and path in self.paths
+
+    @property
+    def win_rate(self) -> float:
+        """
+        The fraction of hedges whose response arrived before the original request's.
+        """
+        return self.wins / self.hedges if self.hedges else 0.0
+
+    def delay(self, path: str) -> float | None:
+        """
+        Seconds to wait on a request to `path` before hedging it, or `None` to not hedge (yet).
+        """
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+
+        with self._lock:
+            latencies = sorted(self._latencies.get(path, ()))
+
+        if len(latencies) < self.min_samples:
+            return None
+
+        return latencies[int(self.quantile * (len(latencies) - 1))]
+
+    def record(self, path: str, latency: float):
+        """
+        Record the `latency` of a completed request to `path`.
+        """
+        with self._lock:
+            if path not in self._latencies:
+                self._latencies[path] = deque(maxlen=self.window)
+            self._latencies[path].append(latency)
+
+    def start(self):
+        """
+        Count an original request towards the budget.
+        """
+        with self._lock:
+            self.requests += 1
+
+    def available(self) -> bool:
+        """
+        Whether the budget has room for a hedge, without reserving it.
+        """
+        with self._lock:
+            return self.hedges + 1 <= self.budget * self.requests
+
+    def allow(self) -> bool:
+        """
+        Reserve a hedge if the budget allows for one.
+        """
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+
+            self.hedges += 1
+            return True
+
+    def won(self):
+        """
+        Count a hedge which completed before its original request.
+        """
+        with self._lock:
+            self.wins += 1
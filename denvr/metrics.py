@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import threading
+
+from bisect import bisect_left
+
+from requests import Response
+
+# Upper bounds (in seconds) of the latency histogram buckets, as in Prometheus client defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RequestEvent:
+    """
+    The outcome of one API call sent by a `Session`, passed to `Instrument.after`.
+
+    Attributes:
+        method (str): The uppercase HTTP method.
+        endpoint (str): The API path (e.g., "/api/v1/servers/virtual/GetServer"), without the
+            server or query parameters, so calls to the same endpoint share one series.
+        status (int): The final response status, or `None` if no response was received.
+        elapsed (float): Seconds from sending the request to receiving the final response,
+            including any urllib3 retries and their backoff, but not time spent waiting on the
+            session's `RateLimiter` beforehand.
+        attempts (int): HTTP attempts made, i.e., 1 plus the retries urllib3 made.
+        size (int): Response body bytes, from the `Content-Length` header for streamed responses.
+        error (Exception): The exception raised, if any (including `HTTPError`s for 4xx / 5xx).
+    """
+
+    __slots__ = ("attempts", "elapsed", "endpoint", "error", "method", "size", "status")
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        status: int | None,
+        elapsed: float,
+        attempts: int = 1,
+        size: int = 0,
+        error: BaseException | None = None,
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.size = size
+        self.error = error
+
+    @classmethod
+    def from_response(
+        cls,
+        method: str,
+        endpoint: str,
+        resp: Response | None,
+        elapsed: float,
+        error: BaseException | None = None,
+    ) -> RequestEvent:
+        if resp is None:
+            return cls(method.upper(), endpoint, None, elapsed, error=error)
+
+        retries = getattr(resp.raw, "retries", None)
+        history = getattr(retries, "history", None) or ()
+        if resp._content_consumed:  # type: ignore[attr-defined]
+            size = len(resp.content or b"")
+        else:
+            size = int(resp.headers.get("Content-Length") or 0)
+
+        return cls(
+            method.upper(), endpoint, resp.status_code, elapsed, 1 + len(history), size, error
+        )
+
+    def __repr__(self):
+        return (
+            f"RequestEvent({self.method!r}, {self.endpoint!r}, status={self.status}, "
+            f"elapsed={self.elapsed:.6f}, attempts={self.attempts}, size={self.size})"
+        )
+
+
+class Instrument:
+    """
+    Instrument()
+
+    Hooks observing every API call sent by a `Session(config, instrument=...)`, which
+    subclasses override as needed. Cached and coalesced responses aren't sent, so aren't seen.
+
+    Hooks run on the calling thread (or a hedging / `AsyncSession` worker), so should be quick,
+    thread-safe and not raise.
+    """
+
+    def before(self, method: str, endpoint: str):
+        """
+        Called before sending a request to `endpoint`.
+        """
+
+    def after(self, event: RequestEvent):
+        """
+        Called with the outcome of each request, whether it succeeded or not.
+        """
+
+    def token(self, kind: str, elapsed: float):
+        """
+        Called after the session's `Bearer` auth fetches a token, where `kind` is
+        "authenticate" (the initial login) or "refresh".
+        """
+
+
+class Instruments(Instrument):
+    """
+    Instruments(*instruments)
+
+    Forwards each hook to several instruments in turn (e.g., a `MetricsCollector` and a tracer).
+    """
+
+    def __init__(self, *instruments: Instrument):
+        self.instruments = instruments
+
+    def before(self, method, endpoint):
+        for instrument in self.instruments:
+            instrument.before(method, endpoint)
+
+    def after(self, event):
+        for instrument in self.instruments:
+            instrument.after(event)
+
+    def token(self, kind, elapsed):
+        for instrument in self.instruments:
+            instrument.token(kind, elapsed)
+
+
+class Histogram:
+    """
+    Histogram(buckets=DEFAULT_BUCKETS)
+
+    Counts of observed values per bucket, along with their total `count` and `sum`.
+    Observing is a bisect and a couple of additions, with no samples kept, so memory is fixed.
+    """
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(buckets)
+        # The last count is for values above every bound
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: Histogram):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the `q` quantile (e.g., 0.95) by interpolating within its bucket, like
+        Prometheus' `histogram_quantile`. Values above the last bound report that bound.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+
+        return self.bounds[-1]
+
+
+class MetricsCollector(Instrument):
+    """
+    MetricsCollector(buckets=DEFAULT_BUCKETS)
+
+    An `Instrument` keeping in-memory latency histograms per endpoint, method and status, along
+    with retry, error and response byte counts, plus histograms of auth token fetch times.
+    Use `summary` to find the endpoints dominating your latency, or `prometheus` to export
+    everything in the Prometheus text format.
+
+    Example:
+
+        metrics = MetricsCollector()
+        session = Session(config, instrument=metrics)
+        ...
+        for row in metrics.summary()[:5]:
+            print(row["endpoint"], row["count"], row["p95"], row["total"])
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # (method, endpoint, status) -> [histogram, retries, bytes]
+        self.requests: dict[tuple[str, str, str], list] = {}
+        self.tokens: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def after(self, event):
+        key = (event.method, event.endpoint, str(event.status or "error"))
+        with self._lock:
+            series = self.requests.get(key)
+            if series is None:
+                series = self.requests[key] = [Histogram(self.buckets), 0, 0]
+            series[0].observe(event.elapsed)
+            series[1] += event.attempts - 1
+            series[2] += event.size
+
+    def token(self, kind, elapsed):
+        with self._lock:
+            if kind not in self.tokens:
+                self.tokens[kind] = Histogram(self.buckets)
+            self.tokens[kind].observe(elapsed)
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.tokens.clear()
+
+    def summary(self) -> list[dict]:
+        """
+        Per endpoint (and method) statistics, sorted by the total time spent waiting on them.
+        Errors count calls without a response or with a 4xx / 5xx status.
+        """
+        rows: dict[tuple[str, str], dict] = {}
+        with self._lock:
+            for (method, endpoint, status), (histogram, retries, size) in self.requests.items():
+                row = rows.get((method, endpoint))
+                if row is None:
+                    row = rows[(method, endpoint)] = {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "histogram": Histogram(self.buckets),
+                        "errors": 0,
+                        "retries": 0,
+                        "bytes": 0,
+                    }
+                row["histogram"].merge(histogram)
+                if not status.isdigit() or int(status) >= 400:
+                    row["errors"] += histogram.count
+                row["retries"] += retries
+                row["bytes"] += size
+
+        result = []
+        for row in rows.values():
+            histogram = row.pop("histogram")
+            row.update(
+                count=histogram.count,
+                total=histogram.sum,
+                mean=histogram.sum / histogram.count,
+                p50=histogram.quantile(0.5),
+                p95=histogram.quantile(0.95),
+                p99=histogram.quantile(0.99),
+            )
+            result.append(row)
+
+        return sorted(result, key=lambda row: row["total"], reverse=True)
+
+    def prometheus(self, prefix: str = "denvr") -> str:
+        """
+        Everything collected, in the Prometheus text exposition format (e.g., to serve from a
+        `/metrics` endpoint or write for the node exporter's textfile collector).
+        """
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Denvr API request latency, including retries.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            requests = sorted(self.requests.items())
+            tokens = sorted(self.tokens.items())
+
+            for (method, endpoint, status), (histogram, _, _) in requests:
+                labels = f'method="{method}",endpoint="{endpoint}",status="{status}"'
+                lines.extend(
+                    _histogram(f"{prefix}_request_duration_seconds", labels, histogram)
+                )
+
+            lines.append(f"# HELP {prefix}_request_retries_total Retries made by urllib3.")
+            lines.append(f"# TYPE {prefix}_request_retries_total counter")
+            for (method, endpoint, status), (_, retries, _) in requests:
+                labels = f'method="{method}",endpoint="{endpoint}",status="{status}"'
+                lines.append(f"{prefix}_request_retries_total{{{labels}}} {retries}")
+
+            lines.append(f"# HELP {prefix}_response_bytes_total Response body bytes received.")
+            lines.append(f"# TYPE {prefix}_response_bytes_total counter")
+            for (method, endpoint, status), (_, _, size) in requests:
+                labels = f'method="{method}",endpoint="{endpoint}",status="{status}"'
+                lines.append(f"{prefix}_response_bytes_total{{{labels}}} {size}")
+
+            lines.append(f"# HELP {prefix}_token_duration_seconds Auth token request latency.")
+            lines.append(f"# TYPE {prefix}_token_duration_seconds histogram")
+            for kind, histogram in tokens:
+                lines.extend(
+                    _histogram(f"{prefix}_token_duration_seconds", f'kind="{kind}"', histogram)
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _histogram(name: str, labels: str, histogram: Histogram) -> list[str]:
+    # Prometheus histogram buckets are cumulative, ending with `+Inf`
+    lines = []
+    total = 0
+    for bound, n in zip((*histogram.bounds, "+Inf"), histogram.counts):
+        total += n
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {total}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
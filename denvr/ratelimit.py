@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from requests.exceptions import Timeout
+
+from denvr.utils import remaining
+
+logger = logging.getLogger(__name__)
+
+# Statuses indicating the server wants us to slow down
+THROTTLED_STATUSES = frozenset([429, 503])
+
+
+class TokenBucket:
+    """
+    TokenBucket(rate, burst=None)
+
+    A thread-safe token bucket allowing `rate` requests per second with bursts of up to `burst`.
+
+    Args:
+        rate (float): Tokens added per second.
+        burst (float): Maximum tokens held at once. Defaults to one second's worth (at least 1).
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst if burst else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None):
+        """
+        Block until a token is available and take it.
+
+        Args:
+            timeout (float): Maximum seconds to wait. A `Timeout` is raised straight away, without
+                taking a token, if one won't be available in time.
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+
+            if end is not None and now + delay > end:
+                raise Timeout(f"Rate limited for {delay:.3f}s, beyond the request deadline")
+            time.sleep(delay)
+
+    def release(self):
+        """
+        Return a token taken by `acquire` that went unused (e.g., a later budget timed out).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def adjust(self, rate: float):
+        """
+        Change the `rate`, crediting the tokens accrued at the old rate first.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for `seconds` (e.g., from a `Retry-After` header).
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    RateLimiter(rate=10, burst=None, endpoints=None, min_rate=0.1, increase=0.1, decrease=0.5)
+
+    Paces outgoing requests with a global token bucket and optional per-endpoint buckets,
+    shared by every thread using the `Session`.
+    Rates adapt AIMD-style: each throttled response (429/503) multiplies the affected rates by
+    `decrease` and honors any `Retry-After`, while each successful response adds `increase`
+    requests per second back, up to the configured rates.
+
+    Args:
+        rate (float): Global requests per second.
+        burst (float): Global burst size. Defaults to one second's worth of requests.
+        endpoints (dict): Optional mapping of API paths to their own requests per second.
+        min_rate (float): Lower bound when decreasing rates.
+        increase (float): Requests per second added back for each successful response.
+        decrease (float): Factor applied to rates for each throttled response.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: float | None = None,
+        endpoints: dict[str, float] | None = None,
+        min_rate: float = 0.1,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.throttled = 0
+        self._bucket = TokenBucket(rate, burst)
+        self._buckets = {path: TokenBucket(r) for path, r in (endpoints or {}).items()}
+        self._max_rates = {"": rate, **(endpoints or {})}
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """
+        The current global rate in requests per second.
+        """
+        return self._bucket.rate
+
+    def acquire(self, path: str):
+        """
+        Block until a request to `path` fits within the global and endpoint budgets, raising a
+        `Timeout` if that would take longer than is left before the current `deadline`.
+        """
+        self._bucket.acquire(remaining())
+        bucket = self._buckets.get(path)
+        if bucket is None:
+            return
+
+        try:
+            bucket.acquire(remaining())
+        except Timeout:
+            # The request won't be sent, so don't let it use up the global budget
+            self._bucket.release()
+            raise
+
+    def feedback(self, path: str, status: int, retry_after: float | None = None, retries=0):
+        """
+        Adapt the rates given the final `status` of a request to `path`, any `Retry-After`
+        delay and the number of throttled `retries` already made for it.
+        """
+        throttled = retries + (1 if status in THROTTLED_STATUSES else 0)
+        buckets = [("", self._bucket)]
+        if path in self._buckets:
+            buckets.append((path, self._buckets[path]))
+
+        # Our lock keeps concurrent updates from being lost, while `adjust` takes the bucket's
+        # lock, so waiting threads never see a rate change part way through a refill
+        with self._lock:
+            self.throttled += throttled
+            for key, bucket in buckets:
+                if throttled:
+                    bucket.adjust(max(self.min_rate, bucket.rate * self.decrease**throttled))
+                else:
+                    bucket.adjust(min(self._max_rates[key], bucket.rate + self.increase))
+
+        if throttled:
+            logger.debug("Throttled on %s, reducing rate to %.2f/s", path, self.rate)
+            if retry_after:
+                for _, bucket in buckets:
+                    bucket.pause(retry_after)
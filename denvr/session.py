@@ -1,47 +1,645 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
 import logging
+import socket
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, BaseAdapter, HTTPAdapter
+from requests.exceptions import Timeout
+from urllib3.connection import HTTPConnection
+from urllib3.util.timeout import Timeout as TimeoutSauce
 
-from denvr.config import Config
-from denvr.utils import snakecase, raise_for_status, retry
+from denvr.auth import identity
+from denvr.breaker import CircuitBreaker
+from denvr.cache import ResponseCache, cache_key
+from denvr.cassette import Recorder
+from denvr.config import Config, config, load
+from denvr.decoder import decode
+from denvr.hedge import HedgePolicy
+from denvr.metrics import Instrument, MetricsCollector, RequestEvent
+from denvr.ratelimit import RateLimiter
+from denvr.stream import ItemParser
+from denvr.utils import (
+    DeadlineTimeout,
+    deadline,
+    deadline_at,
+    expiry,
+    normalize,
+    raise_for_status,
+    remaining,
+    retry,
+    retry_after,
+    throttled_retries,
+)
+from denvr.views import view
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the response body at a time when streaming list items
+STREAM_CHUNK_SIZE = 65536
+
+# Idempotent methods whose concurrent identical requests can share one HTTP call
+COALESCED_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+# Process-wide registry of shared sessions keyed by (config path, server, credentials identity,
+# defaults)
+_sessions: dict[tuple[str, str, str, str], Session] = {}
+_sessions_lock = threading.Lock()
+
 
 class Session:
     """
-    Session(config: Config)
+    Session(config: Config, cache=None, coalesce=None, limiter=None, hedge=None, breaker=None, transport=None, instrument=None)
 
     Handles authentication and HTTP requests to Denvr's API.
+    An optional `ResponseCache` enables conditional-GET caching of catalog-style endpoints.
+    With `coalesce` enabled, concurrent identical GET requests share a single in-flight HTTP call,
+    each caller receiving an independent copy of the result.
+    An optional `RateLimiter` paces outgoing requests, adapting to 429 / `Retry-After` responses.
+    An optional `HedgePolicy` re-sends slow latency-critical GETs, using whichever response
+    arrives first.
+    An optional `CircuitBreaker` fails fast with a `CircuitOpenError` for endpoints (per cluster)
+    which are persistently failing.
+
+    Requests to the configured server go through a `PoolAdapter` sized by the `pool_connections`,
+    `pool_maxsize`, `pool_block` and `keepalive` config defaults, available as `adapter` for
+    monitoring pool utilization.
+    A custom `transport` adapter (e.g., a `cassette.Recorder` or `cassette.Player`) replaces it for
+    recording or replaying traffic, with a `Recorder` sending through the `PoolAdapter` itself.
+
+    An optional `Instrument` (e.g., a `metrics.MetricsCollector`, the default with the `metrics`
+    config default) is called before and after every request sent, and on auth token fetches.
+
+    Each request uses the (connect, read) timeouts from `Config.timeout` for its endpoint
+    unless a `timeout` is passed. The `deadline` config default, or a `deadline` keyword argument,
+    bounds the total seconds a call may take across retries and backoff.
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        cache: ResponseCache | None = None,
+        coalesce: bool | None = None,
+        limiter: RateLimiter | None = None,
+        hedge: HedgePolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        transport: BaseAdapter | None = None,
+        instrument: Instrument | None = None,
+    ):
         self.config = config
+        self.transport = transport
         self.session = requests.Session()
+        self.coalesce = self.config.coalesce if coalesce is None else coalesce
+        self._local = threading.local()
+        self._flights: dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+
+        # Use a default response cache if the config asks for one
+        if cache is None and self.config.cache_ttl:
+            cache = ResponseCache(ttl=self.config.cache_ttl, path=self.config.cache_path)
+        self.cache = cache
+
+        # Likewise for a rate limiter shared by all threads using this session
+        if limiter is None and self.config.rate_limit:
+            limiter = RateLimiter(rate=self.config.rate_limit)
+        self.limiter = limiter
 
-        # Set the auth, header and retry strategy for the session object
+        if breaker is None and self.config.breaker:
+            breaker = CircuitBreaker(
+                failure_rate=self.config.breaker_failure_rate,
+                cooldown=self.config.breaker_cooldown,
+            )
+        self.breaker = breaker
+
+        # Hedged attempts run on a worker pool, so the caller can wait on whichever finishes first
+        if hedge is None and self.config.hedge:
+            hedge = HedgePolicy(
+                delay=self.config.hedge_delay or None, budget=self.config.hedge_budget
+            )
+        self.hedge = hedge
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=self.config.pool_maxsize, thread_name_prefix="denvr")
+            if hedge is not None
+            else None
+        )
+
+        if instrument is None and self.config.metrics:
+            instrument = MetricsCollector()
+        self.instrument = instrument
+        # Token fetches happen inside the auth, so it reports them to the instrument directly
+        # until the session is closed
+        self._instruments = (
+            getattr(self.config.auth, "instruments", None) if instrument is not None else None
+        )
+        if self._instruments is not None:
+            self._instruments.append(instrument)
+
+        # Set the auth, header, connection pool and retry strategy for the session object
         self.session.auth = self.config.auth
         self.session.headers.update({"Content-Type": "application/json"})
-        if self.config.retries:
-            self.session.mount(
-                self.config.server, HTTPAdapter(max_retries=retry(retries=self.config.retries))
-            )
+        self._mount(_adapter(self.config))
+
+    def _mount(self, adapter: PoolAdapter):
+        # Route requests to the server through the pool adapter, or a transport wrapping it
+        self.adapter = adapter
+        if isinstance(self.transport, Recorder):
+            self.transport.adapter = adapter
+        self.session.mount(self.config.server, self.transport or adapter)
 
     def request(self, method, path, **kwargs):
         url = "/".join([self.config.server, *filter(None, path.split("/"))])
+        budget = kwargs.pop("deadline", self.config.deadline)
         logger.debug("Request: self.session.request(%s, %s, **%s", method, url, kwargs)
-        resp = self.session.request(method, url, **kwargs)
-        raise_for_status(resp)
-        result = resp.json()
-        logger.debug("Response: resp.json() -> %s", result)
+        with deadline(budget):
+            if self.coalesce and method.upper() in COALESCED_METHODS:
+                result = self._coalesced(method, path, url, **kwargs)
+            else:
+                result = self._fetch(method, path, url, **kwargs)
+        logger.debug("Response: decode(resp) -> %s", result)
 
         # According to the spec we should just be return result and not {"result": result }?
         # For mock-server testing purposes we'll support both.
         result = result.get("result", result) if isinstance(result, dict) else result
 
-        # Standardize the response keys to snakecase if it's a dict'
-        if isinstance(result, dict):
-            return {snakecase(k): v for k, v in result.items()}
+        return self.normalize(result)
+
+    def iter_items(self, method, path, key="items", **kwargs):
+        """
+        Stream a list response (e.g., `{"items": [...]}`), yielding each item of its `key` list
+        as soon as it has been received rather than after the whole response.
+        Items are normalized like `request` results. Caching, coalescing and hedging don't apply.
+        """
+        for batch in self._iter_batches(method, path, key, **kwargs):
+            yield from batch
+
+    def _iter_batches(self, method, path, key="items", **kwargs):
+        # Yields the items completed by each chunk of the response body
+        url = "/".join([self.config.server, *filter(None, path.split("/"))])
+        budget = kwargs.pop("deadline", self.config.deadline)
+        logger.debug("Stream: self.session.request(%s, %s, **%s", method, url, kwargs)
+        with deadline(budget):
+            resp = self._send(method, path, url, stream=True, **kwargs)
+
+        try:
+            parser = ItemParser(key)
+            for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                items = parser.feed(chunk)
+                if items:
+                    yield [self.normalize(item) for item in items]
+                if parser.done:
+                    break
+
+            if not parser.found:
+                logger.debug("No %s list found in the response from %s", key, url)
+        finally:
+            resp.close()
+
+    def normalize(self, result):
+        """
+        Standardize the keys of a decoded result to snakecase, as `request` does
+        (e.g., for list items which should match their single resource getter).
+        """
+        if self.config.response_views:
+            return view(result)
+
+        return normalize(result, nested=self.config.normalize_nested)
+
+    def _fetch(self, method, path, url, **kwargs):
+        if self.cache is not None and self.cache.cacheable(method, path):
+            return self._cached(method, path, url, **kwargs)
+
+        if self.hedge is not None and self.hedge.hedgeable(method, path):
+            return decode(self._hedged(method, path, url, **kwargs))
+
+        return decode(self._send(method, path, url, **kwargs))
+
+    def _hedged(self, method, path, url, **kwargs):
+        assert self.hedge is not None and self._hedge_executor is not None
+        hedge = self.hedge
+        # Workers share the caller's absolute deadline, so a hedge sent after `delay` can't outlast it
+        expires = expiry()
+
+        running = threading.Event()
+
+        def attempt():
+            start = time.monotonic()
+            running.set()
+            with deadline_at(expires):
+                resp = self._send(method, path, url, **kwargs)
+            hedge.record(path, time.monotonic() - start)
+            return resp
+
+        hedge.start()
+        delay = hedge.delay(path)
+        if delay is None or not hedge.available():
+            # Nothing will be raced against it, so keep the original off the worker pool
+            return attempt()
+
+        # The caller waits on whichever attempt finishes first, so the original needs a worker too
+        futures = [self._hedge_executor.submit(attempt)]
+        # Time the delay from when the original starts, as time queued for a busy worker isn't
+        # the endpoint being slow and hedging it would only add to the queue
+        running.wait(remaining())
+        done, _ = wait(futures, timeout=delay)
+        if not done and hedge.allow():
+            logger.debug("Hedging %s %s after %.3f seconds", method, url, delay)
+            futures.append(self._hedge_executor.submit(attempt))
+
+        # Use the first successful response, discarding the other
+        error = None
+        for future in as_completed(futures):
+            if future.exception() is None:
+                if future is not futures[0]:
+                    hedge.won()
+                for other in futures:
+                    other.cancel()
+                resp = future.result()
+                self._local.retry_after = retry_after(resp)
+                return resp
+
+            error = error or future.exception()
+
+        assert error is not None
+        raise error
+
+    def _coalesced(self, method, path, url, **kwargs):
+        # Identical requests already in flight share the leader's result rather than sending their own
+        key = json.dumps([method.upper(), url, kwargs], sort_keys=True, default=str)
+        with self._flights_lock:
+            leader = key not in self._flights
+            if leader:
+                self._flights[key] = _Flight()
+            flight = self._flights[key]
+            if not leader:
+                flight.followers += 1
+
+        if leader:
+            try:
+                flight.result = self._fetch(method, path, url, **kwargs)
+            except BaseException as e:  # noqa: BLE001
+                # Not swallowed: it's re-raised below for the leader and handed to every follower.
+                # Including interrupts, so followers never mistake a failed flight for a result
+                flight.error = e
+            finally:
+                with self._flights_lock:
+                    del self._flights[key]
+                flight.done.set()
+        else:
+            logger.debug("Coalescing %s %s with an in-flight request", method, url)
+            # The leader's deadline may be later than ours, so don't wait past our own
+            if not flight.done.wait(remaining()):
+                raise Timeout(f"Deadline exceeded waiting on an in-flight request to {url}")
+
+        if flight.error is not None:
+            raise flight.error
+
+        # Each caller gets their own copy if it was shared, so mutating a response is safe
+        return copy.deepcopy(flight.result) if flight.followers else flight.result
+
+    def _send(self, method, path, url, **kwargs):
+        # Waiting on our own rate limiter isn't the endpoint's latency, so isn't timed
+        if self.limiter is not None:
+            self.limiter.acquire(path)
+
+        instrument = self.instrument
+        if instrument is None:
+            return self._transmit(method, path, url, **kwargs)
+
+        instrument.before(method, path)
+        start = time.perf_counter()
+        try:
+            resp = self._transmit(method, path, url, **kwargs)
+        except BaseException as e:
+            elapsed = time.perf_counter() - start
+            # `HTTPError`s still carry the response, for its status and size
+            resp = getattr(e, "response", None)
+            instrument.after(RequestEvent.from_response(method, path, resp, elapsed, e))
+            raise
+
+        elapsed = time.perf_counter() - start
+        instrument.after(RequestEvent.from_response(method, path, resp, elapsed))
+        return resp
+
+    def _transmit(self, method, path, url, **kwargs):
+        timeout = kwargs.pop("timeout", None) or self.config.timeout(path)
+        left = remaining()
+        if left is not None:
+            # Don't let a single attempt outlive the deadline either
+            if left <= 0:
+                raise Timeout(f"Deadline exceeded before requesting {url}")
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            timeout = (min(connect or left, left), min(read or left, left))
+
+        if self.breaker is None:
+            resp = self.session.request(method, url, timeout=timeout, **kwargs)
+        else:
+            key = self.breaker.key(path, kwargs)
+            self.breaker.before(key)
+            try:
+                resp = self.session.request(method, url, timeout=timeout, **kwargs)
+            except BaseException:
+                self.breaker.record(key, success=False)
+                raise
+            self.breaker.record(key, success=resp.status_code < 500)
+
+        self._local.retry_after = retry_after(resp)
+        if self.limiter is not None:
+            self.limiter.feedback(
+                path, resp.status_code, self._local.retry_after, retries=throttled_retries(resp)
+            )
+
+        raise_for_status(resp)
+        return resp
+
+    def _cached(self, method, path, url, **kwargs):
+        assert self.cache is not None
+        # Scoped to the account, so sessions for different credentials sharing a cache are isolated
+        key = cache_key(url, kwargs.get("params"), getattr(self.config.auth, "identity", ""))
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            self.cache.record(hit=True)
+            return copy.deepcopy(entry.content)
+
+        if entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.headers()}
+
+        resp = self._send(method, path, url, **kwargs)
+        if entry is not None and resp.status_code == 304:
+            logger.debug("Cached response for %s is still valid", url)
+            self.cache.record(hit=True, revalidated=True)
+            return copy.deepcopy(entry.content)
+
+        self.cache.record(hit=False)
+        content = decode(resp)
+        self.cache.put(key, content, resp.headers)
+        return copy.deepcopy(content)
+
+    def retry_after(self):
+        """
+        The `Retry-After` delay in seconds from the last response received by this thread, if any.
+        """
+        return getattr(self._local, "retry_after", None)
+
+    def close(self):
+        """
+        Close the underlying connection pool and stop reporting token fetches to the instrument.
+        """
+        if self._instruments is not None:
+            self._instruments.remove(self.instrument)
+            self._instruments = None
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.session.close()
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    PoolAdapter(pool_connections=10, pool_maxsize=10, max_retries=0, pool_block=False, keepalive=0)
+
+    An `HTTPAdapter` which tracks connection pool utilization and optionally enables TCP
+    keep-alive probes, so idle pooled connections aren't silently dropped by NATs / load balancers.
+
+    The `requests` (total sent), `active` (currently in flight), `peak` (most in flight at once)
+    and `saturated` (sent while every pooled connection was busy) counters, along with the
+    `connections` property, help with sizing `pool_maxsize`. A non-zero `saturated` count
+    means requests blocked (`pool_block=True`) or opened connections which were then discarded.
+
+    Args:
+        keepalive (int): Seconds a connection is idle before sending TCP keep-alive probes.
+            Defaults to 0, leaving the OS defaults (usually no probes).
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        max_retries=0,
+        pool_block=False,
+        keepalive=0,
+    ):
+        self.keepalive = keepalive
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self.saturated = 0
+        self._counter_lock = threading.Lock()
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if getattr(self, "keepalive", 0):
+            pool_kwargs["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                *_keepalive_options(self.keepalive),
+            ]
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    @property
+    def connections(self) -> int:
+        """
+        The number of connections opened across all of this adapter's pools.
+        """
+        pools = self.poolmanager.pools
+        return sum(pool.num_connections for pool in map(pools.get, pools.keys()) if pool)
+
+    def send(self, request, *args, **kwargs):
+        if remaining() is not None:
+            # Re-clamp the timeouts to the deadline for each attempt urllib3 makes, not just the first
+            connect, read = _timeouts(kwargs.get("timeout"))
+            kwargs["timeout"] = DeadlineTimeout(connect=connect, read=read)
+
+        with self._counter_lock:
+            self.requests += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            if self.active > self.pool_maxsize:
+                self.saturated += 1
+
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            with self._counter_lock:
+                self.active -= 1
+
+
+def _timeouts(timeout) -> tuple:
+    # The (connect, read) pair from a requests style timeout
+    if isinstance(timeout, TimeoutSauce):
+        return timeout._connect, timeout._read
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+def _adapter(config: Config, maxsize: int | None = None) -> PoolAdapter:
+    # Applied regardless of retries, so pool sizing and keep-alive are always honored
+    return PoolAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=maxsize if maxsize else config.pool_maxsize,
+        max_retries=retry(retries=config.retries) if config.retries else 0,
+        pool_block=config.pool_block,
+        keepalive=config.keepalive,
+    )
+
+
+def _keepalive_options(idle: int) -> list[tuple[int, int, int]]:
+    # TCP_KEEPIDLE is named TCP_KEEPALIVE on macOS, and neither may exist on other platforms
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    keepidle = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+    if keepidle is not None:
+        options.append((socket.IPPROTO_TCP, keepidle, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
 
-        return result
+
+class _Flight:
+    # The shared outcome of an in-flight request
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class AsyncSession:
+    """
+    AsyncSession(config: Config, max_connections: int | None = None, transport=None, instrument=None,
+                 cache=None, coalesce=None, limiter=None, hedge=None, breaker=None)
+
+    An asyncio counterpart to `Session` for use with the generated `AsyncClient` classes.
+    Requests are dispatched through a regular `Session` on a bounded worker pool, so URL building,
+    error handling and response normalization are identical, while at most `max_connections`
+    (default: the config's `pool_maxsize`) requests are in flight (and pooled) at any one time.
+    The remaining arguments are passed through to the `Session`.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        max_connections: int | None = None,
+        transport: BaseAdapter | None = None,
+        instrument: Instrument | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool | None = None,
+        limiter: RateLimiter | None = None,
+        hedge: HedgePolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        max_connections = max_connections or config.pool_maxsize
+        self.session = Session(
+            config,
+            cache=cache,
+            coalesce=coalesce,
+            limiter=limiter,
+            hedge=hedge,
+            breaker=breaker,
+            transport=transport,
+            instrument=instrument,
+        )
+        self.session._mount(_adapter(config, max_connections))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="denvr"
+        )
+
+    @property
+    def config(self) -> Config:
+        return self.session.config
+
+    async def request(self, method, path, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: self.session.request(method, path, **kwargs)
+        )
+
+    async def iter_items(self, method, path, key="items", **kwargs):
+        """
+        An async generator counterpart to `Session.iter_items`.
+        The response is read on the worker pool, a chunk at a time.
+        """
+        loop = asyncio.get_running_loop()
+        batches = self.session._iter_batches(method, path, key, **kwargs)
+        try:
+            while True:
+                batch = await loop.run_in_executor(self._executor, next, batches, None)
+                if batch is None:
+                    return
+                for item in batch:
+                    yield item
+        finally:
+            # Release the connection if the consumer stops early
+            await loop.run_in_executor(self._executor, batches.close)
+
+    def close(self):
+        """
+        Shutdown the worker pool and close the underlying connection pool.
+        """
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+def shared_session(path=None) -> Session:
+    """
+    shared_session(path=None)
+
+    Returns the process-wide Session for the config file at `path` (or `DENVR_CONFIG`),
+    constructing it on first use. Sessions are keyed by the config path, credentials identity
+    and every config default (server, retries, timeouts, pool sizes, etc.), so every client built
+    from the same config shares one connection pool and one auth token, while editing the config
+    file gets a Session built from the new settings.
+    """
+    config_path, content = load(path)
+    defaults = content.get("defaults", {})
+    key = (
+        config_path,
+        defaults.get("server", "https://api.cloud.denvrdata.com"),
+        identity(content.get("credentials", {})),
+        json.dumps(defaults, sort_keys=True, default=str),
+    )
+
+    # Hold the lock while constructing, so concurrent callers share one Session (and so one auth
+    # token and connection pool) rather than each building their own
+    with _sessions_lock:
+        if key not in _sessions:
+            logger.debug("Creating shared session for %s (%s)", key[0], key[1])
+            _sessions[key] = Session(config(config_path))
+
+        return _sessions[key]
+
+
+def invalidate(path=None):
+    """
+    invalidate(path=None)
+
+    Drop and close the shared sessions for a config file path, or all of them when
+    `path` is `None`, stopping any background token refresh for their auth.
+    The next `shared_session` call will re-read the config and re-authenticate.
+    """
+    with _sessions_lock:
+        for key in list(_sessions):
+            if path is None or key[0] == path:
+                session = _sessions.pop(key)
+                session.close()
+                # Shared sessions own their auth, which isn't closed with the session
+                close = getattr(session.config.auth, "close", None)
+                if close is not None:
+                    close()
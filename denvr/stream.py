@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import re
+
+from typing import Any
+
+from denvr.decoder import loads
+
+# Complete strings, structural characters, or the opening quote of a string that's still incomplete
+_TOKENS = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"', re.DOTALL)
+# Everything up to the next structural character, skipping over complete strings
+_SKIP = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL)
+_KEY = re.compile(rb"\s*:\s*\[")
+_SEPARATORS = re.compile(rb"[\s,]*")
+_SCALAR_END = re.compile(rb"[\s,\]]")
+_QUOTE = ord('"')
+_CLOSE = ord("]")
+_OPEN = b"[{"
+
+
+class ItemParser:
+    """
+    ItemParser(key="items")
+
+    Incrementally extracts the elements of the first `key` array in a JSON document
+    (e.g., `{"result": {"items": [...]}}`) as its bytes are fed in, so each element can be
+    decoded and used before the rest of the document has arrived.
+    Elements are only scanned for their boundaries, then those completed by each chunk are
+    decoded together with `denvr.decoder.loads`.
+
+    Example:
+
+        parser = ItemParser()
+        for chunk in resp.iter_content(65536):
+            for item in parser.feed(chunk):
+                print(item["id"])
+    """
+
+    def __init__(self, key: str = "items"):
+        self.key = key.encode()
+        self.found = False
+        self.done = False
+        self._buf = bytearray()
+        self._pos = 0
+        # Nesting depth within the document while seeking, then within the current element
+        self._depth = 0
+        self._start: int | None = None
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Add the next `chunk` of the document, returning any elements it completed.
+        """
+        if self.done:
+            return []
+
+        self._buf += chunk
+        items = self._parse()
+
+        # Drop whatever we've already consumed, keeping any partial element
+        keep = self._pos if self._start is None else self._start
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._start is not None:
+                self._start -= keep
+
+        return items
+
+    def _parse(self) -> list[Any]:
+        if not self.found and not self._seek():
+            return []
+
+        buf = self._buf
+        first = last = None
+        while True:
+            if self._start is None:
+                # Between elements of the array
+                self._pos = _SEPARATORS.match(buf, self._pos).end()  # type: ignore[union-attr]
+                if self._pos >= len(buf):
+                    break
+                if buf[self._pos] == _CLOSE:
+                    self.done = True
+                    break
+
+                self._start = self._pos
+
+            if buf[self._start] in _OPEN or buf[self._start] == _QUOTE:
+                end = self._element()
+                if end is None:
+                    break
+            else:
+                # Numbers, booleans and nulls end at the next separator
+                match = _SCALAR_END.search(buf, self._start)
+                if match is None:
+                    break
+                end = match.start()
+
+            if first is None:
+                first = self._start
+            last = end
+            self._start = None
+            self._pos = end
+
+        if first is None:
+            return []
+
+        # Only separators lie between the completed elements, so decode them as one array
+        return loads(b"[" + buf[first:last] + b"]")
+
+    def _seek(self) -> bool:
+        # Scan for the `key` array, returning False if we need more data
+        buf = self._buf
+        for match in _TOKENS.finditer(buf, self._pos):
+            start, end = match.span()
+            if buf[start] == _QUOTE:
+                if end - start == 1:
+                    # The string is incomplete
+                    self._pos = start
+                    return False
+
+                if buf[start + 1 : end - 1] == self.key:
+                    key = _KEY.match(buf, end)
+                    if key is None and not buf[end:].strip(b" \t\r\n:"):
+                        # The separator may still be on its way
+                        self._pos = start
+                        return False
+                    if key is not None:
+                        self.found = True
+                        self._depth = 0
+                        self._pos = key.end()
+                        return True
+            elif buf[start] in _OPEN:
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth <= 0:
+                    # The document ended without the key
+                    self.done = True
+                    self._pos = end
+                    return False
+
+        self._pos = len(buf)
+        return False
+
+    def _element(self) -> int | None:
+        # The index after the object, array or string starting at `_start`, or None if it's incomplete
+        buf = self._buf
+        if buf[self._start] == _QUOTE:  # type: ignore[index]
+            match = _TOKENS.match(buf, self._start)  # type: ignore[arg-type]
+            if match is None or match.end() - match.start() == 1:
+                return None
+            self._pos = match.end()
+            return self._pos
+
+        # Jump between structural characters, as only they can change the depth
+        depth, pos, size = self._depth, self._pos, len(buf)
+        while True:
+            pos = _SKIP.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos >= size or buf[pos] == _QUOTE:
+                # Out of data, possibly part way through a string
+                self._pos, self._depth = pos, depth
+                return None
+
+            depth += 1 if buf[pos] in _OPEN else -1
+            pos += 1
+            if depth == 0:
+                self._pos, self._depth = pos, 0
+                return pos
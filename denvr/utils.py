@@ -1,12 +1,36 @@
+import functools
 import logging
+import threading
+import time
 import typing
 
+from contextlib import contextmanager
+
+from urllib3.exceptions import InvalidHeader, MaxRetryError, ResponseError
 from urllib3.util.retry import Retry
+from urllib3.util.timeout import Timeout
 from requests import JSONDecodeError, HTTPError, Response
 
+from denvr.decoder import decode
+
 logger = logging.getLogger(__name__)
 
+# Per-thread deadline (monotonic time) bounding retries, see `deadline`
+_local = threading.local()
+
+# Retrying with less time than this left before the deadline is pointless
+MIN_ATTEMPT_TIME = 0.05
+
+
+# Fields holding user data keyed by arbitrary names (e.g., `HF_TOKEN`) rather than API objects,
+# whose keys are kept as is when converting nested keys
+USER_KEYED_FIELDS = frozenset(
+    {"environment_variables", "user_scripts", "labels", "annotations", "tags"}
+)
 
+
+# API keys come from a small fixed vocabulary, so conversions are memoized
+@functools.lru_cache(maxsize=4096)
 def snakecase(text: str) -> str:
     """
     Convert camelcase and titlecase strings to snakecase.
@@ -20,11 +44,64 @@ def snakecase(text: str) -> str:
     return "".join(["_" + i.lower() if i.isupper() else i for i in text]).lstrip("_")
 
 
+def normalize(content: typing.Any, nested: bool = False) -> typing.Any:
+    """
+    Convert the keys of a decoded response to snakecase.
+
+    Args:
+        content: The decoded response.
+        nested (bool): Whether to convert the keys of every dict within `content`
+            (e.g., each item in `items`) rather than just the top level.
+            The values of `USER_KEYED_FIELDS` (e.g., `environmentVariables`) are left as is.
+
+    Returns:
+        A copy of `content` with converted keys.
+    """
+    if not isinstance(content, (dict, list)):
+        return content
+
+    if not nested:
+        if isinstance(content, dict):
+            return {snakecase(k): v for k, v in content.items()}
+        return content
+
+    # Walk the structure iteratively, filling each copied container in place, so deep
+    # responses don't hit the recursion limit.
+    result: typing.Any = {} if isinstance(content, dict) else []
+    stack = [(content, result)]
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for k, v in items:
+            if isinstance(dst, dict):
+                k = snakecase(k)
+                if k in USER_KEYED_FIELDS:
+                    dst[k] = v
+                    continue
+
+            if isinstance(v, dict):
+                child: typing.Any = {}
+                stack.append((v, child))
+            elif isinstance(v, list):
+                child = []
+                stack.append((v, child))
+            else:
+                child = v
+
+            if isinstance(dst, dict):
+                dst[k] = child
+            else:
+                dst.append(child)
+
+    return result
+
+
 # We'll disable mypy for this function since we're largely trying to match the requests code.
 @typing.no_type_check
 def raise_for_status(resp: Response):
     """
     Given a response object return either resp.json() or resp.json()["error"].
+    The body is decoded with `denvr.decoder.decode`, so callers reuse the decoded content.
     This is basically just a modified version of
     https://requests.readthedocs.io/en/latest/_modules/requests/models/#Response.raise_for_status
 
@@ -53,7 +130,7 @@ def raise_for_status(resp: Response):
 
     details = ""
     try:
-        details = " - {}".format(resp.json()["error"]["message"])
+        details = " - {}".format(decode(resp)["error"]["message"])
     except JSONDecodeError:
         logger.debug("Failed to decode JSON response")
     except KeyError:
@@ -69,6 +146,43 @@ def raise_for_status(resp: Response):
         raise HTTPError(msg, response=resp)
 
 
+def retry_after(resp: Response) -> typing.Optional[float]:
+    """
+    Extract the `Retry-After` header from a response in seconds.
+
+    Args:
+        resp (Response): The request response object.
+
+    Returns:
+        The number of seconds the server asked us to wait, or `None` if absent or invalid.
+    """
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        # Handles both delay-seconds and HTTP-date formats
+        return Retry(0).parse_retry_after(value)
+    except InvalidHeader:
+        logger.debug("Failed to parse Retry-After header %s", value)
+        return None
+
+
+def throttled_retries(resp: Response) -> int:
+    """
+    Count the retries urllib3 already made for a response due to 429 or 503 statuses.
+
+    Args:
+        resp (Response): The request response object.
+
+    Returns:
+        The number of throttled attempts before this response.
+    """
+    retries = getattr(resp.raw, "retries", None)
+    history = getattr(retries, "history", None) or ()
+    return sum(1 for h in history if h.status in (429, 503))
+
+
 def retry(retries: int = 3, idempotent_only: bool = True):
     """
     Generates a reasonable default Retry object for use with the requests library
@@ -85,7 +199,7 @@ def retry(retries: int = 3, idempotent_only: bool = True):
     if not idempotent_only:
         allowed_methods.extend(["POST", "PATCH"])
 
-    return Retry(
+    return DeadlineRetry(
         total=retries,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
@@ -95,3 +209,105 @@ def retry(retries: int = 3, idempotent_only: bool = True):
         raise_on_redirect=False,
         raise_on_status=False,
     )
+
+
+class DeadlineRetry(Retry):
+    """
+    A `Retry` which also gives up once the next backoff (or `Retry-After`) delay would leave less
+    than `MIN_ATTEMPT_TIME` before the `deadline` active in the current thread, bounding the total
+    time of a call across retries. When giving up on a retryable status the last response is
+    returned as usual. Each attempt's timeouts are clamped separately, by `DeadlineTimeout`.
+    """
+
+    def increment(
+        self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None
+    ):
+        new = super().increment(method, url, response, error, _pool, _stacktrace)
+        expires = getattr(_local, "deadline", None)
+        if expires is None:
+            return new
+
+        delay = new.get_backoff_time()
+        if response is not None and self.respect_retry_after_header:
+            delay = self.get_retry_after(response) or delay
+
+        if time.monotonic() + delay + MIN_ATTEMPT_TIME >= expires:
+            logger.debug("Not retrying %s %s past the deadline", method, url)
+            raise MaxRetryError(_pool, url, error or ResponseError("deadline exceeded"))
+
+        return new
+
+
+class DeadlineTimeout(Timeout):
+    """
+    A urllib3 `Timeout` whose connect and read timeouts are clamped to the time left before the
+    `deadline` active in the current thread, as of each attempt, so retries can't overrun it.
+    """
+
+    def clone(self):
+        # urllib3 clones the timeout for every attempt, including retries
+        return DeadlineTimeout(connect=self._connect, read=self._read, total=self.total)
+
+    @property
+    def connect_timeout(self):
+        return _clamp(super().connect_timeout)
+
+    @property
+    def read_timeout(self):
+        return _clamp(super().read_timeout)
+
+
+def _clamp(timeout):
+    left = remaining()
+    if left is None:
+        return timeout
+    # A zero timeout would make the socket non-blocking rather than fail fast
+    left = max(left, 0.001)
+    return min(timeout, left) if isinstance(timeout, (int, float)) else left
+
+
+@contextmanager
+def deadline(seconds: typing.Optional[float]):
+    """
+    Bound the total time spent retrying requests made by the current thread within the block.
+    Nested deadlines can only shorten the outer one. A `None` or `0` deadline is unbounded.
+
+    Args:
+        seconds (float): The time budget for the block.
+    """
+    with deadline_at(time.monotonic() + seconds if seconds else None):
+        yield
+
+
+@contextmanager
+def deadline_at(expires: typing.Optional[float]):
+    """
+    Like `deadline`, but ending at an absolute `time.monotonic()` value (e.g., from `expiry`),
+    so a deadline can be carried over to another thread without being extended.
+    A `None` expiry is unbounded, while one which has passed leaves no time at all.
+
+    Args:
+        expires (float): The monotonic time the block's requests must complete by.
+    """
+    previous = getattr(_local, "deadline", None)
+    if expires is not None:
+        _local.deadline = expires if previous is None else min(previous, expires)
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def expiry() -> typing.Optional[float]:
+    """
+    The `time.monotonic()` value of the current thread's `deadline`, or `None` if there isn't one.
+    """
+    return getattr(_local, "deadline", None)
+
+
+def remaining() -> typing.Optional[float]:
+    """
+    Seconds left before the current thread's `deadline`, or `None` if there isn't one.
+    """
+    expires = expiry()
+    return None if expires is None else max(0.0, expires - time.monotonic())
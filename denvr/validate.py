@@ -1,7 +1,7 @@
 import json
 import logging
 
-from typing import Dict
+from typing import Callable, Dict, NoReturn
 
 logger = logging.getLogger(__name__)
 
@@ -28,3 +28,70 @@ def validate_kwargs(method, path, kwargs, required):
                 result[kw][k] = v
 
     return result
+
+
+def missing(location: str, name: str, method: str, path: str) -> NoReturn:
+    """
+    Raise the `TypeError` for a required `location` ("params" or "json") parameter `name`
+    missing from a request, as `validate_kwargs` does.
+    """
+    raise TypeError(
+        f"Required {location} parameter {name} is missing for {method} request to {path}"
+    )
+
+
+class RequestSpec:
+    """
+    RequestSpec(method, path, build, params=(), json=(), required=())
+
+    The arguments of an endpoint, generated by `scripts/apigen.py` along with its `build`
+    function. `params` and `json` are `(name, kwarg)` pairs in the order of the client method's
+    arguments. `build(config, *values)` is straight-line code producing the same `params` / `json`
+    as `validate_kwargs` in a single pass, without the intermediate dicts, filling missing values
+    from the `config` (like `Config.getkwarg`) and raising a `TypeError` if a required value is
+    still missing.
+
+    Example:
+
+        def _get_server(config, id, cluster):
+            params_: dict = {}
+            if id is None:
+                id = getattr(config, "id", None)
+            if id is None:
+                missing("params", "Id", "get", "/api/v1/servers/virtual/GetServer")
+            params_["Id"] = id
+            ...
+            return {"params": params_}
+
+
+        GET_SERVER = RequestSpec(
+            "get",
+            "/api/v1/servers/virtual/GetServer",
+            _get_server,
+            params=(("Id", "id"), ("Cluster", "cluster")),
+            required=("Id", "Cluster"),
+        )
+        GET_SERVER.build(config, "vm-1", None)
+        # {"params": {"Id": "vm-1", "Cluster": "Hou1"}}
+    """
+
+    __slots__ = ("build", "json", "method", "params", "path", "required")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        build: Callable[..., dict],
+        params=(),
+        json=(),
+        required=(),
+    ):
+        self.method = method
+        self.path = path
+        self.build = build
+        self.params = tuple(params)
+        self.json = tuple(json)
+        self.required = frozenset(required)
+
+    def __repr__(self):
+        return f"RequestSpec({self.method!r}, {self.path!r})"
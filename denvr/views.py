@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import copy
+
+from collections.abc import ItemsView, KeysView, ValuesView
+from typing import Any
+
+from denvr.utils import USER_KEYED_FIELDS, snakecase
+
+
+def view(content: Any) -> Any:
+    """
+    Wrap decoded JSON in lazily key-normalizing views, leaving other values as is.
+    """
+    if isinstance(content, (ResponseView, ResponseList)):
+        return content
+    if isinstance(content, dict):
+        return ResponseView(content)
+    if isinstance(content, list):
+        return ResponseList(content)
+    return content
+
+
+class ResponseView(dict):
+    """
+    ResponseView(content)
+
+    A `dict` over a decoded JSON object which converts its keys to snakecase on access, rather than
+    rebuilding the response up front. Nested objects and lists are wrapped the first time they're
+    accessed, so reading a couple of fields out of a large response only converts those fields.
+    User data maps (`USER_KEYED_FIELDS`, e.g., `environmentVariables`) are returned as is.
+
+    Views behave like the equivalent snakecase `dict`: they compare equal to it, `dict(view)` and
+    `view.copy()` produce it, and `json.dumps(view)` serializes the snakecase keys.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, content: dict):
+        # The underlying dict holds the original keys and values
+        super().__init__(content)
+        self._keys: dict[str, str] | None = None
+        self._values: dict[str, Any] | None = None
+
+    def _key(self, key):
+        # Most keys (e.g., `id` or `status`) are already snakecase, so avoid building the key map
+        if isinstance(key, str) and snakecase(key) == key and dict.__contains__(self, key):
+            return key
+
+        if self._keys is None:
+            self._keys = {snakecase(k): k for k in dict.__iter__(self)}
+        return self._keys[key]
+
+    def _value(self, raw):
+        value = dict.__getitem__(self, raw)
+        if not isinstance(value, (dict, list)) or isinstance(
+            value, (ResponseView, ResponseList)
+        ):
+            return value
+
+        # Keys like `HF_TOKEN` are user data, not API keys, so aren't converted
+        if snakecase(raw) in USER_KEYED_FIELDS:
+            return value
+
+        if self._values is None:
+            self._values = {}
+        if raw not in self._values:
+            self._values[raw] = view(value)
+        return self._values[raw]
+
+    def __getitem__(self, key):
+        return self._value(self._key(key))
+
+    def __setitem__(self, key, value):
+        try:
+            raw = self._key(key)
+        except KeyError:
+            raw = key
+            if self._keys is not None:
+                self._keys[key] = key
+        if self._values is not None:
+            self._values.pop(raw, None)
+        dict.__setitem__(self, raw, value)
+
+    def __delitem__(self, key):
+        raw = self._key(key)
+        dict.__delitem__(self, raw)
+        if self._keys is not None:
+            del self._keys[key]
+        if self._values is not None:
+            self._values.pop(raw, None)
+
+    def __contains__(self, key):
+        try:
+            self._key(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return (snakecase(k) for k in dict.__iter__(self))
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        # Copies and pickles are rebuilt from the original content
+        return (type(self), (dict(dict.items(self)),))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):  # type: ignore[override]
+        return KeysView(self)
+
+    def values(self):  # type: ignore[override]
+        return ValuesView(self)
+
+    def items(self):  # type: ignore[override]
+        return ItemsView(self)
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = snakecase(next(reversed(dict.keys(self))))
+        return key, self.pop(key)
+
+    def clear(self):
+        dict.clear(self)
+        self._keys = None
+        self._values = None
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):  # type: ignore[override]
+        """
+        A shallow copy as a plain `dict` with snakecase keys.
+        """
+        return dict(self.items())
+
+    def to_dict(self) -> dict:
+        """
+        A deep copy as plain `dict` / `list` objects with snakecase keys.
+        """
+        return {k: _plain(v) for k, v in self.items()}
+
+
+class ResponseList(list):
+    """
+    ResponseList(content)
+
+    A `list` over decoded JSON values, wrapping any objects in `ResponseView`s.
+    """
+
+    def __init__(self, content: list):
+        # Wrapping is cheap (keys are only converted on access) and keeps `json.dumps` consistent
+        super().__init__(view(v) for v in content)
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def to_list(self) -> list:
+        """
+        A deep copy as plain `dict` / `list` objects with snakecase keys.
+        """
+        return [_plain(v) for v in self]
+
+
+def _plain(value):
+    if isinstance(value, ResponseView):
+        return value.to_dict()
+    if isinstance(value, ResponseList):
+        return value.to_list()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
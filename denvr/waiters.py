@@ -1,6 +1,44 @@
+import asyncio
+import inspect
+import itertools
+import logging
+import random
 import time
 
-from typing import Tuple, Callable, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Callable, Union
+
+from requests.exceptions import HTTPError
+
+from denvr.ratelimit import THROTTLED_STATUSES
+from denvr.utils import retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class Backoff:
+    """
+    An exponential polling schedule with full jitter, yielding how long to sleep between checks.
+    The n-th delay is drawn uniformly from [0, min(maximum, initial * factor ** n)],
+    so early checks happen quickly while long waits don't hammer the API.
+
+    Args:
+        initial (float): The upper bound of the first delay in seconds.
+        factor (float): The growth factor applied to the upper bound after each delay.
+        maximum (float): The cap on any single delay in seconds.
+        jitter (bool): Whether to randomize delays (full jitter) or use the upper bounds as is.
+    """
+
+    def __init__(self, initial=1.0, factor=2.0, maximum=30.0, jitter=True):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+
+    def __iter__(self) -> Iterator[float]:
+        for n in itertools.count():
+            # Avoid computing huge powers once we've already reached the cap
+            bound = min(self.maximum, self.initial * self.factor ** min(n, 64))
+            yield random.uniform(0, bound) if self.jitter else bound
 
 
 class Waiter:
@@ -13,16 +51,29 @@ class Waiter:
         check (callable): Function which takes the action response and returns (bool, result) representing
             whether a check has passed and any results to return.
         cleanup (callable): An optional function to run in failure conditions.
+        hint (callable): An optional function returning a server suggested delay (e.g., `Retry-After`)
+            in seconds, or `None`. Used as a lower bound on the next sleep.
+
+    The `interval` to `wait` may be a number of seconds for a fixed schedule, an iterable of delays
+    (e.g., `Backoff(initial=0.5, maximum=10)`) or `None` for the default `Backoff()` schedule.
+    Sleeps are always clamped to the time remaining before `timeout`.
+    Checks throttled by the API (429 / 503 `HTTPError`s) are retried after the larger of the
+    scheduled delay and any `Retry-After`, rather than failing the wait.
     """
 
     def __init__(
-        self, action: Callable, check: Callable, cleanup: Union[Callable, None] = None
+        self,
+        action: Callable,
+        check: Callable,
+        cleanup: Union[Callable, None] = None,
+        hint: Union[Callable, None] = None,
     ):
         self.action = action
         self.check = check
         self.cleanup = cleanup
+        self.hint = hint
 
-    def __call__(self, interval=30, timeout=600, **kwargs):
+    def __call__(self, interval=None, timeout=600, **kwargs):
         resp = self.action(**kwargs)
         try:
             return self.wait(resp, interval, timeout)
@@ -31,19 +82,236 @@ class Waiter:
                 self.cleanup(resp)
             raise e
 
-    def wait(self, resp, interval=30, timeout=600):
-        start_time = time.time()
+    def wait(self, resp, interval=None, timeout=600):
+        return _wait(lambda: self.check(resp), interval, timeout, self.hint)
+
+
+class AsyncWaiter:
+    """
+    An asyncio counterpart to `Waiter` for use with the generated `AsyncClient` classes.
+    Sleeps with `asyncio.sleep`, so thousands of waiters can run concurrently on one event loop.
+
+    Args:
+        action (callable): Coroutine function which takes kwargs, runs an operation and returns a response.
+        check (callable): Coroutine function which takes the action response and returns (bool, result).
+        cleanup (callable): An optional function or coroutine function to run in failure conditions,
+            including when the wait is cancelled or times out.
+        hint (callable): An optional function returning a server suggested delay (see `Waiter`).
+    """
+
+    def __init__(
+        self,
+        action: Callable,
+        check: Callable,
+        cleanup: Union[Callable, None] = None,
+        hint: Union[Callable, None] = None,
+    ):
+        self.action = action
+        self.check = check
+        self.cleanup = cleanup
+        self.hint = hint
+
+    async def __call__(self, interval=None, timeout=600, **kwargs):
+        resp = await self.action(**kwargs)
+        try:
+            return await self.wait(resp, interval, timeout)
+        except (Exception, asyncio.CancelledError):
+            if self.cleanup:
+                result = self.cleanup(resp)
+                if inspect.isawaitable(result):
+                    await result
+            raise
+
+    async def wait(self, resp, interval=None, timeout=600):
+        try:
+            return await asyncio.wait_for(self._poll(resp, interval), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("Wait operation timed out") from None
+
+    async def _poll(self, resp, interval):
+        delays = _schedule(interval)
+        delay = 0.0
 
-        # Loop until check succeeds or timeout occurs
         while True:
-            passes, result = self.check(resp)
+            try:
+                passes, result = await self.check(resp)
+                throttled = None
+            except HTTPError as e:
+                passes, result, throttled = False, None, _throttled(e)
             if passes:
                 return result
 
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Wait operation timed out")
+            delay = next(delays, delay)
+            suggested = _suggested(self.hint, throttled)
+            await asyncio.sleep(max(delay, suggested) if suggested else delay)
+
+
+class WaitGroup:
+    """
+    A utility class which waits on many resources at once to reach a given status.
+    Rather than calling `get_server` / `get_application_details` for each resource on every tick,
+    it resolves them from a single `get_servers` call per cluster (or one `get_applications` call),
+    only falling back to per-resource requests for anything missing from those lists.
+
+    Results have the same shape as `get_server` / `get_application_details`. Application list
+    items are summaries, so each application's details are fetched once it reaches the status.
+
+    Example:
+
+        group = WaitGroup(virtual, status="ONLINE")
+        for name in names:
+            group.add(virtual.create_server(name=name, ...))
+        servers = group.wait()
+
+    Args:
+        client: A `servers/virtual` or `servers/applications` Client.
+        status (str): The status all resources should reach (e.g., "ONLINE", "OFFLINE").
+        hint (callable): An optional function returning a server suggested delay (see `Waiter`).
+            Defaults to the client session's `retry_after`.
+    """
+
+    def __init__(self, client, status: str = "ONLINE", hint: Union[Callable, None] = None):
+        module_name = getattr(client, "__module__", "")
+        if not module_name.endswith(("virtual", "applications")):
+            raise ValueError(f"Unsupported client: {module_name}")
+
+        self._vms = module_name.endswith("virtual")
+        self._key = _vm_key if self._vms else _app_key
+
+        self.client = client
+        self.status = status
+        self.hint = hint if hint else getattr(client.session, "retry_after", None)
+        self.pending: Dict[tuple, dict] = {}
+        self.results: Dict[tuple, dict] = {}
+        self._order: List[tuple] = []
+
+    def add(self, resp: dict):
+        """
+        Track a resource given an action response containing its `id` and `cluster`
+        (and `namespace` for virtual machines).
+        """
+        key = self._key(resp)
+        if key not in self.pending and key not in self.results:
+            self._order.append(key)
+            self.pending[key] = resp
+
+    def poll(self) -> bool:
+        """
+        Check all pending resources once, returning whether they've all reached the status.
+        """
+        snapshot = self._snapshot()
+        for key, resp in list(self.pending.items()):
+            result = snapshot.get(key, {})
+            status = self._status(result)
+            if status is None:
+                logger.debug("%s missing from list snapshot, fetching directly", key)
+                result = self._fetch(resp)
+                status = self._status(result)
+            elif status == self.status and not self._vms:
+                result = self._fetch(resp)
+                status = self._status(result)
+
+            if status == self.status:
+                self.results[key] = result
+                del self.pending[key]
+
+        return not self.pending
+
+    def wait(self, interval=None, timeout=600) -> List[dict]:
+        """
+        Poll until all resources reach the status, returning their latest details in the
+        order they were added. See `Waiter` for the supported `interval` schedules.
+        """
+        _wait(lambda: (self.poll(), None), interval, timeout, self.hint)
+        return [self.results[key] for key in self._order]
+
+    def _snapshot(self) -> Dict[tuple, dict]:
+        # Lookup of the latest resource details from one list request per cluster,
+        # normalized like the single resource getters
+        snapshot = {}
+        normalize = self.client.session.normalize
+        if self._vms:
+            for cluster in {cluster for cluster, _, _ in self.pending}:
+                for item in self.client.get_servers(cluster=cluster).get("items", []):
+                    snapshot[_vm_key({**item, "cluster": cluster})] = normalize(item)
+        elif self.pending:
+            for item in self.client.get_applications().get("items", []):
+                snapshot[_app_key(item)] = normalize(item)
+
+        return snapshot
+
+    def _status(self, result: dict) -> Union[str, None]:
+        if self._vms:
+            return result.get("status")
+
+        # Application details nest the status, but list items don't
+        details = result.get("instance_details", result)
+        return details.get("status") if isinstance(details, dict) else None
+
+    def _fetch(self, resp: dict) -> dict:
+        if self._vms:
+            return self.client.get_server(
+                id=resp["id"], namespace=resp["namespace"], cluster=resp["cluster"]
+            )
+
+        return self.client.get_application_details(id=resp["id"], cluster=resp["cluster"])
+
+
+def _wait(check: Callable, interval, timeout, hint: Union[Callable, None] = None):
+    # Loop until check succeeds or the deadline passes, sleeping according to the schedule
+    deadline = time.monotonic() + timeout
+    delays = _schedule(interval)
+    delay = 0.0
+
+    while True:
+        try:
+            passes, result = check()
+            throttled = None
+        except HTTPError as e:
+            passes, result, throttled = False, None, _throttled(e)
+        if passes:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Wait operation timed out")
+
+        # Finite schedules keep repeating their last delay
+        delay = next(delays, delay)
+        suggested = _suggested(hint, throttled)
+        if suggested:
+            delay = max(delay, suggested)
+
+        time.sleep(min(delay, remaining))
 
-            time.sleep(interval)
+
+def _throttled(error: HTTPError) -> float:
+    # A throttled poll (429 / 503) just means checking again later, after any `Retry-After`
+    resp = error.response
+    if resp is None or resp.status_code not in THROTTLED_STATUSES:
+        raise error
+
+    logger.debug("Throttled while polling (%s), backing off", resp.status_code)
+    return retry_after(resp) or 0.0
+
+
+def _suggested(
+    hint: Union[Callable, None], throttled: Union[float, None]
+) -> Union[float, None]:
+    # The larger of the server's hints for the next sleep, if any
+    suggested = hint() if hint else None
+    if throttled is None:
+        return suggested
+    return max(suggested or 0.0, throttled)
+
+
+def _schedule(interval: Union[float, Iterable[float], None]) -> Iterator[float]:
+    if interval is None:
+        return iter(Backoff())
+    elif isinstance(interval, (int, float)):
+        return itertools.repeat(interval)
+
+    return iter(interval)
 
 
 def waiter(operation: Callable) -> Waiter:
@@ -75,14 +343,20 @@ def waiter(operation: Callable) -> Waiter:
     method_name = getattr(operation, "__name__", "")
 
     if client and class_name == "Client" and module_name.startswith("denvr"):
+        # Honor any Retry-After the API sends back while we poll
+        hint = getattr(client.session, "retry_after", None)
         if module_name.endswith("virtual"):
             if method_name in ["create_server", "start_server"]:
                 return Waiter(
-                    action=operation, check=lambda resp: _vm_online_check(client, resp)
+                    action=operation,
+                    check=lambda resp: _vm_online_check(client, resp),
+                    hint=hint,
                 )
             elif method_name == "stop_server":
                 return Waiter(
-                    action=operation, check=lambda resp: _vm_offline_check(client, resp)
+                    action=operation,
+                    check=lambda resp: _vm_offline_check(client, resp),
+                    hint=hint,
                 )
         elif module_name.endswith("applications"):
             if method_name in [
@@ -91,11 +365,74 @@ def waiter(operation: Callable) -> Waiter:
                 "start_application",
             ]:
                 return Waiter(
-                    action=operation, check=lambda resp: _app_online_check(client, resp)
+                    action=operation,
+                    check=lambda resp: _app_online_check(client, resp),
+                    hint=hint,
                 )
             elif method_name == "stop_application":
                 return Waiter(
-                    action=operation, check=lambda resp: _app_offline_check(client, resp)
+                    action=operation,
+                    check=lambda resp: _app_offline_check(client, resp),
+                    hint=hint,
+                )
+
+    # If we don't find a waiter configuration then raise a ValueError
+    raise ValueError(f"Unsupported operation: {module_name}.{class_name}/{method_name}")
+
+
+def awaiter(operation: Callable) -> AsyncWaiter:
+    """
+    An async waiter factory function that creates an AsyncWaiter for a given `AsyncClient` operation.
+    Supports the same operations and checks as `waiter`.
+
+    Example:
+
+        create_server = awaiter(virtual.create_server)
+        await create_server(name="my-test-vm", rpool="on-demand", vpc="denvr", ...)
+
+    Args:
+        operation: The coroutine method to wait for.
+
+    Returns:
+        An AsyncWaiter instance.
+
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    client = getattr(operation, "__self__", None)
+    if client is None:
+        raise ValueError(f"Operation must be a method of a client. Not {operation}.")
+
+    class_name = getattr(client.__class__, "__name__", "")
+    module_name = getattr(client, "__module__", "")
+    method_name = getattr(operation, "__name__", "")
+
+    if client and class_name == "AsyncClient" and module_name.startswith("denvr"):
+        if module_name.endswith("virtual"):
+            if method_name in ["create_server", "start_server"]:
+                return AsyncWaiter(
+                    action=operation,
+                    check=lambda resp: _vm_status_acheck(client, resp, "ONLINE"),
+                )
+            elif method_name == "stop_server":
+                return AsyncWaiter(
+                    action=operation,
+                    check=lambda resp: _vm_status_acheck(client, resp, "OFFLINE"),
+                )
+        elif module_name.endswith("applications"):
+            if method_name in [
+                "create_catalog_application",
+                "create_custom_application",
+                "start_application",
+            ]:
+                return AsyncWaiter(
+                    action=operation,
+                    check=lambda resp: _app_status_acheck(client, resp, "ONLINE"),
+                )
+            elif method_name == "stop_application":
+                return AsyncWaiter(
+                    action=operation,
+                    check=lambda resp: _app_status_acheck(client, resp, "OFFLINE"),
                 )
 
     # If we don't find a waiter configuration then raise a ValueError
@@ -106,7 +443,7 @@ def _vm_online_check(client, resp: dict) -> Tuple[bool, dict]:
     result = client.get_server(
         id=resp["id"], namespace=resp["namespace"], cluster=resp["cluster"]
     )
-    is_online = result["status"] == "ONLINE"
+    is_online = _vm_status(result) == "ONLINE"
     return is_online, result
 
 
@@ -114,17 +451,45 @@ def _vm_offline_check(client, resp: dict) -> Tuple[bool, dict]:
     result = client.get_server(
         id=resp["id"], namespace=resp["namespace"], cluster=resp["cluster"]
     )
-    is_offline = result["status"] == "OFFLINE"
+    is_offline = _vm_status(result) == "OFFLINE"
     return is_offline, result
 
 
 def _app_online_check(client, resp: dict) -> Tuple[bool, dict]:
     result = client.get_application_details(id=resp["id"], cluster=resp["cluster"])
-    is_online = result["instance_details"]["status"] == "ONLINE"
+    is_online = _app_status(result) == "ONLINE"
     return is_online, result
 
 
 def _app_offline_check(client, resp: dict) -> Tuple[bool, dict]:
     result = client.get_application_details(id=resp["id"], cluster=resp["cluster"])
-    is_offline = result["instance_details"]["status"] == "OFFLINE"
+    is_offline = _app_status(result) == "OFFLINE"
     return is_offline, result
+
+
+async def _vm_status_acheck(client, resp: dict, status: str) -> Tuple[bool, dict]:
+    result = await client.get_server(
+        id=resp["id"], namespace=resp["namespace"], cluster=resp["cluster"]
+    )
+    return _vm_status(result) == status, result
+
+
+async def _app_status_acheck(client, resp: dict, status: str) -> Tuple[bool, dict]:
+    result = await client.get_application_details(id=resp["id"], cluster=resp["cluster"])
+    return _app_status(result) == status, result
+
+
+def _vm_status(result: dict) -> str:
+    return result["status"]
+
+
+def _app_status(result: dict) -> str:
+    return result["instance_details"]["status"]
+
+
+def _vm_key(resp: dict) -> tuple:
+    return (resp.get("cluster"), resp.get("namespace"), resp.get("id"))
+
+
+def _app_key(resp: dict) -> tuple:
+    return (resp.get("cluster"), resp.get("id"))
@@ -74,6 +74,16 @@ INCLUDED_PATHS = [
     # "/api/v1/vpcs/DestroyVpc",
 ]
 
+# List endpoints returning `{"items": [...]}` which also get an `iter_*` method
+# streaming their items with `Session.iter_items`
+STREAMED_PATHS = [
+    "/api/v1/servers/applications/GetApplications",
+    "/api/v1/servers/applications/GetConfigurations",
+    "/api/v1/servers/metal/GetHosts",
+    "/api/v1/servers/virtual/GetServers",
+    "/api/v1/servers/virtual/GetConfigurations",
+]
+
 TYPE_MAP = {
     "string": "str",
     "boolean": "bool",
@@ -91,7 +101,7 @@ def fetchapi(url: str = API_SPEC_URL) -> dict:
     """
     Fetch the API spec and extracts the JSON object.
     """
-    resp = requests.get(url)
+    resp = requests.get(url, timeout=60)
     resp.raise_for_status()
     return resp.json()
 
@@ -360,8 +370,8 @@ def generate(included=INCLUDED_PATHS):
         trim_blocks=True,
         lstrip_blocks=True,
     )
-    template_env.filters["quotify"] = (
-        lambda val: "'{}'".format(val) if isinstance(val, str) else val
+    template_env.filters["quotify"] = lambda val: (
+        "'{}'".format(val) if isinstance(val, str) else val
     )
     client_template = template_env.get_template("client.py.jinja2")
     test_template = template_env.get_template("test_client.py.jinja2")
@@ -408,11 +418,14 @@ def generate(included=INCLUDED_PATHS):
             method["path"] = method_path
             method["description"] = path_vals["summary"]
             method["name"] = snakecase(methodname)
+            method["spec"] = method["name"].upper()
             method["params"] = []
             method["json"] = []
             method["rprops"] = []
             method["required"] = []
             method["example"] = {}
+            if method_path in STREAMED_PATHS:
+                method["iter_name"] = re.sub("^get_", "iter_", method["name"])
 
             logger.debug("%s(%s) -> %s", methodname, http_method, json.dumps(path_vals))
 
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from typing import Any, Dict
@@ -7,8 +8,8 @@ from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import UNDEFINED
 
 from denvr.config import Config
-from denvr.session import Session
-from denvr.api.v1.servers.applications import Client
+from denvr.session import AsyncSession, Session
+from denvr.api.v1.servers.applications import AsyncClient, Client
 from denvr.validate import validate_kwargs
 
 
@@ -62,6 +63,91 @@ def test_get_applications_httpserver(httpserver: HTTPServer):
     assert client.get_applications(**client_kwargs) == request_kwargs
 
 
+def test_get_applications_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetApplications", {}, {}
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetApplications",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_applications(**client_kwargs)) == request_kwargs
+    session.close()
+
+
+def test_iter_applications_httpserver(httpserver: HTTPServer):
+    """
+    Test we stream each of the response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = Session(config)
+    client = Client(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetApplications", {}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetApplications",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+    assert list(client.iter_applications(**client_kwargs)) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+
+
+def test_iter_applications_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient streams the same response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetApplications", {}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetApplications",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+
+    async def collect():
+        return [item async for item in client.iter_applications(**client_kwargs)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_applications_mockserver(mock_config):
     """
@@ -137,6 +223,35 @@ def test_get_application_details_httpserver(httpserver: HTTPServer):
     assert client.get_application_details(**client_kwargs) == request_kwargs
 
 
+def test_get_application_details_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "my-jupyter-application", "cluster": "Msc1"}
+
+    request_kwargs = validate_kwargs(
+        "get",
+        "/api/v1/servers/applications/GetApplicationDetails",
+        {"params": {"Id": "my-jupyter-application", "Cluster": "Msc1"}},
+        {"Id", "Cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetApplicationDetails",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_application_details(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_application_details_mockserver(mock_config):
     """
@@ -201,6 +316,91 @@ def test_get_configurations_httpserver(httpserver: HTTPServer):
     assert client.get_configurations(**client_kwargs) == request_kwargs
 
 
+def test_get_configurations_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetConfigurations", {}, {}
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_configurations(**client_kwargs)) == request_kwargs
+    session.close()
+
+
+def test_iter_configurations_httpserver(httpserver: HTTPServer):
+    """
+    Test we stream each of the response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = Session(config)
+    client = Client(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetConfigurations", {}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+    assert list(client.iter_configurations(**client_kwargs)) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+
+
+def test_iter_configurations_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient streams the same response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetConfigurations", {}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+
+    async def collect():
+        return [item async for item in client.iter_configurations(**client_kwargs)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_configurations_mockserver(mock_config):
     """
@@ -276,6 +476,35 @@ def test_get_availability_httpserver(httpserver: HTTPServer):
     assert client.get_availability(**client_kwargs) == request_kwargs
 
 
+def test_get_availability_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Msc1", "resource_pool": "on-demand"}
+
+    request_kwargs = validate_kwargs(
+        "get",
+        "/api/v1/servers/applications/GetAvailability",
+        {"params": {"cluster": "Msc1", "resourcePool": "on-demand"}},
+        {"cluster", "resourcePool"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetAvailability",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_availability(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_availability_mockserver(mock_config):
     """
@@ -340,6 +569,32 @@ def test_get_application_catalog_items_httpserver(httpserver: HTTPServer):
     assert client.get_application_catalog_items(**client_kwargs) == request_kwargs
 
 
+def test_get_application_catalog_items_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/applications/GetApplicationCatalogItems", {}, {}
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/GetApplicationCatalogItems",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_application_catalog_items(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_application_catalog_items_mockserver(mock_config):
     """
@@ -520,6 +775,83 @@ def test_create_catalog_application_httpserver(httpserver: HTTPServer):
     assert client.create_catalog_application(**client_kwargs) == request_kwargs
 
 
+def test_create_catalog_application_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "name": "my-jupyter-notebook",
+        "cluster": "Msc1",
+        "hardware_package_name": "g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+        "application_catalog_item_name": "jupyter-notebook",
+        "application_catalog_item_version": "python-3.11.9",
+        "resource_pool": "on-demand",
+        "ssh_keys": ["string"],
+        "persist_direct_attached_storage": False,
+        "personal_shared_storage": True,
+        "tenant_shared_storage": True,
+        "selected_node": "yycdp-dev-k8sw03",
+        "jupyter_token": "abc123",
+        "startup_commands": ["pip install custom-package", "python setup.py"],
+        "environment_variables": {
+            "HUGGING_FACE_HUB_TOKEN": "your-token-here",
+            "CACHE_DIR": "/mnt/storage/.cache",
+        },
+        "proxy_port": "8000",
+        "proxy_api_keys": ["api-key-abc123", "api-key-def456"],
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/applications/CreateCatalogApplication",
+        {
+            "json": {
+                "name": "my-jupyter-notebook",
+                "cluster": "Msc1",
+                "hardwarePackageName": "g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+                "applicationCatalogItemName": "jupyter-notebook",
+                "applicationCatalogItemVersion": "python-3.11.9",
+                "resourcePool": "on-demand",
+                "sshKeys": ["string"],
+                "persistDirectAttachedStorage": False,
+                "personalSharedStorage": True,
+                "tenantSharedStorage": True,
+                "selectedNode": "yycdp-dev-k8sw03",
+                "jupyterToken": "abc123",
+                "startupCommands": ["pip install custom-package", "python setup.py"],
+                "environmentVariables": {
+                    "HUGGING_FACE_HUB_TOKEN": "your-token-here",
+                    "CACHE_DIR": "/mnt/storage/.cache",
+                },
+                "proxyPort": "8000",
+                "proxyApiKeys": ["api-key-abc123", "api-key-def456"],
+            }
+        },
+        {
+            "applicationCatalogItemName",
+            "applicationCatalogItemVersion",
+            "cluster",
+            "hardwarePackageName",
+            "name",
+        },
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/CreateCatalogApplication",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.create_catalog_application(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_create_catalog_application_mockserver(mock_config):
     """
@@ -710,6 +1042,81 @@ def test_create_custom_application_httpserver(httpserver: HTTPServer):
     assert client.create_custom_application(**client_kwargs) == request_kwargs
 
 
+def test_create_custom_application_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "name": "my-custom-application",
+        "cluster": "Msc1",
+        "hardware_package_name": "g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+        "image_url": "docker.io/{namespace}/{repository}:{tag}",
+        "image_cmd_override": ["python", "train.py"],
+        "environment_variables": {},
+        "image_repository": {
+            "hostname": "https://index.docker.io/v1/",
+            "username": "your-docker-username",
+            "password": "dckr_pat__xxx1234567890abcdef",
+        },
+        "resource_pool": "on-demand",
+        "readiness_watcher_port": 443,
+        "proxy_port": 8888,
+        "proxy_api_keys": ["key_user1", "key_user2"],
+        "persist_direct_attached_storage": False,
+        "personal_shared_storage": True,
+        "tenant_shared_storage": True,
+        "selected_node": "yycdp-dev-k8sw03",
+        "user_scripts": {},
+        "security_context": {"runAsRoot": False},
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/applications/CreateCustomApplication",
+        {
+            "json": {
+                "name": "my-custom-application",
+                "cluster": "Msc1",
+                "hardwarePackageName": "g-nvidia-1xa100-40gb-pcie-14vcpu-112gb",
+                "imageUrl": "docker.io/{namespace}/{repository}:{tag}",
+                "imageCmdOverride": ["python", "train.py"],
+                "environmentVariables": {},
+                "imageRepository": {
+                    "hostname": "https://index.docker.io/v1/",
+                    "username": "your-docker-username",
+                    "password": "dckr_pat__xxx1234567890abcdef",
+                },
+                "resourcePool": "on-demand",
+                "readinessWatcherPort": 443,
+                "proxyPort": 8888,
+                "proxyApiKeys": ["key_user1", "key_user2"],
+                "persistDirectAttachedStorage": False,
+                "personalSharedStorage": True,
+                "tenantSharedStorage": True,
+                "selectedNode": "yycdp-dev-k8sw03",
+                "userScripts": {},
+                "securityContext": {"runAsRoot": False},
+            }
+        },
+        {"cluster", "hardwarePackageName", "imageUrl", "name"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/CreateCustomApplication",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.create_custom_application(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_create_custom_application_mockserver(mock_config):
     """
@@ -807,6 +1214,35 @@ def test_start_application_httpserver(httpserver: HTTPServer):
     assert client.start_application(**client_kwargs) == request_kwargs
 
 
+def test_start_application_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "my-jupyter-application", "cluster": "Msc1"}
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/applications/StartApplication",
+        {"json": {"id": "my-jupyter-application", "cluster": "Msc1"}},
+        {"cluster", "id"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/StartApplication",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.start_application(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_start_application_mockserver(mock_config):
     """
@@ -882,6 +1318,35 @@ def test_stop_application_httpserver(httpserver: HTTPServer):
     assert client.stop_application(**client_kwargs) == request_kwargs
 
 
+def test_stop_application_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "my-jupyter-application", "cluster": "Msc1"}
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/applications/StopApplication",
+        {"json": {"id": "my-jupyter-application", "cluster": "Msc1"}},
+        {"cluster", "id"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/StopApplication",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.stop_application(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_stop_application_mockserver(mock_config):
     """
@@ -957,6 +1422,35 @@ def test_destroy_application_httpserver(httpserver: HTTPServer):
     assert client.destroy_application(**client_kwargs) == request_kwargs
 
 
+def test_destroy_application_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "my-jupyter-application", "cluster": "Msc1"}
+
+    request_kwargs = validate_kwargs(
+        "delete",
+        "/api/v1/servers/applications/DestroyApplication",
+        {"params": {"Id": "my-jupyter-application", "Cluster": "Msc1"}},
+        {"Id", "Cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/applications/DestroyApplication",
+        method="delete",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.destroy_application(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_destroy_application_mockserver(mock_config):
     """
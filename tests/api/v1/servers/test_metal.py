@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from typing import Any, Dict
@@ -7,8 +8,8 @@ from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import UNDEFINED
 
 from denvr.config import Config
-from denvr.session import Session
-from denvr.api.v1.servers.metal import Client
+from denvr.session import AsyncSession, Session
+from denvr.api.v1.servers.metal import AsyncClient, Client
 from denvr.validate import validate_kwargs
 
 
@@ -71,6 +72,35 @@ def test_get_host_httpserver(httpserver: HTTPServer):
     assert client.get_host(**client_kwargs) == request_kwargs
 
 
+def test_get_host_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "Id", "cluster": "Hou1"}
+
+    request_kwargs = validate_kwargs(
+        "get",
+        "/api/v1/servers/metal/GetHost",
+        {"params": {"Id": "Id", "Cluster": "Hou1"}},
+        {"Id", "Cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/metal/GetHost",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_host(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_host_mockserver(mock_config):
     """
@@ -135,6 +165,91 @@ def test_get_hosts_httpserver(httpserver: HTTPServer):
     assert client.get_hosts(**client_kwargs) == request_kwargs
 
 
+def test_get_hosts_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Hou1"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/metal/GetHosts", {"params": {"Cluster": "Hou1"}}, {}
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/metal/GetHosts",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_hosts(**client_kwargs)) == request_kwargs
+    session.close()
+
+
+def test_iter_hosts_httpserver(httpserver: HTTPServer):
+    """
+    Test we stream each of the response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = Session(config)
+    client = Client(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Hou1"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/metal/GetHosts", {"params": {"Cluster": "Hou1"}}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/metal/GetHosts",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+    assert list(client.iter_hosts(**client_kwargs)) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+
+
+def test_iter_hosts_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient streams the same response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Hou1"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/metal/GetHosts", {"params": {"Cluster": "Hou1"}}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/metal/GetHosts",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+
+    async def collect():
+        return [item async for item in client.iter_hosts(**client_kwargs)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_hosts_mockserver(mock_config):
     """
@@ -210,6 +325,35 @@ def test_reboot_host_httpserver(httpserver: HTTPServer):
     assert client.reboot_host(**client_kwargs) == request_kwargs
 
 
+def test_reboot_host_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"id": "string", "cluster": "Hou1"}
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/metal/RebootHost",
+        {"json": {"id": "string", "cluster": "Hou1"}},
+        {"cluster", "id"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/metal/RebootHost",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.reboot_host(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_reboot_host_mockserver(mock_config):
     """
@@ -313,6 +457,49 @@ def test_reprovision_host_httpserver(httpserver: HTTPServer):
     assert client.reprovision_host(**client_kwargs) == request_kwargs
 
 
+def test_reprovision_host_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "image_url": "https://cloud-images.ubuntu.com/jammy/current/jammy-server-cloudimg-amd64.img",
+        "image_checksum": "https://cloud-images.ubuntu.com/jammy/current/MD5SUMS",
+        "cloud_init_base64": "SGVsbG8sIFdvcmxkIQ==",
+        "id": "string",
+        "cluster": "Hou1",
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/metal/ReprovisionHost",
+        {
+            "json": {
+                "imageUrl": "https://cloud-images.ubuntu.com/jammy/current/jammy-server-cloudimg-amd64.img",
+                "imageChecksum": "https://cloud-images.ubuntu.com/jammy/current/MD5SUMS",
+                "cloudInitBase64": "SGVsbG8sIFdvcmxkIQ==",
+                "id": "string",
+                "cluster": "Hou1",
+            }
+        },
+        {"cluster", "id"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/metal/ReprovisionHost",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.reprovision_host(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_reprovision_host_mockserver(mock_config):
     """
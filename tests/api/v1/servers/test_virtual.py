@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from typing import Any, Dict
@@ -7,8 +8,8 @@ from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import UNDEFINED
 
 from denvr.config import Config
-from denvr.session import Session
-from denvr.api.v1.servers.virtual import Client
+from denvr.session import AsyncSession, Session
+from denvr.api.v1.servers.virtual import AsyncClient, Client
 from denvr.validate import validate_kwargs
 
 
@@ -62,6 +63,91 @@ def test_get_servers_httpserver(httpserver: HTTPServer):
     assert client.get_servers(**client_kwargs) == request_kwargs
 
 
+def test_get_servers_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Cluster"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/virtual/GetServers", {"params": {"Cluster": "Cluster"}}, {}
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServers",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_servers(**client_kwargs)) == request_kwargs
+    session.close()
+
+
+def test_iter_servers_httpserver(httpserver: HTTPServer):
+    """
+    Test we stream each of the response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = Session(config)
+    client = Client(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Cluster"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/virtual/GetServers", {"params": {"Cluster": "Cluster"}}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServers",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+    assert list(client.iter_servers(**client_kwargs)) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+
+
+def test_iter_servers_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient streams the same response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {"cluster": "Cluster"}
+
+    request_kwargs = validate_kwargs(
+        "get", "/api/v1/servers/virtual/GetServers", {"params": {"Cluster": "Cluster"}}, {}
+    )
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServers",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+
+    async def collect():
+        return [item async for item in client.iter_servers(**client_kwargs)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_servers_mockserver(mock_config):
     """
@@ -145,6 +231,39 @@ def test_get_server_httpserver(httpserver: HTTPServer):
     assert client.get_server(**client_kwargs) == request_kwargs
 
 
+def test_get_server_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "id": "vm-2024093009357617",
+        "namespace": "denvr",
+        "cluster": "Hou1",
+    }
+
+    request_kwargs = validate_kwargs(
+        "get",
+        "/api/v1/servers/virtual/GetServer",
+        {"params": {"Id": "vm-2024093009357617", "Namespace": "denvr", "Cluster": "Hou1"}},
+        {"Id", "Namespace", "Cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServer",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_server(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_server_mockserver(mock_config):
     """
@@ -291,6 +410,67 @@ def test_create_server_httpserver(httpserver: HTTPServer):
     assert client.create_server(**client_kwargs) == request_kwargs
 
 
+def test_create_server_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "name": "my-denvr-vm",
+        "rpool": "reserved-denvr",
+        "vpc": "denvr",
+        "configuration": "A100_40GB_PCIe_1x",
+        "cluster": "Hou1",
+        "ssh_keys": ["string"],
+        "snapshot_name": "string",
+        "operating_system_image": "Ubuntu 22.04.4 LTS",
+        "personal_storage_mount_path": "/home/ubuntu/personal",
+        "tenant_shared_additional_storage": "/home/ubuntu/tenant-shared",
+        "persist_storage": False,
+        "direct_storage_mount_path": "/home/ubuntu/direct-attached",
+        "root_disk_size": 500,
+        "selected_node": "yycdp-dev-k8sw03",
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/virtual/CreateServer",
+        {
+            "json": {
+                "name": "my-denvr-vm",
+                "rpool": "reserved-denvr",
+                "vpc": "denvr",
+                "configuration": "A100_40GB_PCIe_1x",
+                "cluster": "Hou1",
+                "ssh_keys": ["string"],
+                "snapshotName": "string",
+                "operatingSystemImage": "Ubuntu 22.04.4 LTS",
+                "personalStorageMountPath": "/home/ubuntu/personal",
+                "tenantSharedAdditionalStorage": "/home/ubuntu/tenant-shared",
+                "persistStorage": False,
+                "directStorageMountPath": "/home/ubuntu/direct-attached",
+                "rootDiskSize": 500,
+                "selectedNode": "yycdp-dev-k8sw03",
+            }
+        },
+        {"cluster", "configuration", "ssh_keys", "vpc"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/CreateServer",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.create_server(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_create_server_mockserver(mock_config):
     """
@@ -389,6 +569,39 @@ def test_start_server_httpserver(httpserver: HTTPServer):
     assert client.start_server(**client_kwargs) == request_kwargs
 
 
+def test_start_server_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "id": "vm-2024093009357617",
+        "namespace": "denvr",
+        "cluster": "Hou1",
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/virtual/StartServer",
+        {"json": {"id": "vm-2024093009357617", "namespace": "denvr", "cluster": "Hou1"}},
+        {"cluster", "id", "namespace"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/StartServer",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.start_server(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_start_server_mockserver(mock_config):
     """
@@ -476,6 +689,39 @@ def test_stop_server_httpserver(httpserver: HTTPServer):
     assert client.stop_server(**client_kwargs) == request_kwargs
 
 
+def test_stop_server_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "id": "vm-2024093009357617",
+        "namespace": "denvr",
+        "cluster": "Hou1",
+    }
+
+    request_kwargs = validate_kwargs(
+        "post",
+        "/api/v1/servers/virtual/StopServer",
+        {"json": {"id": "vm-2024093009357617", "namespace": "denvr", "cluster": "Hou1"}},
+        {"cluster", "id", "namespace"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/StopServer",
+        method="post",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.stop_server(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_stop_server_mockserver(mock_config):
     """
@@ -579,6 +825,47 @@ def test_destroy_server_httpserver(httpserver: HTTPServer):
     assert client.destroy_server(**client_kwargs) == request_kwargs
 
 
+def test_destroy_server_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "delete_snapshots": True,
+        "id": "vm-2024093009357617",
+        "namespace": "denvr",
+        "cluster": "Hou1",
+    }
+
+    request_kwargs = validate_kwargs(
+        "delete",
+        "/api/v1/servers/virtual/DestroyServer",
+        {
+            "params": {
+                "DeleteSnapshots": True,
+                "Id": "vm-2024093009357617",
+                "Namespace": "denvr",
+                "Cluster": "Hou1",
+            }
+        },
+        {"Id", "Namespace", "Cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/DestroyServer",
+        method="delete",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.destroy_server(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_destroy_server_mockserver(mock_config):
     """
@@ -644,6 +931,85 @@ def test_get_configurations_httpserver(httpserver: HTTPServer):
     assert client.get_configurations(**client_kwargs) == request_kwargs
 
 
+def test_get_configurations_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs("get", "/api/v1/servers/virtual/GetConfigurations", {}, {})
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_configurations(**client_kwargs)) == request_kwargs
+    session.close()
+
+
+def test_iter_configurations_httpserver(httpserver: HTTPServer):
+    """
+    Test we stream each of the response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = Session(config)
+    client = Client(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs("get", "/api/v1/servers/virtual/GetConfigurations", {}, {})
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+    assert list(client.iter_configurations(**client_kwargs)) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+
+
+def test_iter_configurations_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient streams the same response items
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs("get", "/api/v1/servers/virtual/GetConfigurations", {}, {})
+
+    items = [{"id": "foo", "lastUpdated": "1"}, {"id": "bar", "lastUpdated": "2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetConfigurations",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+    ).respond_with_json({"result": {"items": items}})
+
+    async def collect():
+        return [item async for item in client.iter_configurations(**client_kwargs)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "foo", "last_updated": "1"},
+        {"id": "bar", "last_updated": "2"},
+    ]
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_configurations_mockserver(mock_config):
     """
@@ -727,6 +1093,39 @@ def test_get_availability_httpserver(httpserver: HTTPServer):
     assert client.get_availability(**client_kwargs) == request_kwargs
 
 
+def test_get_availability_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {
+        "cluster": "Hou1",
+        "resource_pool": "reserved-denvr",
+        "report_nodes": True,
+    }
+
+    request_kwargs = validate_kwargs(
+        "get",
+        "/api/v1/servers/virtual/GetAvailability",
+        {"params": {"cluster": "Hou1", "resourcePool": "reserved-denvr", "reportNodes": True}},
+        {"cluster"},
+    )
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetAvailability",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_availability(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_availability_mockserver(mock_config):
     """
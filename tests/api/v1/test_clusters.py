@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from typing import Any, Dict
@@ -7,8 +8,8 @@ from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import UNDEFINED
 
 from denvr.config import Config
-from denvr.session import Session
-from denvr.api.v1.clusters import Client
+from denvr.session import AsyncSession, Session
+from denvr.api.v1.clusters import AsyncClient, Client
 from denvr.validate import validate_kwargs
 
 
@@ -56,6 +57,30 @@ def test_get_all_httpserver(httpserver: HTTPServer):
     assert client.get_all(**client_kwargs) == request_kwargs
 
 
+def test_get_all_async_httpserver(httpserver: HTTPServer):
+    """
+    Test the AsyncClient produces the same session HTTP requests
+    """
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+
+    session = AsyncSession(config)
+    client = AsyncClient(session)
+
+    client_kwargs: Dict[str, Any] = {}
+
+    request_kwargs = validate_kwargs("get", "/api/v1/clusters/GetAll", {}, {})
+
+    # TODO: The request_kwargs response may break if we add schema validation on results.
+    httpserver.expect_request(
+        "/api/v1/clusters/GetAll",
+        method="get",
+        query_string=request_kwargs.get("params", None),
+        json=request_kwargs.get("json", UNDEFINED),
+    ).respond_with_json(request_kwargs)
+    assert asyncio.run(client.get_all(**client_kwargs)) == request_kwargs
+    session.close()
+
+
 @pytest.mark.integration
 def test_get_all_mockserver(mock_config):
     """
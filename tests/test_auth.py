@@ -1,9 +1,17 @@
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 from requests.exceptions import HTTPError
 
-from denvr.auth import Bearer
+from denvr.auth import Bearer, TokenCache, identity
+from tests.utils import temp_env
 
 
 @patch("requests.Session")
@@ -94,3 +102,229 @@ def test_bearer_expired(mock_session_class):
     # Test error when the refresh token is too old.
     with pytest.raises(Exception, match=r"^Auth refresh token has expired.*"):
         auth(Mock(headers={}))
+
+
+def test_identity():
+    with temp_env():
+        for k in ["DENVR_APIKEY", "DENVR_USERNAME", "DENVR_PASSWORD"]:
+            os.environ.pop(k, None)
+
+        alice = identity({"username": "alice@denvrtest.com", "password": "alice.is.the.best"})
+        assert alice == identity(
+            {"username": "alice@denvrtest.com", "password": "alice.is.the.best"}
+        )
+        assert alice != identity({"username": "alice@denvrtest.com", "password": "other"})
+        assert "alice.is.the.best" not in alice
+
+        # Environment variables take precedence like they do for `auth`
+        os.environ["DENVR_APIKEY"] = "foo.bar.baz"
+        assert identity({}) == identity({"apikey": "foo.bar.baz"})
+
+
+@patch("requests.Session")
+def test_bearer_refresh_concurrent(mock_session_class):
+    mock_session = Mock()
+    mock_session_class.return_value = mock_session
+    mock_session.post.return_value = Mock(
+        raise_for_status=lambda: None,
+        json=lambda: {
+            "result": {
+                "accessToken": "access1",
+                "refreshToken": "refresh",
+                "expireInSeconds": -1,
+                "refreshTokenExpireInSeconds": 3600,
+            }
+        },
+    )
+
+    def refresh(*args, **kwargs):
+        # Slow refresh to give other threads a chance to race
+        time.sleep(0.05)
+        return Mock(
+            raise_for_status=lambda: None,
+            json=lambda: {"result": {"accessToken": "access2", "expireInSeconds": 30}},
+        )
+
+    mock_session.get.side_effect = refresh
+
+    auth = Bearer("https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _: auth.token, range(8)))
+
+    assert tokens == ["access2"] * 8
+    assert mock_session.get.call_count == 1
+
+
+def _mock_auth_session(mock_session_class, expires_in):
+    mock_session = Mock()
+    mock_session_class.return_value = mock_session
+    mock_session.post.return_value = Mock(
+        raise_for_status=lambda: None,
+        json=lambda: {
+            "result": {
+                "accessToken": "access1",
+                "refreshToken": "refresh",
+                "expireInSeconds": expires_in,
+                "refreshTokenExpireInSeconds": 3600,
+            }
+        },
+    )
+    mock_session.get.return_value = Mock(
+        raise_for_status=lambda: None,
+        json=lambda: {"result": {"accessToken": "access2", "expireInSeconds": 3600}},
+    )
+    return mock_session
+
+
+@patch("requests.Session")
+def test_bearer_refresh_skew(mock_session_class):
+    mock_session = _mock_auth_session(mock_session_class, 60)
+
+    # Token expires in 60 seconds, so we should refresh it after 50 seconds
+    auth = Bearer(
+        "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, skew=10
+    )
+    assert auth.token == "access1"
+    assert auth._refresh_at == pytest.approx(auth._access_expires - 10)
+    assert auth.refresh_count == 0
+
+    # Within the skew window the token is refreshed even though it hasn't expired yet
+    auth._refresh_at = time.time() - 1
+    assert time.time() < auth._access_expires
+    assert auth.token == "access2"
+    assert auth.refresh_count == 1
+    assert auth.refresh_time >= auth.refresh_latency >= 0
+    assert mock_session.get.call_count == 1
+
+
+@patch("requests.Session")
+def test_bearer_background(mock_session_class):
+    _mock_auth_session(mock_session_class, 0.2)
+
+    auth = Bearer(
+        "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, background=True
+    )
+    assert auth.token == "access1"
+
+    # The token should be refreshed without any further requests asking for it
+    deadline = time.time() + 2
+    while auth.refresh_count == 0 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert auth.refresh_count == 1
+    assert auth._access_token == "access2"
+    auth.close()
+
+
+@patch("requests.Session")
+def test_bearer_background_slow_refresh(mock_session_class):
+    mock_session = _mock_auth_session(mock_session_class, 1)
+    refreshing = threading.Event()
+    refreshed = mock_session.get.return_value
+
+    def slow_refresh(*args, **kwargs):
+        refreshing.set()
+        time.sleep(0.5)
+        return refreshed
+
+    mock_session.get.side_effect = slow_refresh
+    auth = Bearer(
+        "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, background=True
+    )
+    assert auth.token == "access1"
+
+    # Requests keep using the current token while the background refresh is in flight
+    assert refreshing.wait(2)
+    start = time.monotonic()
+    assert auth.token == "access1"
+    assert time.monotonic() - start < 0.1
+
+    deadline = time.time() + 2
+    while auth.refresh_count == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert auth.token == "access2"
+    assert mock_session.get.call_count == 1
+    auth.close()
+
+
+@patch("requests.Session")
+def test_bearer_token_cache(mock_session_class):
+    mock_session = _mock_auth_session(mock_session_class, 3600)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = TokenCache(os.path.join(tmpdir, "denvr", "tokens.json"))
+        first = Bearer(
+            "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, cache=cache
+        )
+        assert first.token == "access1"
+        assert mock_session.post.call_count == 1
+        if sys.platform != "win32":
+            assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+        # A new "process" should reuse the cached token rather than logging in again
+        second = Bearer(
+            "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, cache=cache
+        )
+        assert mock_session.post.call_count == 1
+        assert second.token == first.token == "access1"
+
+        # Other users and servers get their own entries
+        bob = Bearer(
+            "https://api.test.com", "bob@denvrtest.com", "bob.is.the.best", 0, cache=cache
+        )
+        assert bob.token == "access1"
+        assert mock_session.post.call_count == 2
+
+        # Expired access tokens are refreshed once and shared through the cache
+        entry = cache.load(second._cache_key)
+        assert entry is not None
+        with cache.lock():
+            cache.store(second._cache_key, {**entry, "access_expires": time.time() - 1})
+        second._refresh_at = 0
+        assert second.token == "access2"
+        first._refresh_at = 0
+        assert first.token == "access2"
+        assert mock_session.get.call_count == 1
+
+        # Expired refresh tokens require logging in again
+        entry = cache.load(second._cache_key)
+        assert entry is not None
+        assert entry["access_token"] == "access2"
+        with cache.lock():
+            cache.store(second._cache_key, {**entry, "refresh_expires": 0})
+        third = Bearer(
+            "https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0, cache=cache
+        )
+        assert third.token == "access1"
+        assert mock_session.post.call_count == 3
+
+
+def test_token_cache_corrupt():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = TokenCache(os.path.join(tmpdir, "tokens.json"))
+        assert cache.load("foo") is None
+
+        with open(cache.path, "w") as fobj:
+            fobj.write("{not json")
+
+        assert cache.load("foo") is None
+        with cache.lock():
+            cache.store("foo", {"refresh_expires": time.time() + 60})
+        assert cache.load("foo") is not None
+
+
+@patch("requests.Session")
+def test_bearer_lazy(mock_session_class):
+    mock_session = _mock_auth_session(mock_session_class, 3600)
+
+    # No requests until the token is first needed
+    auth = Bearer("https://api.test.com", "alice@denvrtest.com", "alice.is.the.best", 0)
+    assert mock_session.post.call_count == 0
+    assert auth._credentials is not None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _: auth.token, range(8)))
+
+    assert tokens == ["access1"] * 8
+    assert mock_session.post.call_count == 1
+    assert auth._credentials is None
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from pytest_httpserver import HTTPServer
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.exceptions import HTTPError
+
+from denvr.api.v1.servers import metal, virtual
+from denvr.batch import _pool_maxsize, get_host_many, get_server_many, many
+from denvr.config import Config
+from denvr.session import Session
+
+
+def test_get_server_many(httpserver: HTTPServer):
+    # Disable retries so the missing server responds with an error immediately
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    client = virtual.Client(Session(config))
+
+    for i in range(20):
+        httpserver.expect_request(
+            "/api/v1/servers/virtual/GetServer",
+            query_string={"Id": f"vm-{i}", "Namespace": "denvr", "Cluster": "Hou1"},
+        ).respond_with_json({"id": f"vm-{i}", "status": "ONLINE"})
+
+    items = [{"id": f"vm-{i}", "namespace": "denvr", "cluster": "Hou1"} for i in range(20)]
+    # Missing items shouldn't abort the batch
+    items.append({"id": "vm-missing", "namespace": "denvr", "cluster": "Hou1"})
+    # Neither should validation errors from missing required arguments
+    items.append({"id": "vm-no-namespace", "cluster": "Hou1"})
+
+    results = list(get_server_many(client, items, max_workers=4))
+    assert len(results) == 22
+
+    ok = sorted(r.value["id"] for r in results if r.error is None)
+    assert ok == sorted(f"vm-{i}" for i in range(20))
+
+    errors = {r.kwargs["id"]: r.error for r in results if r.error is not None}
+    assert isinstance(errors["vm-missing"], HTTPError)
+    assert isinstance(errors["vm-no-namespace"], TypeError)
+
+
+def test_get_server_many_ids(httpserver: HTTPServer):
+    # Plain ids use the `vpcid` (or `tenant`) default as their namespace
+    config = Config(
+        defaults={
+            "server": httpserver.url_for("/"),
+            "retries": 0,
+            "tenant": "denvr",
+            "cluster": "Hou1",
+            "pool_maxsize": 3,
+        },
+        auth=None,
+    )
+    client = virtual.Client(Session(config))
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServer",
+        query_string={"Id": "vm-1", "Namespace": "denvr", "Cluster": "Hou1"},
+    ).respond_with_json({"id": "vm-1", "status": "ONLINE"})
+
+    (result,) = get_server_many(client, ["vm-1"])
+    assert result.error is None
+    assert result.value == {"id": "vm-1", "status": "ONLINE"}
+    assert result.kwargs == {"id": "vm-1", "namespace": "denvr"}
+
+    assert _pool_maxsize(client.get_server) == 3
+    assert _pool_maxsize(lambda: None) == DEFAULT_POOLSIZE
+
+
+def test_get_host_many(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/"), "cluster": "Hou1"}, auth=None)
+    client = metal.Client(Session(config))
+
+    httpserver.expect_request(
+        "/api/v1/servers/metal/GetHost", query_string={"Id": "host-1", "Cluster": "Hou1"}
+    ).respond_with_json({"id": "host-1"})
+
+    # Plain ids use the config defaults for the remaining arguments
+    results = list(get_host_many(client, ["host-1"]))
+    assert results[0].kwargs == {"id": "host-1"}
+    assert results[0].value == {"id": "host-1"}
+    assert results[0].error is None
+
+
+def test_many_timeout():
+    def operation(delay):
+        time.sleep(delay)
+        return delay
+
+    items = [{"delay": 0.5}, {"delay": 0.01}, {"delay": 0.01}]
+    results = list(many(operation, items, max_workers=3, timeout=0.1))
+
+    # Fast calls complete first and aren't held up by the slow one
+    assert [r.value for r in results[:2]] == [0.01, 0.01]
+    assert results[2].kwargs == {"delay": 0.5}
+    assert isinstance(results[2].error, TimeoutError)
+
+
+def test_many_timeout_queued():
+    release = threading.Event()
+
+    def operation(hang):
+        if hang:
+            release.wait(5)
+        return hang
+
+    # Queued calls can't start while an abandoned call holds the only worker, so they time out
+    # too rather than hanging the batch
+    items = [{"hang": True}, {"hang": False}, {"hang": False}]
+    start = time.monotonic()
+    results = list(many(operation, items, max_workers=1, timeout=0.1))
+    release.set()
+
+    assert time.monotonic() - start < 1
+    assert [r.kwargs for r in results] == items
+    assert all(isinstance(r.error, TimeoutError) for r in results)
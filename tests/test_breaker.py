@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests.exceptions import HTTPError, RequestException
+
+from denvr.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from denvr.config import Config
+from denvr.session import Session
+
+
+def test_breaker_key():
+    breaker = CircuitBreaker()
+    path = "/api/v1/servers/virtual/GetServers"
+    assert breaker.key(path, {"params": {"Cluster": "Hou1"}}) == (path, "Hou1")
+    assert breaker.key(path, {"json": {"cluster": "Msc1"}}) == (path, "Msc1")
+    assert breaker.key(path, {}) == (path, None)
+
+
+def test_breaker_states():
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=4, cooldown=0.1, probes=1)
+    key = ("/api/v1/servers/virtual/GetServers", "Hou1")
+
+    for success in (True, False, True):
+        breaker.before(key)
+        breaker.record(key, success)
+    assert breaker.state(key) == CLOSED
+
+    breaker.before(key)
+    breaker.record(key, success=False)
+    assert breaker.state(key) == OPEN
+
+    # Other clusters are unaffected
+    breaker.before(("/api/v1/servers/virtual/GetServers", "Msc1"))
+
+    with pytest.raises(CircuitOpenError) as e:
+        breaker.before(key)
+    assert e.value.key == key
+    assert 0 < e.value.retry_in <= 0.1
+    assert isinstance(e.value, RequestException)
+
+    # After the cooldown a single probe is let through
+    time.sleep(0.1)
+    breaker.before(key)
+    assert breaker.state(key) == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before(key)
+
+    # A failed probe re-opens the circuit, while a successful one closes it
+    breaker.record(key, success=False)
+    assert breaker.state(key) == OPEN
+    time.sleep(0.1)
+    breaker.before(key)
+    breaker.record(key, success=True)
+    assert breaker.state(key) == CLOSED
+
+
+def test_session_breaker(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_data(
+        "", status=503
+    )
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 0, "breaker": True}, auth=None
+    )
+    session = Session(config)
+    assert session.breaker is not None
+
+    for _ in range(10):
+        with pytest.raises(HTTPError):
+            session.request(
+                "get", "/api/v1/servers/virtual/GetServers", params={"Cluster": "Hou1"}
+            )
+
+    # Once open, requests fail fast without reaching the server
+    with pytest.raises(CircuitOpenError):
+        session.request("get", "/api/v1/servers/virtual/GetServers", params={"Cluster": "Hou1"})
+    assert len(httpserver.log) == 10
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import time
+
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from denvr.api.v1.servers import virtual
+from denvr.auth import ApiKey
+from denvr.cache import ResponseCache
+from denvr.config import Config
+from denvr.session import Session
+
+CONFIGURATIONS = {"items": [{"id": 5, "name": "A100_40GB_PCIe_1x", "gpus": 1}]}
+
+
+def test_cache_etag(httpserver: HTTPServer):
+    def handler(request: Request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(status=304)
+        return Response(
+            '{"items": [{"id": 5, "name": "A100_40GB_PCIe_1x", "gpus": 1}]}',
+            headers={"ETag": '"v1"'},
+            content_type="application/json",
+        )
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetConfigurations").respond_with_handler(
+        handler
+    )
+
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    cache = ResponseCache()
+    client = virtual.Client(Session(config, cache=cache))
+
+    first = client.get_configurations()
+    assert first == CONFIGURATIONS
+
+    # Mutating a response shouldn't corrupt the cache
+    first["items"].clear()
+    assert client.get_configurations() == CONFIGURATIONS
+
+    # Every call revalidates with the server, but only the first downloads the body
+    assert len(httpserver.log) == 2
+    assert httpserver.log[1][0].headers["If-None-Match"] == '"v1"'
+    assert httpserver.log[1][1].status_code == 304
+    assert (cache.hits, cache.misses, cache.revalidations) == (1, 1, 1)
+
+
+def test_cache_ttl(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetConfigurations").respond_with_json(
+        CONFIGURATIONS
+    )
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"items": []}
+    )
+
+    config = Config(defaults={"server": httpserver.url_for("/"), "cache_ttl": 0.1}, auth=None)
+    session = Session(config)
+    assert session.cache is not None
+    client = virtual.Client(session)
+
+    # Without validators responses are served from the cache until the ttl expires
+    assert client.get_configurations() == CONFIGURATIONS
+    assert client.get_configurations() == CONFIGURATIONS
+    assert len(httpserver.log) == 1
+
+    time.sleep(0.1)
+    assert client.get_configurations() == CONFIGURATIONS
+    assert len(httpserver.log) == 2
+
+    # Non-catalog endpoints are never cached
+    client.get_servers(cluster="Hou1")
+    client.get_servers(cluster="Hou1")
+    assert len(httpserver.log) == 4
+
+
+def test_cache_identity(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetConfigurations").respond_with_json(
+        CONFIGURATIONS
+    )
+
+    # Sessions for different accounts sharing one cache don't see each other's responses
+    cache = ResponseCache()
+    alice, bob = (
+        virtual.Client(
+            Session(
+                Config(defaults={"server": httpserver.url_for("/")}, auth=auth), cache=cache
+            )
+        )
+        for auth in (ApiKey("alice"), ApiKey("bob"))
+    )
+    alice.get_configurations()
+    bob.get_configurations()
+    assert len(httpserver.log) == 2
+
+    alice.get_configurations()
+    assert len(httpserver.log) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_lru_and_disk():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(maxsize=2, path=tmpdir)
+        for key in ["a", "b"]:
+            cache.put(key, {"key": key}, {"ETag": key})
+        cache.get("a")
+        cache.put("c", {"key": "c"}, {"ETag": "c"})
+
+        # Only the most recently used entries are kept in memory
+        assert list(cache._entries) == ["a", "c"]
+
+        # But evicted entries can still be loaded from disk, as can entries from other processes
+        other = ResponseCache(path=tmpdir)
+        entry = other.get("b")
+        assert entry is not None
+        assert entry.content == {"key": "b"}
+        assert entry.headers() == {"If-None-Match": "b"}
+        assert other.get("missing") is None
+
+
+def test_cache_disk_pruning():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(maxsize=2, ttl=60, path=tmpdir)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, {"key": key}, {})
+            # Distinct write times, however coarse the filesystem's timestamps
+            os.utime(cache._file(key), (1000 + i, time.time() - 10 + i))
+
+        # The least recently written files beyond `maxsize` are removed on the next write
+        cache.put("d", {"key": "d"}, {})
+        assert sorted(os.listdir(tmpdir)) == sorted(
+            os.path.basename(cache._file(k)) for k in "cd"
+        )
+
+        # As are files older than `ttl`
+        os.utime(cache._file("c"), (0, time.time() - 120))
+        cache.put("e", {"key": "e"}, {})
+        assert sorted(os.listdir(tmpdir)) == sorted(
+            os.path.basename(cache._file(k)) for k in "de"
+        )
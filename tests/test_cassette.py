@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from denvr.api.v1.servers import virtual
+from denvr.cassette import Cassette, Player, Recorder, UnmatchedRequest, lognormal, request_key
+from denvr.config import Config
+from denvr.session import AsyncSession, Session
+
+OFFLINE = {"server": "http://denvr.invalid", "retries": 0}
+
+
+def test_request_key():
+    assert request_key("get", "https://api.cloud.denvrdata.com/api/v1/clusters/GetAll") == (
+        "GET /api/v1/clusters/GetAll"
+    )
+    # Query parameters are sorted and the host is ignored
+    assert request_key("get", "http://localhost:8080/api/v1/x?b=2&a=1") == request_key(
+        "GET", "https://example.com/api/v1/x?a=1&b=2"
+    )
+
+
+@pytest.mark.parametrize("filename", ["traffic.jsonl", "traffic.jsonl.gz"])
+def test_record_replay(httpserver: HTTPServer, tmp_path, filename):
+    path = str(tmp_path / filename)
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    session = Session(config, transport=Recorder(Cassette(path)))
+    client = virtual.Client(session)
+
+    items = [{"id": "vm-1", "privateIp": "10.0.0.1"}, {"id": "vm-2", "privateIp": "10.0.0.2"}]
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServers", query_string={"Cluster": "Hou1"}
+    ).respond_with_json({"result": {"items": items}}, headers={"ETag": '"v1"'})
+    httpserver.expect_oneshot_request(
+        "/api/v1/servers/virtual/GetConfigurations"
+    ).respond_with_json({"result": {"items": [1]}})
+    httpserver.expect_oneshot_request(
+        "/api/v1/servers/virtual/GetConfigurations"
+    ).respond_with_json({"result": {"items": [2]}})
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"error": {"message": "Nope"}}, status=404
+    )
+
+    servers = client.get_servers(cluster="Hou1")
+    streamed = list(client.iter_servers(cluster="Hou1"))
+    configurations = [client.get_configurations(), client.get_configurations()]
+    with pytest.raises(Exception, match="Nope"):
+        client.get_server(id="vm-3", namespace="denvr", cluster="Hou1")
+
+    assert session.adapter.requests == 5
+    session.close()
+
+    # Replay with a fresh cassette from disk, without a server
+    cassette = Cassette(path)
+    assert len(cassette) == 5
+    assert "GET /api/v1/servers/virtual/GetServers?Cluster=Hou1" in cassette
+
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=Player(cassette))
+    client = virtual.Client(session)
+    assert client.get_servers(cluster="Hou1") == servers
+    assert list(client.iter_servers(cluster="Hou1")) == streamed
+    assert [client.get_configurations() for _ in range(3)] == [
+        *configurations,
+        configurations[0],
+    ]
+    with pytest.raises(Exception, match="Nope"):
+        client.get_server(id="vm-3", namespace="denvr", cluster="Hou1")
+
+    # Requests which weren't recorded aren't sent anywhere
+    with pytest.raises(UnmatchedRequest, match="GetServers"):
+        client.get_servers(cluster="Msc1")
+    assert session.adapter.requests == 0
+
+
+def test_replay_latency():
+    cassette = Cassette()
+    cassette.interactions["GET /api/v1/clusters/GetAll"] = [
+        {
+            "key": "GET /api/v1/clusters/GetAll",
+            "status": 200,
+            "headers": {},
+            "body": '{"result": []}',
+            "elapsed": 0.02,
+        }
+    ]
+    config = Config(defaults=OFFLINE, auth=None)
+
+    for latency, expected in [(None, 0), (0.05, 0.05), ("recorded", 0.02)]:
+        session = Session(config, transport=Player(cassette, latency=latency))
+        start = time.perf_counter()
+        assert session.request("get", "/api/v1/clusters/GetAll") == []
+        assert expected <= time.perf_counter() - start < expected + 0.02
+
+    # Seeded distributions replay the same delays
+    first, second = lognormal(0.01, seed=1), lognormal(0.01, seed=1)
+    delays = [first() for _ in range(100)]
+    assert delays == [second() for _ in range(100)]
+    assert 0.005 < sorted(delays)[50] < 0.02
+
+
+def test_replay_async():
+    cassette = Cassette()
+    cassette.interactions["GET /api/v1/clusters/GetAll"] = [
+        {
+            "key": "GET /api/v1/clusters/GetAll",
+            "status": 200,
+            "headers": {},
+            "body": '{"result": [{"name": "Hou1"}]}',
+            "elapsed": 0,
+        }
+    ]
+    session = AsyncSession(Config(defaults=OFFLINE, auth=None), transport=Player(cassette))
+
+    async def gather():
+        return await asyncio.gather(
+            *[session.request("get", "/api/v1/clusters/GetAll") for _ in range(10)]
+        )
+
+    assert asyncio.run(gather()) == [[{"name": "Hou1"}]] * 10
+    session.close()
@@ -5,6 +5,7 @@ import tempfile
 from pytest_httpserver import HTTPServer
 
 from denvr.client import client
+from denvr.session import invalidate
 from tests.utils import temp_env
 
 
@@ -40,3 +41,50 @@ def test_client(httpserver: HTTPServer):
 
             virtual = client("servers/virtual")
             assert type(virtual).__name__ == "Client"
+            invalidate()
+
+
+def test_client_shared_session(httpserver: HTTPServer):
+    httpserver.expect_oneshot_request(
+        "/api/TokenAuth/Authenticate", method="post"
+    ).respond_with_json(
+        {
+            "result": {
+                "accessToken": "access1",
+                "refreshToken": "refresh",
+                "expireInSeconds": 60,
+                "refreshTokenExpireInSeconds": 3600,
+            }
+        }
+    )
+
+    content = """
+    [defaults]
+    server = "{}"
+    """.format(httpserver.url_for("/"))
+    kwargs = {"delete_on_close": False} if sys.version_info >= (3, 12) else {"delete": False}
+    with tempfile.NamedTemporaryFile(**kwargs) as fp:  # type: ignore
+        fp.write(content.encode())
+        fp.close()
+
+        with temp_env():
+            os.environ["DENVR_CONFIG"] = fp.name
+            os.environ["DENVR_USERNAME"] = "alice@denvrtest.com"
+            os.environ["DENVR_PASSWORD"] = "alice.is.the.best"
+
+            try:
+                # Only one authentication request should be made across all clients
+                virtual = client("servers/virtual")
+                metal = client("servers/metal")
+                assert virtual.session is metal.session
+                assert virtual.session.config.auth is metal.session.config.auth
+                assert virtual.session.config.auth.token == "access1"
+                assert metal.session.config.auth.token == "access1"
+                assert len(httpserver.log) == 1
+
+                # Different credentials should get their own session
+                os.environ["DENVR_APIKEY"] = "foo.bar.baz"
+                apps = client("servers/applications")
+                assert apps.session is not virtual.session
+            finally:
+                invalidate()
@@ -36,6 +36,11 @@ def test_bearer_config(mock_session_class):
     vpcid = "denvr"
     rpool = "reserved-denvr"
     retries = 5
+    read_timeout = 30
+
+    [defaults.timeouts]
+    "/api/v1/servers/virtual/CreateServer" = 120
+    "/api/v1/clusters/GetAll" = [1, 5]
 
     [credentials]
     username = "test@foobar.com"
@@ -49,7 +54,10 @@ def test_bearer_config(mock_session_class):
         conf = config(path=fp.name)
 
         assert isinstance(conf.auth, Bearer)
-        assert conf.auth._access_token == "access1"
+        # Authentication is deferred until the token is first needed
+        assert conf.auth._access_token is None
+        assert mock_session.post.call_count == 0
+        assert conf.auth.token == "access1"
         assert conf.auth._refresh_token == "refresh"
         assert conf.server == "https://api.cloud.denvrdata.com"
         assert conf.api == "v2"
@@ -58,6 +66,11 @@ def test_bearer_config(mock_session_class):
         assert conf.vpcid == "denvr"
         assert conf.rpool == "reserved-denvr"
         assert conf.retries == 5
+        assert conf.timeout() == (10, 30)
+        assert conf.timeout("/api/v1/servers/virtual/GetServers") == (10, 30)
+        assert conf.timeout("/api/v1/servers/virtual/CreateServer") == (10, 120)
+        assert conf.timeout("/api/v1/clusters/GetAll") == (1, 5)
+        assert mock_session.post.call_args.kwargs["timeout"] == (10, 30)
 
     # Test with no config file and just auth environment variables
     with temp_env():
@@ -67,7 +80,7 @@ def test_bearer_config(mock_session_class):
         conf = config()
 
         assert isinstance(conf.auth, Bearer)
-        assert conf.auth._access_token == "access1"
+        assert conf.auth.token == "access1"
         assert conf.auth._refresh_token == "refresh"
         assert conf.server == "https://api.cloud.denvrdata.com"
         assert conf.api == "v1"
@@ -0,0 +1,48 @@
+import pytest
+from requests import Response
+from requests.exceptions import JSONDecodeError
+
+from denvr import decoder
+
+
+@pytest.fixture
+def backend():
+    # Restore the default backend after each test
+    yield
+    decoder.use()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_decoder_backends(backend, name):
+    if name != "json":
+        pytest.importorskip(name)
+
+    assert decoder.use(name) == name
+    assert decoder.backend() == name
+    assert decoder.loads(b'{"items": [{"id": "vm-1", "gpus": 8}]}') == {
+        "items": [{"id": "vm-1", "gpus": 8}]
+    }
+
+    # Decode errors are consistent regardless of the backend
+    with pytest.raises(JSONDecodeError):
+        decoder.loads(b"<html>Bad Gateway</html>")
+
+
+def test_decoder_custom(backend):
+    assert decoder.use(lambda content: {"raw": content}) == "<lambda>"
+    assert decoder.loads(b"{}") == {"raw": b"{}"}
+
+
+def test_decode_once(backend):
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return {"status": "ONLINE"}
+
+    decoder.use(loads)
+    resp = Response()
+    resp._content = b'{"status": "ONLINE"}'
+    assert decoder.decode(resp) == {"status": "ONLINE"}
+    assert decoder.decode(resp) == {"status": "ONLINE"}
+    assert len(calls) == 1
@@ -0,0 +1,187 @@
+import json
+
+import pytest
+from requests import HTTPError
+
+from denvr.api.v1.servers import applications, metal, virtual
+from denvr.config import Config
+from denvr.fake import FakeAPI
+from denvr.session import Session
+from denvr.waiters import WaitGroup, waiter
+
+OFFLINE = {"server": "http://denvr.invalid", "retries": 0, "cluster": "Hou1"}
+
+CREATE: dict = {
+    "rpool": "on-demand",
+    "vpc": "denvr",
+    "configuration": "A100_40GB_PCIe_1x",
+    "ssh_keys": ["ssh-ed25519 AAAA"],
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fake_waiters():
+    api = FakeAPI(provisioning=0.05, stopping=0.05)
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=api.transport())
+    client = virtual.Client(session)
+
+    vm = waiter(client.create_server)(interval=0.01, timeout=5, name="my-vm", **CREATE)
+    assert vm["id"] == "my-vm"
+    assert vm["status"] == "ONLINE"
+    assert vm["private_ip"].startswith("172.16.")
+
+    vm = waiter(client.stop_server)(
+        interval=0.01, timeout=5, id="my-vm", namespace="denvr", cluster="Hou1"
+    )
+    assert vm["status"] == "OFFLINE"
+
+    client.destroy_server(id="my-vm", namespace="denvr")
+    with pytest.raises(HTTPError, match="not found"):
+        client.get_server(id="my-vm", namespace="denvr")
+
+
+def test_fake_capacity():
+    clock = Clock()
+    api = FakeAPI(capacity={"Hou1": {"A100_40GB_PCIe_1x": 2}}, provisioning=10, clock=clock)
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=api.transport())
+    client = virtual.Client(session)
+
+    client.create_server(name="vm-1", **CREATE)
+    client.create_server(name="vm-2", **CREATE)
+    with pytest.raises(HTTPError, match="No capacity left"):
+        client.create_server(name="vm-3", **CREATE)
+
+    (available,) = client.get_availability(cluster="Hou1", resource_pool="on-demand")["items"]
+    assert available["count"] == 0
+    assert not available["available"]
+
+    # Resources only come online once the clock passes their provisioning time
+    assert {vm["status"] for vm in client.get_servers()["items"]} == {"PENDING"}
+    clock.now = 10
+    assert {vm["status"] for vm in client.get_servers()["items"]} == {"ONLINE"}
+
+    # Destroying a server frees its slot
+    client.destroy_server(id="vm-1", namespace="denvr")
+    assert client.create_server(name="vm-3", **CREATE)["status"] == "PENDING"
+
+
+def test_fake_validation():
+    api = FakeAPI()
+    status, _, payload = api.handle(
+        "POST", "/api/v1/servers/virtual/CreateServer", json.dumps({"cluster": "Hou1"}).encode()
+    )
+    assert status == 400
+    assert "configuration" in payload["error"]["message"]
+
+    status, _, payload = api.handle("GET", "/api/v1/servers/virtual/Nope")
+    assert status == 404
+
+    # Bodies that aren't JSON objects are rejected like invalid JSON rather than crashing
+    for body in [b"[]", b'"x"', b"[1]", b"{"]:
+        status, _, payload = api.handle("POST", "/api/v1/servers/virtual/CreateServer", body)
+        assert status == 400
+        assert payload["error"]["message"]
+
+
+def test_fake_scale():
+    clock = Clock()
+    api = FakeAPI(capacity={"Hou1": {"A100_40GB_PCIe_1x": 20000}}, clock=clock)
+    for i in range(20000):
+        body = json.dumps({"name": f"vm-{i}", **CREATE, "cluster": "Hou1"}).encode()
+        assert api.handle("POST", "/api/v1/servers/virtual/CreateServer", body)[0] == 200
+
+    clock.now = 60
+    status, _, payload = api.handle("GET", "/api/v1/servers/virtual/GetServers?Cluster=Hou1")
+    assert status == 200
+    assert len(payload["result"]["items"]) == 20000
+    assert {vm["status"] for vm in payload["result"]["items"]} == {"ONLINE"}
+
+
+def test_fake_wait_group_shape():
+    api = FakeAPI(provisioning=0.05)
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=api.transport())
+    client = virtual.Client(session)
+
+    # vm-0 is left out of the list, so it comes from the `get_server` fallback
+    get_servers = client.get_servers
+    client.get_servers = lambda **kwargs: {  # type: ignore[method-assign]
+        "items": [vm for vm in get_servers(**kwargs)["items"] if vm["id"] != "vm-0"]
+    }
+    group = WaitGroup(client)
+    for i in range(2):
+        group.add(client.create_server(name=f"vm-{i}", **CREATE))
+
+    fallback, listed = group.wait(interval=0.01, timeout=5)
+    expected = client.get_server(id="vm-1", namespace="denvr")
+    assert set(listed) == set(fallback) == set(expected)
+    assert "private_ip" in listed and "privateIp" not in listed
+
+    apps = applications.Client(session)
+    group = WaitGroup(apps)
+    group.add(
+        apps.create_catalog_application(
+            name="app-0",
+            hardware_package_name="A100_40GB_PCIe_1x",
+            application_catalog_item_name="jupyter-notebook",
+            application_catalog_item_version="python-3.11",
+            resource_pool="on-demand",
+        )
+    )
+    (app,) = group.wait(interval=0.01, timeout=5)
+    assert set(app) == set(apps.get_application_details(id="app-0", cluster="Hou1"))
+    assert app["instance_details"]["status"] == "ONLINE"
+
+
+def test_fake_throttle():
+    api = FakeAPI(throttle=1.0, retry_after=3)
+    session = Session(Config(defaults=OFFLINE, auth=None), transport=api.transport())
+    with pytest.raises(HTTPError, match="Too many requests"):
+        virtual.Client(session).get_servers()
+    assert session.retry_after() == 3
+    assert api.throttled == 1
+
+
+def test_fake_serve():
+    api = FakeAPI(provisioning=0.05, retry_after=0, hosts={"Hou1": 2})
+    with api.serve() as server:
+        config = Config(
+            defaults={"server": server.url, "cluster": "Hou1", "retries": 5}, auth=None
+        )
+        session = Session(config)
+
+        apps = applications.Client(session)
+        group = WaitGroup(apps)
+        for i in range(3):
+            group.add(
+                apps.create_catalog_application(
+                    name=f"app-{i}",
+                    hardware_package_name="A100_40GB_PCIe_1x",
+                    application_catalog_item_name="jupyter-notebook",
+                    application_catalog_item_version="python-3.11",
+                    resource_pool="on-demand",
+                )
+            )
+
+        # Over HTTP, urllib3 retries the throttled GETs for us
+        api.throttle = 0.3
+        results = group.wait(interval=0.01, timeout=5)
+        assert [app["instance_details"]["status"] for app in results] == ["ONLINE"] * 3
+
+        hosts = metal.Client(session)
+        for _ in range(10):
+            assert len(hosts.get_hosts()["items"]) == 2
+        assert api.throttled > 0
+
+        api.throttle = 0
+        host = hosts.reboot_host(id="hou1-host-000")
+        assert host["operational_status"] == "Rebooting"
+        assert not host["powered_on"]
+
+        session.close()
@@ -0,0 +1,181 @@
+import threading
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests import RequestException
+from werkzeug import Response
+
+from denvr.api.v1.servers import virtual
+from denvr.config import Config
+from denvr.hedge import HedgePolicy
+from denvr.metrics import Instrument
+from denvr.session import Session
+
+
+@pytest.fixture
+def threaded_httpserver():
+    # The default server handles one request at a time, which would serialize the hedge
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+def test_hedge_policy_delay():
+    policy = HedgePolicy(min_samples=10)
+    assert policy.hedgeable("get", "/api/v1/servers/virtual/GetServer")
+    assert not policy.hedgeable("post", "/api/v1/servers/virtual/GetServer")
+    assert not policy.hedgeable("get", "/api/v1/servers/virtual/GetServers")
+
+    # No hedging until enough latencies have been observed
+    for i in range(9):
+        policy.record("/api/v1/servers/virtual/GetServer", i / 100)
+    assert policy.delay("/api/v1/servers/virtual/GetServer") is None
+
+    for i in range(9, 100):
+        policy.record("/api/v1/servers/virtual/GetServer", i / 100)
+    assert policy.delay("/api/v1/servers/virtual/GetServer") == 0.94
+    assert policy.delay("/api/v1/servers/metal/GetHost") is None
+
+    assert HedgePolicy(delay=0.5).delay("/api/v1/servers/metal/GetHost") == 0.5
+
+
+def test_hedge_policy_budget():
+    policy = HedgePolicy(budget=0.1)
+    for _ in range(25):
+        policy.start()
+
+    assert policy.allow()
+    assert policy.allow()
+    assert not policy.allow()
+    assert policy.hedges == 2
+
+    policy.won()
+    assert policy.win_rate == 0.5
+
+
+def test_session_hedge(threaded_httpserver: HTTPServer):
+    httpserver = threaded_httpserver
+    calls = []
+
+    def handler(request):
+        # Only the first request is slow
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(1)
+        return Response('{"id": "vm-1", "status": "ONLINE"}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_handler(handler)
+
+    config = Config(
+        defaults={
+            "server": httpserver.url_for("/"),
+            "retries": 0,
+            "hedge": True,
+            "hedge_delay": 0.1,
+            "hedge_budget": 1,
+        },
+        auth=None,
+    )
+    session = Session(config)
+    assert session.hedge is not None
+    client = virtual.Client(session)
+
+    start = time.monotonic()
+    result = client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+    assert time.monotonic() - start < 0.9
+    assert result == {"id": "vm-1", "status": "ONLINE"}
+    assert (session.hedge.requests, session.hedge.hedges, session.hedge.wins) == (1, 1, 1)
+
+    # Fast responses aren't hedged
+    client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+    assert session.hedge.hedges == 1
+    session.close()
+
+
+def test_session_hedge_deadline(threaded_httpserver: HTTPServer):
+    httpserver = threaded_httpserver
+
+    def handler(request):
+        time.sleep(1)
+        return Response("{}", content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_handler(handler)
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 0, "deadline": 0.3}, auth=None
+    )
+    session = Session(config, hedge=HedgePolicy(delay=0.2, budget=1))
+    client = virtual.Client(session)
+
+    # The hedge sent after 0.2 seconds only gets what's left of the 0.3 second deadline
+    start = time.monotonic()
+    with pytest.raises(RequestException):
+        client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+    assert time.monotonic() - start < 0.45
+    assert session.hedge is not None and session.hedge.hedges == 1
+    session.close()
+
+
+def test_session_hedge_inline(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"id": "vm-1"}
+    )
+
+    class Threads(Instrument):
+        def __init__(self):
+            self.names = []
+
+        def before(self, method, endpoint):
+            self.names.append(threading.current_thread().name)
+
+    threads = Threads()
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    session = Session(config, hedge=HedgePolicy(min_samples=2), instrument=threads)
+    client = virtual.Client(session)
+
+    # Requests which can't be hedged yet (no observed latencies) stay on the caller's thread
+    for _ in range(2):
+        client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+    assert threads.names == [threading.current_thread().name] * 2
+
+    # So do those the budget has no room to hedge
+    client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+    assert threads.names[-1] == threading.current_thread().name
+    session.close()
+
+
+def test_session_hedge_queued(threaded_httpserver: HTTPServer):
+    httpserver = threaded_httpserver
+
+    def handler(request):
+        time.sleep(0.15)
+        return Response('{"id": "vm-1"}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_handler(handler)
+
+    # One worker, so the second caller's original queues behind the first
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 0, "pool_maxsize": 1}, auth=None
+    )
+    session = Session(config, hedge=HedgePolicy(delay=0.25, budget=1))
+    client = virtual.Client(session)
+
+    threads = [
+        threading.Thread(
+            target=client.get_server,
+            kwargs={"id": "vm-1", "namespace": "denvr", "cluster": "Hou1"},
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Neither attempt took longer than the delay once it was running, so neither was hedged
+    assert session.hedge is not None
+    assert (session.hedge.requests, session.hedge.hedges) == (2, 0)
+    session.close()
@@ -0,0 +1,182 @@
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests import HTTPError
+
+from denvr.api.v1.servers import virtual
+from denvr.auth import Bearer
+from denvr.config import Config
+from denvr.fake import FakeAPI
+from denvr.metrics import Histogram, Instrument, Instruments, MetricsCollector, RequestEvent
+from denvr.ratelimit import RateLimiter
+from denvr.session import Session
+
+
+class Recording(Instrument):
+    def __init__(self):
+        self.calls = []
+
+    def before(self, method, endpoint):
+        self.calls.append(("before", method, endpoint))
+
+    def after(self, event):
+        self.calls.append(("after", event))
+
+
+def test_histogram_quantile():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.5))
+    assert histogram.quantile(0.5) == 0.0
+
+    for value in (0.05, 0.15, 0.15, 0.3, 0.3, 0.3, 0.3, 0.4, 0.45, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 6, 1]
+    assert histogram.count == 10
+    assert histogram.sum == pytest.approx(4.4)
+    assert histogram.quantile(0.1) == pytest.approx(0.1)
+    assert histogram.quantile(0.5) == pytest.approx(0.3)
+    # Values beyond the last bucket report its bound
+    assert histogram.quantile(0.99) == 0.5
+
+
+def test_metrics_collector():
+    metrics = MetricsCollector(buckets=(0.1, 1.0))
+    get = "/api/v1/servers/virtual/GetServers"
+    create = "/api/v1/servers/virtual/CreateServer"
+    metrics.after(RequestEvent("GET", get, 200, 0.05, attempts=3, size=100))
+    metrics.after(RequestEvent("GET", get, 503, 0.5, size=10))
+    metrics.after(RequestEvent("POST", create, 200, 2.0, size=50))
+    metrics.after(RequestEvent("POST", create, None, 0.01, error=ConnectionError()))
+    metrics.token("refresh", 0.2)
+
+    # Sorted by total time spent on each endpoint
+    slowest, fastest = metrics.summary()
+    assert (slowest["method"], slowest["endpoint"]) == ("POST", create)
+    assert slowest["count"] == 2
+    assert slowest["errors"] == 1
+    assert slowest["total"] == pytest.approx(2.01)
+    assert fastest == {
+        "method": "GET",
+        "endpoint": get,
+        "errors": 1,
+        "retries": 2,
+        "bytes": 110,
+        "count": 2,
+        "total": pytest.approx(0.55),
+        "mean": pytest.approx(0.275),
+        "p50": pytest.approx(0.1),
+        "p95": pytest.approx(0.91),
+        "p99": pytest.approx(0.982),
+    }
+
+    text = metrics.prometheus()
+    labels = f'method="GET",endpoint="{get}",status="200"'
+    assert "# TYPE denvr_request_duration_seconds histogram" in text
+    assert f'denvr_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'denvr_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"denvr_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f"denvr_request_retries_total{{{labels}}} 2" in text
+    assert f"denvr_response_bytes_total{{{labels}}} 100" in text
+    assert 'status="error"' in text
+    assert 'denvr_token_duration_seconds_bucket{kind="refresh",le="1.0"} 1' in text
+
+    metrics.reset()
+    assert metrics.summary() == []
+
+
+def test_session_instrument(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 2}, auth=None)
+    recording = Recording()
+    metrics = MetricsCollector()
+    session = Session(config, instrument=Instruments(recording, metrics))
+    client = virtual.Client(session)
+
+    # urllib3 retries the 503 before the call returns
+    httpserver.expect_oneshot_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"error": {"message": "Busy"}}, status=503
+    )
+    body = '{"result": {"items": []}}'
+    httpserver.expect_oneshot_request("/api/v1/servers/virtual/GetServers").respond_with_data(
+        body, content_type="application/json"
+    )
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"error": {"message": "Not found"}}, status=404
+    )
+
+    client.get_servers(cluster="Hou1")
+    with pytest.raises(HTTPError):
+        client.get_server(id="vm-1", namespace="denvr", cluster="Hou1")
+
+    (before, method, endpoint), (_, ok), _, (_, missing) = recording.calls
+    assert (before, method, endpoint) == ("before", "get", "/api/v1/servers/virtual/GetServers")
+    assert (ok.method, ok.endpoint, ok.status, ok.attempts) == (
+        "GET",
+        "/api/v1/servers/virtual/GetServers",
+        200,
+        2,
+    )
+    assert ok.size == len(body)
+    assert ok.elapsed > 0
+    assert ok.error is None
+    assert (missing.status, missing.attempts) == (404, 1)
+    assert isinstance(missing.error, HTTPError)
+
+    summary = {row["endpoint"]: (row["retries"], row["errors"]) for row in metrics.summary()}
+    assert summary == {
+        "/api/v1/servers/virtual/GetServers": (1, 0),
+        "/api/v1/servers/virtual/GetServer": (0, 1),
+    }
+
+
+def test_session_instrument_rate_limit(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"items": []}
+    )
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    recording = Recording()
+    session = Session(config, limiter=RateLimiter(rate=4, burst=1), instrument=recording)
+
+    start = time.monotonic()
+    for _ in range(2):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+    assert time.monotonic() - start >= 0.2
+
+    # The second request waited on the limiter, which isn't counted as the endpoint's latency
+    events = [call[1] for call in recording.calls if call[0] == "after"]
+    assert len(events) == 2
+    assert events[1].elapsed < 0.2
+
+
+def test_session_metrics_config():
+    session = Session(Config(defaults={"metrics": True}, auth=None))
+    assert isinstance(session.instrument, MetricsCollector)
+    assert Session(Config(defaults={}, auth=None)).instrument is None
+
+
+def test_session_token_metrics():
+    api = FakeAPI()
+    with api.serve() as server:
+        auth = Bearer(server.url, "alice@denvrdata.com", "secret", retries=0)
+        metrics = MetricsCollector()
+        config = Config(defaults={"server": server.url, "retries": 0}, auth=auth)
+        first = Session(config, instrument=metrics)
+        second = Session(config, instrument=metrics)
+
+        # Shared instruments are only told about each token fetch once
+        assert auth.token
+        auth._refresh_at = 0
+        assert auth.token
+
+        # Closing a Session stops its instrument receiving token events, once no other uses it
+        first.close()
+        assert auth.instruments == [metrics]
+        second.close()
+        second.close()
+        assert auth.instruments == []
+        auth._refresh_at = 0
+        assert auth.token
+        auth.close()
+
+    assert metrics.tokens["authenticate"].count == 1
+    assert metrics.tokens["refresh"].count == 1
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests.exceptions import HTTPError, Timeout
+from werkzeug import Response
+
+from denvr.config import Config
+from denvr.ratelimit import RateLimiter, TokenBucket
+from denvr.session import Session
+from denvr.utils import deadline
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=20, burst=2)
+
+    # The burst is available immediately, after which calls are paced at `rate`
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_token_bucket_pause():
+    bucket = TokenBucket(rate=1000)
+    bucket.pause(0.1)
+
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_timeout():
+    bucket = TokenBucket(rate=1)
+    bucket.acquire()
+
+    # Waits that can't finish in time fail straight away, leaving the tokens for other callers
+    start = time.monotonic()
+    with pytest.raises(Timeout):
+        bucket.acquire(timeout=0.5)
+    assert time.monotonic() - start < 0.1
+
+    bucket.adjust(20)
+    bucket.acquire(timeout=0.5)
+
+
+def test_rate_limiter_deadline():
+    limiter = RateLimiter(rate=1)
+    limiter.acquire("/api/v1/servers/virtual/GetServers")
+
+    start = time.monotonic()
+    with deadline(0.5), pytest.raises(Timeout):
+        limiter.acquire("/api/v1/servers/virtual/GetServers")
+    assert time.monotonic() - start < 0.1
+
+    # Without a deadline the limiter still waits for the next token
+    limiter.acquire("/api/v1/servers/virtual/GetServers")
+    assert time.monotonic() - start > 0.5
+
+
+def test_rate_limiter_endpoint_deadline():
+    path = "/api/v1/servers/virtual/GetServers"
+    limiter = RateLimiter(rate=1, endpoints={path: 1})
+
+    # Timing out on either budget leaves the other's token for later requests
+    limiter.acquire("/api/v1/clusters/GetAll")
+    with deadline(0.5), pytest.raises(Timeout):
+        limiter.acquire(path)
+    assert limiter._buckets[path]._tokens >= 1
+
+    limiter = RateLimiter(rate=10, endpoints={path: 1})
+    limiter.acquire(path)
+    with deadline(0.5), pytest.raises(Timeout):
+        limiter.acquire(path)
+    assert limiter._bucket._tokens >= 9
+
+
+def test_rate_limiter_aimd():
+    limiter = RateLimiter(rate=10, endpoints={"/api/v1/servers/virtual/GetServers": 4})
+
+    limiter.feedback("/api/v1/servers/virtual/GetServers", 429)
+    assert limiter.rate == 5
+    assert limiter._buckets["/api/v1/servers/virtual/GetServers"].rate == 2
+    assert limiter.throttled == 1
+
+    # Throttled retries urllib3 already made count towards the decrease
+    limiter.feedback("/api/v1/clusters/GetAll", 200, retries=2)
+    assert limiter.rate == 1.25
+    assert limiter._buckets["/api/v1/servers/virtual/GetServers"].rate == 2
+
+    # Successes add the rate back, up to the configured maximum
+    for _ in range(100):
+        limiter.feedback("/api/v1/servers/virtual/GetServers", 200)
+    assert limiter.rate == 10
+    assert limiter._buckets["/api/v1/servers/virtual/GetServers"].rate == 4
+
+
+def test_rate_limiter_min_rate():
+    limiter = RateLimiter(rate=1, min_rate=0.5)
+    limiter.feedback("/api/v1/clusters/GetAll", 503, retries=10)
+    assert limiter.rate == 0.5
+
+
+def test_session_rate_limit(httpserver: HTTPServer):
+    calls = []
+
+    def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return Response(status=429, headers={"Retry-After": "1"})
+        return Response('{"items": []}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 0, "rate_limit": 100}, auth=None
+    )
+    session = Session(config)
+    assert session.limiter is not None
+
+    with pytest.raises(HTTPError):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+
+    assert session.limiter.throttled == 1
+    assert session.limiter.rate == 50
+
+    # The next request waits out the Retry-After
+    assert session.request("get", "/api/v1/servers/virtual/GetServers") == {"items": []}
+    assert calls[1] - calls[0] >= 0.9
@@ -0,0 +1,358 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests.exceptions import HTTPError, RequestException, Timeout
+from werkzeug import Response
+
+from denvr.auth import Bearer
+from denvr.config import Config
+from denvr.ratelimit import RateLimiter
+from denvr.session import AsyncSession, Session, invalidate, shared_session
+from tests.utils import temp_env
+
+
+def test_shared_session_invalidate():
+    with temp_env():
+        os.environ["DENVR_CONFIG"] = os.path.join(os.getcwd(), "missing", "config.toml")
+        os.environ["DENVR_APIKEY"] = "foo.bar.baz"
+
+        session = shared_session()
+        assert shared_session() is session
+
+        invalidate(os.path.join(os.getcwd(), "missing", "other.toml"))
+        assert shared_session() is session
+
+        invalidate()
+        assert shared_session() is not session
+        invalidate()
+
+
+def test_shared_session_config_changes():
+    with tempfile.TemporaryDirectory() as tmpdir, temp_env():
+        path = os.path.join(tmpdir, "config.toml")
+        os.environ["DENVR_APIKEY"] = "foo.bar.baz"
+
+        def write(content, mtime):
+            with open(path, "w") as fobj:
+                fobj.write(content)
+            os.utime(path, (mtime, mtime))
+
+        write("[defaults]\nretries = 3\n", 1000)
+        session = shared_session(path)
+        assert shared_session(path) is session
+
+        # Any setting used to build the session gets a new one, not just the server or credentials
+        write("[defaults]\nretries = 5\n", 2000)
+        updated = shared_session(path)
+        assert updated is not session
+        assert updated.config.retries == 5
+
+        # Whereas rewriting the same settings doesn't
+        write("[defaults]\nretries = 5\n", 3000)
+        assert shared_session(path) is updated
+        invalidate(path)
+
+
+def test_shared_session_invalidate_auth():
+    with temp_env():
+        os.environ["DENVR_CONFIG"] = os.path.join(os.getcwd(), "missing", "config.toml")
+        os.environ["DENVR_USERNAME"] = "alice@denvrdata.com"
+        os.environ["DENVR_PASSWORD"] = "secret"
+
+        session = shared_session()
+        auth = session.config.auth
+        assert isinstance(auth, Bearer)
+        assert not auth._stop.is_set()
+
+        # Invalidating also stops the auth's background refresher
+        invalidate()
+        assert auth._stop.is_set()
+
+
+def test_async_session_gather(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"result": {"Status": "ONLINE"}}
+    )
+
+    async def main():
+        async with AsyncSession(config, max_connections=4) as session:
+            return await asyncio.gather(
+                *[
+                    session.request("get", "/api/v1/servers/virtual/GetServer")
+                    for _ in range(20)
+                ]
+            )
+
+    assert asyncio.run(main()) == [{"status": "ONLINE"}] * 20
+    assert len(httpserver.log) == 20
+
+
+def test_async_session_options():
+    config = Config(defaults={"pool_maxsize": 3}, auth=None)
+    limiter = RateLimiter(rate=5)
+    session = AsyncSession(config, coalesce=True, limiter=limiter)
+
+    # Sized from the config like `Session`, with the other options passed through to it
+    assert session._executor._max_workers == 3
+    assert session.session.adapter.pool_maxsize == 3
+    assert session.session.coalesce
+    assert session.session.limiter is limiter
+    session.close()
+
+
+def test_session_coalesce(httpserver: HTTPServer):
+    def handler(request):
+        # Hold the request open long enough for the other threads to pile up
+        time.sleep(0.2)
+        return Response('{"items": [{"id": "vm-1"}]}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+    httpserver.expect_request("/api/v1/servers/virtual/StartServer").respond_with_json({})
+
+    config = Config(defaults={"server": httpserver.url_for("/"), "coalesce": True}, auth=None)
+    session = Session(config)
+    assert session.coalesce
+
+    def get_servers(_):
+        return session.request(
+            "get", "/api/v1/servers/virtual/GetServers", params={"Cluster": "Hou1"}
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(get_servers, range(8)))
+
+    assert len(httpserver.log) == 1
+    assert results == [{"items": [{"id": "vm-1"}]}] * 8
+
+    # Results are independent copies
+    assert len({id(r["items"]) for r in results}) == 8
+
+    # Non-idempotent requests are never coalesced
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda _: session.request(
+                    "post", "/api/v1/servers/virtual/StartServer", json={}
+                ),
+                range(4),
+            )
+        )
+    assert len(httpserver.log) == 5
+
+
+def test_session_coalesce_errors(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"error": {"message": "Nope"}}, status=400
+    )
+
+    session = Session(
+        Config(defaults={"server": httpserver.url_for("/")}, auth=None), coalesce=True
+    )
+    with pytest.raises(HTTPError, match="Nope"):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+
+    # Failed flights are cleared, so later requests are retried
+    assert session._flights == {}
+
+
+def test_session_coalesce_leader_error():
+    class Aborted(BaseException):
+        pass
+
+    session = Session(Config(defaults={}, auth=None), coalesce=True)
+    calls = []
+
+    def fetch(method, path, url, **kwargs):
+        calls.append(path)
+        # Hold the flight open long enough for the followers to join
+        time.sleep(0.2)
+        raise Aborted()
+
+    session._fetch = fetch  # type: ignore[method-assign]
+
+    def get_servers(_):
+        try:
+            session.request("get", "/api/v1/servers/virtual/GetServers")
+        except Aborted as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        errors = list(pool.map(get_servers, range(4)))
+
+    # Even errors which aren't `Exception`s reach every caller sharing the flight
+    assert len(calls) == 1
+    assert all(isinstance(e, Aborted) for e in errors)
+    assert len({id(e) for e in errors}) == 1
+    assert session._flights == {}
+
+
+def test_session_coalesce_deadline():
+    session = Session(Config(defaults={}, auth=None), coalesce=True)
+    release = threading.Event()
+
+    def fetch(method, path, url, **kwargs):
+        release.wait(5)
+        return {"items": []}
+
+    session._fetch = fetch  # type: ignore[method-assign]
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(session.request, "get", "/api/v1/servers/virtual/GetServers")
+        while not session._flights:
+            time.sleep(0.01)
+
+        # Followers give up at their own deadline rather than the leader's
+        start = time.monotonic()
+        with pytest.raises(Timeout, match="in-flight"):
+            session.request("get", "/api/v1/servers/virtual/GetServers", deadline=0.2)
+        assert time.monotonic() - start < 1
+
+        release.set()
+        assert leader.result() == {"items": []}
+
+    assert session._flights == {}
+
+
+def test_session_pool(httpserver: HTTPServer):
+    def handler(request):
+        time.sleep(0.1)
+        return Response('{"items": []}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+
+    # Pool settings are applied even without retries
+    config = Config(
+        defaults={
+            "server": httpserver.url_for("/"),
+            "retries": 0,
+            "pool_maxsize": 4,
+            "pool_block": True,
+            "keepalive": 30,
+        },
+        auth=None,
+    )
+    session = Session(config)
+    assert session.session.get_adapter(config.server) is session.adapter
+    assert session.adapter.pool_maxsize == 4
+    assert session.adapter.pool_block
+    assert session.adapter.max_retries.total == 0
+
+    def get_servers(_):
+        return session.request("get", "/api/v1/servers/virtual/GetServers")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(get_servers, range(8))) == [{"items": []}] * 8
+
+    assert session.adapter.requests == 8
+    assert session.adapter.active == 0
+    assert session.adapter.peak > 4
+    assert session.adapter.saturated > 0
+
+    # Blocking on the pool means no more than `pool_maxsize` connections are ever opened
+    assert session.adapter.connections <= 4
+
+
+def test_session_timeouts(httpserver: HTTPServer):
+    def handler(request):
+        time.sleep(0.5)
+        return Response('{"items": []}', content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+
+    config = Config(
+        defaults={
+            "server": httpserver.url_for("/"),
+            "retries": 0,
+            "timeouts": {"/api/v1/servers/virtual/GetServers": 0.1},
+        },
+        auth=None,
+    )
+    session = Session(config)
+    with pytest.raises(Timeout):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+
+    # Explicit timeouts take precedence
+    result = session.request("get", "/api/v1/servers/virtual/GetServers", timeout=5)
+    assert result == {"items": []}
+
+
+def test_session_deadline(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_data(
+        "", status=503
+    )
+
+    def handler(request):
+        time.sleep(0.5)
+        return Response("{}", content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_handler(handler)
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 5, "deadline": 1}, auth=None
+    )
+    session = Session(config)
+
+    # Retries stop once the next backoff would exceed the deadline, returning the last response
+    start = time.monotonic()
+    with pytest.raises(HTTPError):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+    assert time.monotonic() - start < 1
+    assert len(httpserver.log) == 2
+
+    # Each attempt's timeout is also capped by the remaining time
+    start = time.monotonic()
+    with pytest.raises(RequestException):
+        session.request("get", "/api/v1/servers/virtual/GetServer", deadline=0.2)
+    assert time.monotonic() - start < 1
+
+
+def test_session_deadline_slow_retries(httpserver: HTTPServer):
+    def handler(request):
+        time.sleep(0.8)
+        return Response("{}", status=500, content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "retries": 3, "deadline": 1}, auth=None
+    )
+    session = Session(config)
+
+    # The retry only gets the time left before the deadline, rather than the whole read timeout
+    start = time.monotonic()
+    with pytest.raises(RequestException):
+        session.request("get", "/api/v1/servers/virtual/GetServers")
+    assert time.monotonic() - start < 1.2
+
+
+def test_session_normalize_nested(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"result": {"items": [{"privateIp": "10.0.0.1"}]}}
+    )
+
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    assert Session(config).request("get", "/api/v1/servers/virtual/GetServers") == {
+        "items": [{"privateIp": "10.0.0.1"}]
+    }
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "normalize_nested": True}, auth=None
+    )
+    assert Session(config).request("get", "/api/v1/servers/virtual/GetServers") == {
+        "items": [{"private_ip": "10.0.0.1"}]
+    }
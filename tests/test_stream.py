@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from denvr.config import Config
+from denvr.session import AsyncSession, Session
+from denvr.stream import ItemParser
+from denvr.views import ResponseView
+
+ITEMS = [
+    {"id": "vm-1", "name": 'quoted "]}" name', "tags": ["a", "[b]"], "gpu": {"count": 8}},
+    {"id": "vm-2", "name": 'escaped \\" and \\\\', "tags": [], "gpu": None},
+    1.5,
+    True,
+    None,
+    "text",
+    [[1, 2], {"items": [3]}],
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+def test_item_parser_chunks(size):
+    # Keys before `items` may contain nested arrays and even an `items` string value
+    content = json.dumps(
+        {"result": {"meta": {"tags": ["items"], "items": "no"}, "items": ITEMS, "total": 7}}
+    ).encode()
+    parser = ItemParser()
+    result = []
+    for i in range(0, len(content), size):
+        result.extend(parser.feed(content[i : i + size]))
+
+    assert parser.found
+    assert parser.done
+    assert result == ITEMS
+    assert parser.feed(b"[1]") == []
+
+
+def test_item_parser_missing():
+    parser = ItemParser()
+    assert parser.feed(b'{"result": {"count": [1, 2]}}') == []
+    assert not parser.found
+    assert parser.done
+
+    parser = ItemParser("servers")
+    assert parser.feed(b'{"items": [1], "servers" : [ ]}') == []
+    assert parser.found
+    assert parser.done
+
+
+def test_item_parser_invalid():
+    parser = ItemParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(b'{"items": [{"id": nope}]}')
+
+
+def test_session_iter_items(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    session = Session(config)
+
+    items = [{"id": f"vm-{i}", "privateIp": f"10.0.0.{i}"} for i in range(100)]
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"result": {"items": items}}
+    )
+    result = list(session.iter_items("get", "/api/v1/servers/virtual/GetServers"))
+    assert result == [{"id": f"vm-{i}", "private_ip": f"10.0.0.{i}"} for i in range(100)]
+
+    # Errors are raised before any items are yielded
+    httpserver.clear()
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"error": {"message": "Nope"}}, status=500
+    )
+    with pytest.raises(Exception, match="Nope"):
+        next(session.iter_items("get", "/api/v1/servers/virtual/GetServers"))
+
+
+def test_session_iter_items_partial(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    session = Session(config)
+
+    # Items are yielded as each chunk arrives, before the response body is complete
+    def handler(request):
+        def body():
+            yield b'{"result": {"items": [{"id": "vm-1"},'
+            yield b'{"id": "vm-2"}]}}'
+
+        return Response(body(), content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        handler
+    )
+    items = session.iter_items("get", "/api/v1/servers/virtual/GetServers")
+    assert next(items) == {"id": "vm-1"}
+    assert list(items) == [{"id": "vm-2"}]
+
+
+def test_session_iter_items_views(httpserver: HTTPServer):
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "response_views": True}, auth=None
+    )
+    session = Session(config)
+
+    httpserver.expect_request("/api/v1/servers/metal/GetHosts").respond_with_json(
+        {"result": {"items": [{"id": "host-1", "gpuType": {"vendorName": "nvidia"}}]}}
+    )
+    (item,) = session.iter_items("get", "/api/v1/servers/metal/GetHosts")
+    assert isinstance(item, ResponseView)
+    assert item["gpu_type"]["vendor_name"] == "nvidia"
+
+
+def test_async_session_iter_items(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    session = AsyncSession(config)
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"result": {"items": [{"id": "vm-1"}, {"id": "vm-2"}, {"id": "vm-3"}]}}
+    )
+
+    async def first():
+        # Stopping early closes the underlying response
+        async for item in session.iter_items("get", "/api/v1/servers/virtual/GetServers"):
+            return item
+
+    assert asyncio.run(first()) == {"id": "vm-1"}
+    session.close()
@@ -1,9 +1,21 @@
+import time
+
 from unittest.mock import MagicMock
 
 import pytest
-from requests.exceptions import HTTPError, JSONDecodeError
+from requests import Response
+from requests.exceptions import HTTPError
 
-from denvr.utils import raise_for_status
+from denvr.utils import (
+    deadline,
+    deadline_at,
+    expiry,
+    normalize,
+    raise_for_status,
+    remaining,
+    retry_after,
+    snakecase,
+)
 
 
 def test_raise_for_status_pass():
@@ -32,24 +44,123 @@ def test_raise_for_status_error():
 
 
 def test_raise_for_status_error_with_details():
-    response = MagicMock()
-    response.status_code = 404
-    response.url = "http://localhost:9000"
-    response.reason = "Not Found"
-    response.json = lambda: {
-        "error": {"message": "These are not the droids you're looking for."}
-    }
+    def response(content: bytes):
+        resp = MagicMock(spec=Response)
+        resp.status_code = 404
+        resp.url = "http://localhost:9000"
+        resp.reason = "Not Found"
+        resp.content = content
+        return resp
+
     with pytest.raises(HTTPError, match="droids"):
-        raise_for_status(response)
+        raise_for_status(
+            response(b'{"error": {"message": "These are not the droids you\'re looking for."}}')
+        )
 
     # Handle fallback cases for no json or unknown schema
     # TODO: Use caplog for these cases.
     # https://docs.pytest.org/en/latest/how-to/logging.html#caplog-fixture
-    response.json = lambda: {"err": "These are not the droids you're looking for."}
     with pytest.raises(HTTPError):
-        raise_for_status(response)
+        raise_for_status(response(b'{"err": "These are not the droids you\'re looking for."}'))
 
-    # A bit of a hack cause we can't raise an exception from a lambda function
-    response.json = lambda: (_ for _ in ()).throw(JSONDecodeError("err", "", 0))
     with pytest.raises(HTTPError):
-        raise_for_status(response)
+        raise_for_status(response(b"<html>Not Found</html>"))
+
+
+def test_retry_after():
+    response = MagicMock()
+    response.headers = {}
+    assert retry_after(response) is None
+
+    response.headers = {"Retry-After": "5"}
+    assert retry_after(response) == 5
+
+    # Dates in the past mean we can retry immediately
+    response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert retry_after(response) == 0
+
+    response.headers = {"Retry-After": "soon"}
+    assert retry_after(response) is None
+
+
+def test_deadline():
+    def left():
+        seconds = remaining()
+        assert seconds is not None
+        return seconds
+
+    assert remaining() is None
+    with deadline(10):
+        assert 9 < left() <= 10
+
+        # Nested deadlines can only shorten the outer one
+        with deadline(0.5):
+            assert left() <= 0.5
+        with deadline(60):
+            assert left() <= 10
+        with deadline(None):
+            assert left() <= 10
+
+        time.sleep(0.1)
+        assert left() < 9.95
+
+        # An absolute expiry carries a deadline over without extending it, even once it's spent
+        expires = expiry()
+        with deadline_at(expires):
+            assert left() < 9.95
+        with deadline_at(time.monotonic() - 1):
+            assert left() == 0.0
+
+    assert remaining() is None
+
+
+def test_snakecase():
+    snakecase.cache_clear()
+    assert snakecase("privateIp") == "private_ip"
+    assert snakecase("TenancyName") == "tenancy_name"
+    assert snakecase("status") == "status"
+    assert snakecase("privateIp") == "private_ip"
+    assert snakecase.cache_info().hits == 1
+
+
+def test_normalize():
+    content = {
+        "items": [{"privateIp": "10.0.0.1", "gpuType": {"vendorName": "nvidia"}}],
+        "totalCount": 1,
+    }
+
+    # Only the top level by default
+    assert normalize(content) == {
+        "items": [{"privateIp": "10.0.0.1", "gpuType": {"vendorName": "nvidia"}}],
+        "total_count": 1,
+    }
+    assert normalize(content, nested=True) == {
+        "items": [{"private_ip": "10.0.0.1", "gpu_type": {"vendor_name": "nvidia"}}],
+        "total_count": 1,
+    }
+    assert normalize([{"privateIp": "10.0.0.1"}, 1], nested=True) == [
+        {"private_ip": "10.0.0.1"},
+        1,
+    ]
+    assert normalize("ONLINE", nested=True) == "ONLINE"
+
+    # User data keys (e.g., environment variable names) aren't API keys, so are left alone
+    app = {"environmentVariables": {"HF_TOKEN": "hf_abc"}, "labels": {"teamName": "ml"}}
+    assert normalize(app, nested=True) == {
+        "environment_variables": {"HF_TOKEN": "hf_abc"},
+        "labels": {"teamName": "ml"},
+    }
+
+    # The input isn't modified
+    assert content["totalCount"] == 1
+
+    # Deep structures don't hit the recursion limit
+    deep: dict = {}
+    node = deep
+    for _ in range(5000):
+        node["childNode"] = {}
+        node = node["childNode"]
+    result = normalize(deep, nested=True)
+    for _ in range(5000):
+        result = result["child_node"]
+    assert result == {}
@@ -0,0 +1,78 @@
+import pytest
+
+from denvr.api.v1 import clusters
+from denvr.api.v1.servers import applications, images, metal, virtual
+from denvr.config import Config
+from denvr.validate import RequestSpec, validate_kwargs
+
+SPECS = [
+    spec
+    for module in (clusters, applications, images, metal, virtual)
+    for spec in vars(module).values()
+    if isinstance(spec, RequestSpec)
+]
+
+
+def legacy(spec, config, *values):
+    # The `config.getkwarg` + `validate_kwargs` code the generated builders replace
+    fields = [("params", *f) for f in spec.params] + [("json", *f) for f in spec.json]
+    parameters: dict = {location: {} for location, _, _ in fields}
+    for (location, name, kwarg), value in zip(fields, values):
+        parameters[location][name] = config.getkwarg(kwarg, value)
+    return validate_kwargs(spec.method, spec.path, parameters, spec.required)
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=repr)
+def test_request_spec_build(spec):
+    config = Config(defaults={"cluster": "Hou1", "rpool": "on-demand"}, auth=None)
+    fields = len(spec.params) + len(spec.json)
+
+    # Every value given, a mix of given and missing ones, and booleans (converted for params)
+    cases: list[list] = [
+        [f"v{i}" for i in range(fields)],
+        [f"v{i}" if i % 2 else None for i in range(fields)],
+        [True if i % 2 else f"v{i}" for i in range(fields)],
+    ]
+    for values in cases:
+        try:
+            expected = legacy(spec, config, *values)
+        except TypeError as e:
+            with pytest.raises(TypeError, match=str(e)):
+                spec.build(config, *values)
+        else:
+            assert spec.build(config, *values) == expected
+
+
+def test_request_spec_required():
+    # Missing values are filled from the config defaults (e.g., `cluster`) before erroring
+    config = Config(defaults={}, auth=None)
+    with pytest.raises(TypeError, match=r"^Required params parameter Id is missing"):
+        virtual.GET_SERVER.build(config, None, "denvr", "Hou1")
+
+    assert virtual.GET_SERVER.build(config, "vm-1", "denvr", None) == {
+        "params": {"Id": "vm-1", "Namespace": "denvr", "Cluster": "Msc1"}
+    }
+
+
+def test_request_spec_instance_defaults():
+    class Defaults(Config):
+        @property
+        def namespace(self):
+            return "denvr"
+
+    # Defaults are looked up on the config itself, including subclasses and instance attributes
+    config = Defaults(defaults={"cluster": "Hou1"}, auth=None)
+    config.id = "vm-1"  # type: ignore[attr-defined]
+    assert virtual.GET_SERVER.build(config, None, None, None) == {
+        "params": {"Id": "vm-1", "Namespace": "denvr", "Cluster": "Hou1"}
+    }
+
+
+def test_request_spec_empty():
+    spec = virtual.GET_CONFIGURATIONS
+    assert spec.build(Config(defaults={}, auth=None)) == {}
+    assert spec.required == frozenset()
+    assert repr(spec) == "RequestSpec('get', '/api/v1/servers/virtual/GetConfigurations')"
+
+    # Tracebacks point at the generated builder rather than `<string>`
+    assert spec.build.__code__.co_filename == virtual.__file__
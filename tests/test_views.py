@@ -0,0 +1,102 @@
+import copy
+import json
+import pickle
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from denvr.config import Config
+from denvr.session import Session
+from denvr.views import ResponseList, ResponseView, view
+
+CONTENT = {
+    "items": [{"id": "vm-1", "privateIp": "10.0.0.1", "gpuType": {"vendorName": "nvidia"}}],
+    "totalCount": 1,
+}
+EXPECTED = {
+    "items": [{"id": "vm-1", "private_ip": "10.0.0.1", "gpu_type": {"vendor_name": "nvidia"}}],
+    "total_count": 1,
+}
+
+
+def test_view_access():
+    result = view(CONTENT)
+    assert isinstance(result, dict)
+    assert isinstance(result["items"], ResponseList)
+    assert isinstance(result["items"][0], ResponseView)
+    assert result["items"][0]["id"] == "vm-1"
+    assert result["items"][0]["gpu_type"]["vendor_name"] == "nvidia"
+    assert result["total_count"] == 1
+    assert result.get("totalCount") is None
+    assert "total_count" in result
+    assert "totalCount" not in result
+    assert list(result) == ["items", "total_count"]
+    assert len(result) == 2
+
+    # Nested views are only created once
+    assert result["items"] is result["items"]
+
+
+def test_view_user_keys():
+    content = {"environmentVariables": {"HF_TOKEN": "hf_abc"}, "labels": {"teamName": "ml"}}
+    expected = {"environment_variables": {"HF_TOKEN": "hf_abc"}, "labels": {"teamName": "ml"}}
+    result = view(content)
+    assert result["environment_variables"]["HF_TOKEN"] == "hf_abc"
+    assert result["labels"]["teamName"] == "ml"
+    assert result == expected
+    assert result.to_dict() == expected
+    assert json.loads(json.dumps(result)) == expected
+
+    # Deep copies don't share the user data with the response
+    assert result.to_dict()["labels"] is not content["labels"]
+
+
+def test_view_compat():
+    result = view(CONTENT)
+    assert result == EXPECTED
+    assert EXPECTED == result
+    assert dict(result) == EXPECTED
+    assert {**result} == EXPECTED
+    assert result.copy() == EXPECTED
+    assert type(result.copy()) is dict
+    assert result.to_dict() == EXPECTED
+    assert json.loads(json.dumps(result)) == EXPECTED
+    assert copy.deepcopy(result) == EXPECTED
+    assert pickle.loads(pickle.dumps(result)) == EXPECTED
+    assert repr(result) == repr(EXPECTED)
+
+    # The original content isn't modified
+    assert "totalCount" in CONTENT
+
+
+def test_view_mutation():
+    result = view(CONTENT)
+    result["total_count"] = 2
+    result["next_page"] = None
+    result.update(status="ONLINE")
+    assert result.setdefault("status", "OFFLINE") == "ONLINE"
+    assert result.pop("next_page") is None
+    assert result.pop("next_page", "missing") == "missing"
+    del result["items"]
+    assert result == {"total_count": 2, "status": "ONLINE"}
+
+    with pytest.raises(KeyError):
+        del result["items"]
+
+    assert result.popitem() == ("status", "ONLINE")
+    result.clear()
+    assert result == {}
+    assert "totalCount" in CONTENT
+
+
+def test_session_response_views(httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_json(
+        {"result": CONTENT}
+    )
+
+    config = Config(
+        defaults={"server": httpserver.url_for("/"), "response_views": True}, auth=None
+    )
+    result = Session(config).request("get", "/api/v1/servers/virtual/GetServers")
+    assert isinstance(result, ResponseView)
+    assert result == EXPECTED
@@ -1,11 +1,18 @@
+import asyncio
+import itertools
+import json
+import time
 import pytest
 
+from unittest.mock import Mock, patch
 from pytest_httpserver import HTTPServer
+from requests.exceptions import HTTPError
+from werkzeug import Response
 from denvr.config import Config
-from denvr.session import Session
+from denvr.session import AsyncSession, Session
 from denvr.api.v1.servers import applications, virtual
-from typing import Any, Dict
-from denvr.waiters import waiter, Waiter
+from typing import Any, Dict, List
+from denvr.waiters import awaiter, waiter, AsyncWaiter, Backoff, Waiter, WaitGroup
 
 
 def test_waiter_timeout():
@@ -138,3 +145,239 @@ def test_app_stop_application(httpserver: HTTPServer):
     stop_application = waiter(client.stop_application)
     result = stop_application(interval=0.01, **kwargs)
     assert result["instance_details"]["status"] == "OFFLINE"
+
+
+def test_vm_wait_group(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    client = virtual.Client(Session(config))
+
+    # Each cluster's list call reports its servers as PENDING first and then ONLINE
+    ticks: Dict[str, int] = {"Hou1": 0, "Msc1": 0}
+
+    def get_servers(request):
+        cluster = request.args["Cluster"]
+        status = "ONLINE" if ticks[cluster] else "PENDING"
+        ticks[cluster] += 1
+        ids = ["vm-1", "vm-2"] if cluster == "Hou1" else ["vm-3"]
+        items = [{"id": i, "namespace": "denvr", "status": status} for i in ids]
+        return Response(json.dumps({"items": items}), content_type="application/json")
+
+    httpserver.expect_request("/api/v1/servers/virtual/GetServers").respond_with_handler(
+        get_servers
+    )
+    # vm-4 isn't in the list yet, so it should be fetched directly
+    httpserver.expect_request(
+        "/api/v1/servers/virtual/GetServer",
+        query_string={"Id": "vm-4", "Namespace": "denvr", "Cluster": "Msc1"},
+    ).respond_with_json({"id": "vm-4", "namespace": "denvr", "status": "ONLINE"})
+
+    group = WaitGroup(client, status="ONLINE")
+    for i, cluster in [(1, "Hou1"), (2, "Hou1"), (3, "Msc1"), (4, "Msc1")]:
+        group.add({"id": f"vm-{i}", "namespace": "denvr", "cluster": cluster})
+
+    results = group.wait(interval=0.01, timeout=1)
+    assert [r["id"] for r in results] == ["vm-1", "vm-2", "vm-3", "vm-4"]
+    assert all(r["status"] == "ONLINE" for r in results)
+
+    # 2 ticks of 1 list call per cluster plus the single fallback request
+    assert ticks == {"Hou1": 2, "Msc1": 2}
+    assert len(httpserver.log) == 5
+
+
+def test_app_wait_group(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    client = applications.Client(Session(config))
+
+    httpserver.expect_ordered_request(
+        "/api/v1/servers/applications/GetApplications"
+    ).respond_with_json({"items": [{"id": "app-1", "cluster": "Hou1", "status": "PENDING"}]})
+    httpserver.expect_ordered_request(
+        "/api/v1/servers/applications/GetApplications"
+    ).respond_with_json({"items": [{"id": "app-1", "cluster": "Hou1", "status": "OFFLINE"}]})
+
+    # Once the list reports the status, the details are fetched to match `get_application_details`
+    details = {"instanceDetails": {"id": "app-1", "cluster": "Hou1", "status": "OFFLINE"}}
+    httpserver.expect_ordered_request(
+        "/api/v1/servers/applications/GetApplicationDetails",
+        query_string={"Id": "app-1", "Cluster": "Hou1"},
+    ).respond_with_json(details)
+
+    group = WaitGroup(client, status="OFFLINE")
+    group.add({"id": "app-1", "cluster": "Hou1"})
+    results = group.wait(interval=0.01, timeout=1)
+    assert results == [{"instance_details": details["instanceDetails"]}]
+
+
+def test_wait_group_timeout():
+    with pytest.raises(ValueError, match="Unsupported client"):
+        WaitGroup(object())
+
+    client = Mock(__module__="denvr.api.v1.servers.virtual")
+    client.session.retry_after.return_value = None
+    client.get_servers.return_value = {"items": []}
+    client.get_server.return_value = {"status": "PENDING"}
+
+    group = WaitGroup(client)
+    group.add({"id": "vm-1", "namespace": "denvr", "cluster": "Hou1"})
+    with pytest.raises(TimeoutError):
+        group.wait(interval=0.01, timeout=0.05)
+
+
+def test_backoff():
+    delays = list(itertools.islice(Backoff(initial=1, factor=2, maximum=5, jitter=False), 5))
+    assert delays == [1, 2, 4, 5, 5]
+
+    for n, delay in enumerate(itertools.islice(Backoff(initial=1, maximum=5), 100)):
+        assert 0 <= delay <= min(5, 2**n)
+
+
+def test_waiter_deadline():
+    # Sleeps should be clamped to the deadline rather than overshooting by a full interval
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        Waiter(action=lambda: None, check=lambda x: (False, x)).wait(
+            None, interval=10, timeout=0.1
+        )
+    assert time.monotonic() - start < 1
+
+    # Finite schedules repeat their last delay
+    sleeps: List[float] = []
+    results = iter([(False, 1), (False, 2), (False, 3), (True, 4)])
+    waiter = Waiter(action=lambda: None, check=lambda x: next(results))
+    with patch("time.sleep", sleeps.append):
+        assert waiter.wait(None, interval=[0.01, 0.02], timeout=1) == 4
+    assert sleeps == [0.01, 0.02, 0.02]
+
+
+def test_waiter_hint():
+    sleeps: List[float] = []
+    results = iter([(False, 1), (False, 2), (True, 3)])
+    waiter = Waiter(action=lambda: None, check=lambda x: next(results), hint=lambda: 0.05)
+
+    with patch("time.sleep", sleeps.append):
+        assert waiter.wait(None, interval=0.01, timeout=1) == 3
+
+    # The server hint is a lower bound on each sleep
+    assert sleeps == [0.05, 0.05]
+
+
+def test_vm_retry_after(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/"), "retries": 0}, auth=None)
+    session = Session(config)
+    client = virtual.Client(session)
+
+    kwargs: Dict[str, Any] = {"id": "vm-1", "namespace": "denvr", "cluster": "Hou1"}
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/StartServer").respond_with_json(
+        kwargs
+    )
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"error": {"message": "Too many requests"}}, status=429, headers={"Retry-After": "2"}
+    )
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"status": "ONLINE"}
+    )
+
+    start_server = waiter(client.start_server)
+    assert start_server.hint == session.retry_after
+
+    # The throttled poll sleeps for the Retry-After rather than failing the wait
+    sleeps: List[float] = []
+    with patch("denvr.waiters.time.sleep", sleeps.append):
+        assert start_server(interval=0.01, **kwargs)["status"] == "ONLINE"
+    assert sleeps == [2]
+    assert session.retry_after() is None
+
+    # Still clamped to the deadline
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"error": {"message": "Too many requests"}}, status=429, headers={"Retry-After": "2"}
+    )
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        start_server.wait(kwargs, interval=0.01, timeout=0.2)
+    assert time.monotonic() - start < 1
+
+    # Other errors still fail the wait
+    httpserver.clear_all_handlers()
+    httpserver.expect_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"error": {"message": "Not found"}}, status=404
+    )
+    with pytest.raises(HTTPError, match="Not found"):
+        start_server.wait(kwargs, interval=0.01, timeout=1)
+
+
+def test_async_vm_start_server(httpserver: HTTPServer):
+    config = Config(defaults={"server": httpserver.url_for("/")}, auth=None)
+    session = AsyncSession(config)
+    client = virtual.AsyncClient(session)
+
+    kwargs: Dict[str, Any] = {"id": "vm-1", "namespace": "denvr", "cluster": "Hou1"}
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/StartServer").respond_with_json(
+        kwargs
+    )
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"status": "PENDING"}
+    )
+    httpserver.expect_ordered_request("/api/v1/servers/virtual/GetServer").respond_with_json(
+        {"status": "ONLINE"}
+    )
+
+    start_server = awaiter(client.start_server)
+    result = asyncio.run(start_server(interval=0.01, **kwargs))
+    assert result["status"] == "ONLINE"
+    session.close()
+
+    with pytest.raises(ValueError, match="Unsupported operation:"):
+        awaiter(client.get_server)
+
+    # Sync clients should use `waiter` instead
+    with pytest.raises(ValueError, match="Unsupported operation:"):
+        awaiter(virtual.Client(Session(config)).start_server)
+
+
+def test_async_waiter_many():
+    # Many concurrent waiters should share the event loop without a thread each
+    calls: Dict[str, int] = {}
+
+    async def action(id):
+        return {"id": id}
+
+    async def check(resp):
+        calls[resp["id"]] = calls.get(resp["id"], 0) + 1
+        return calls[resp["id"]] > 2, resp["id"]
+
+    async def main():
+        waiter = AsyncWaiter(action=action, check=check)
+        return await asyncio.gather(
+            *[waiter(interval=0.01, timeout=5, id=f"vm-{i}") for i in range(1000)]
+        )
+
+    assert asyncio.run(main()) == [f"vm-{i}" for i in range(1000)]
+
+
+def test_async_waiter_cleanup():
+    log = []
+
+    async def action():
+        return "Failed Action"
+
+    async def check(resp):
+        return False, resp
+
+    async def cleanup(resp):
+        log.append(resp)
+
+    waiter = AsyncWaiter(action=action, check=check, cleanup=cleanup)
+    with pytest.raises(TimeoutError):
+        asyncio.run(waiter(interval=0.01, timeout=0.05))
+    assert log == ["Failed Action"]
+
+    # Cancelling the wait should also run the cleanup
+    async def cancelled():
+        task = asyncio.ensure_future(waiter(interval=0.01, timeout=5))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled())
+    assert log == ["Failed Action", "Failed Action"]